@@ -0,0 +1,9 @@
+-- Persist rendered markdown next to each document row so reads can skip rendering.
+-- NULL means "not rendered yet" (rows written before this migration); readers fall back to rendering.
+
+ALTER TABLE technical_specs ADD COLUMN rendered_markdown TEXT;
+ALTER TABLE roadmaps ADD COLUMN rendered_markdown TEXT;
+ALTER TABLE project_plans ADD COLUMN rendered_markdown TEXT;
+
+-- Record migration
+INSERT INTO schema_migrations (version, description) VALUES (5, 'Store rendered markdown alongside specs, roadmaps and project plans');
@@ -0,0 +1,5 @@
+-- Keyset pagination for list_active_loops: WHERE project_name = ? ORDER BY created_at, id
+CREATE INDEX idx_loop_states_project_created ON loop_states(project_name, created_at, id);
+
+-- Record migration
+INSERT INTO schema_migrations (version, description) VALUES (6, 'Add project/creation-order index for paginated loop listing');
@@ -0,0 +1,25 @@
+-- Append-only critic feedback, one row per entry, replacing the loop_states.feedback_history JSONB array.
+-- Reads can then load only the newest entries instead of deserializing the whole history.
+
+CREATE TABLE loop_feedback (
+    id BIGSERIAL PRIMARY KEY,
+    loop_id VARCHAR(8) NOT NULL REFERENCES loop_states(id) ON DELETE CASCADE,
+    iteration INTEGER NOT NULL,
+    overall_score INTEGER NOT NULL,
+    feedback JSONB NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX idx_loop_feedback_loop_iteration ON loop_feedback(loop_id, iteration, id);
+
+-- Carry existing history over in its original order
+INSERT INTO loop_feedback (loop_id, iteration, overall_score, feedback)
+SELECT l.id, (e.entry->>'iteration')::INTEGER, (e.entry->>'overall_score')::INTEGER, e.entry
+FROM loop_states l
+CROSS JOIN LATERAL jsonb_array_elements(l.feedback_history) WITH ORDINALITY AS e(entry, position)
+ORDER BY l.id, e.position;
+
+ALTER TABLE loop_states DROP COLUMN feedback_history;
+
+-- Record migration
+INSERT INTO schema_migrations (version, description) VALUES (7, 'Move loop feedback history into append-only loop_feedback table');
@@ -0,0 +1,26 @@
+-- Per-loop tool artifacts (analysis, build plans, completion reports) and user feedback.
+-- Previously held in process-local dicts; rows are removed with their loop via ON DELETE CASCADE,
+-- so the loop history limit bounds them as well.
+
+CREATE TABLE loop_artifacts (
+    loop_id VARCHAR(8) NOT NULL REFERENCES loop_states(id) ON DELETE CASCADE,
+    kind VARCHAR(50) NOT NULL,
+    content TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (loop_id, kind)
+);
+
+CREATE INDEX idx_loop_artifacts_kind_created ON loop_artifacts(kind, created_at);
+
+CREATE TABLE loop_user_feedback (
+    id BIGSERIAL PRIMARY KEY,
+    loop_id VARCHAR(8) NOT NULL REFERENCES loop_states(id) ON DELETE CASCADE,
+    feedback TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX idx_loop_user_feedback_loop ON loop_user_feedback(loop_id, id);
+
+-- Record migration
+INSERT INTO schema_migrations (version, description) VALUES (8, 'Add loop_artifacts and loop_user_feedback tables');
@@ -0,0 +1,23 @@
+-- Roadmap order of specs. created_at is the transaction start time, so every spec stored by
+-- one bulk upsert shared it and paging over it was unstable. The sequence default is drawn
+-- per inserted row; upserts of an existing spec keep their slot.
+
+CREATE SEQUENCE technical_specs_spec_order_seq;
+
+ALTER TABLE technical_specs ADD COLUMN spec_order BIGINT;
+
+UPDATE technical_specs SET spec_order = ordered.position
+FROM (SELECT id, row_number() OVER (ORDER BY created_at, id) AS position FROM technical_specs) AS ordered
+WHERE technical_specs.id = ordered.id;
+
+SELECT setval('technical_specs_spec_order_seq', COALESCE(MAX(spec_order), 0) + 1, false) FROM technical_specs;
+
+ALTER TABLE technical_specs
+    ALTER COLUMN spec_order SET DEFAULT nextval('technical_specs_spec_order_seq'),
+    ALTER COLUMN spec_order SET NOT NULL;
+ALTER SEQUENCE technical_specs_spec_order_seq OWNED BY technical_specs.spec_order;
+
+CREATE INDEX idx_specs_project_order ON technical_specs(project_name, spec_order, id);
+
+-- Record migration
+INSERT INTO schema_migrations (version, description) VALUES (9, 'Order specs by an explicit spec_order sequence');
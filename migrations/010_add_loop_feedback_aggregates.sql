@@ -0,0 +1,49 @@
+-- Feedback aggregates kept on the loop row, so improvement analysis and feedback summaries
+-- need neither the whole loop_feedback history nor a rebuild over it.
+-- feedback_issues maps each key issue to {"first_seen": [feedback index, position], "count": n}.
+
+ALTER TABLE loop_states
+    ADD COLUMN feedback_count INTEGER NOT NULL DEFAULT 0,
+    ADD COLUMN first_feedback_score INTEGER,
+    ADD COLUMN previous_feedback_score INTEGER,
+    ADD COLUMN latest_feedback_score INTEGER,
+    ADD COLUMN feedback_issues JSONB NOT NULL DEFAULT '{}';
+
+-- Backfill from the stored history
+WITH ordered AS (
+    SELECT loop_id, overall_score, feedback,
+           row_number() OVER (PARTITION BY loop_id ORDER BY iteration, id) - 1 AS feedback_index,
+           COUNT(*) OVER (PARTITION BY loop_id) AS total
+    FROM loop_feedback
+), scores AS (
+    SELECT loop_id, MAX(total) AS feedback_count,
+           MAX(overall_score) FILTER (WHERE feedback_index = 0) AS first_score,
+           MAX(overall_score) FILTER (WHERE feedback_index = total - 2) AS previous_score,
+           MAX(overall_score) FILTER (WHERE feedback_index = total - 1) AS latest_score
+    FROM ordered
+    GROUP BY loop_id
+), issues AS (
+    SELECT o.loop_id, i.issue, MIN(ARRAY[o.feedback_index, i.position - 1]) AS first_seen, COUNT(*) AS occurrences
+    FROM ordered o
+    CROSS JOIN LATERAL jsonb_array_elements_text(o.feedback->'key_issues') WITH ORDINALITY AS i(issue, position)
+    GROUP BY o.loop_id, i.issue
+)
+UPDATE loop_states l SET
+    feedback_count = s.feedback_count,
+    first_feedback_score = s.first_score,
+    previous_feedback_score = s.previous_score,
+    latest_feedback_score = s.latest_score,
+    feedback_issues = COALESCE(
+        (
+            SELECT jsonb_object_agg(
+                issues.issue, jsonb_build_object('first_seen', to_jsonb(issues.first_seen), 'count', issues.occurrences)
+            )
+            FROM issues WHERE issues.loop_id = l.id
+        ),
+        '{}'
+    )
+FROM scores s
+WHERE s.loop_id = l.id;
+
+-- Record migration
+INSERT INTO schema_migrations (version, description) VALUES (10, 'Keep feedback aggregates on loop_states');
@@ -0,0 +1,19 @@
+-- Outcome of every loop evicted by the loop history limit, so loop analytics cover all loops
+-- rather than only the ones still in loop_states. Written by the eviction statement itself.
+
+CREATE TABLE loop_summaries (
+    id BIGSERIAL PRIMARY KEY,
+    loop_id VARCHAR(8) NOT NULL,
+    project_name VARCHAR(255) NOT NULL,
+    loop_type VARCHAR(50) NOT NULL,
+    status VARCHAR(50) NOT NULL,
+    current_score INTEGER NOT NULL,
+    assessments INTEGER NOT NULL,
+    stagnated BOOLEAN NOT NULL,
+    archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX idx_loop_summaries_project_type ON loop_summaries(project_name, loop_type);
+
+-- Record migration
+INSERT INTO schema_migrations (version, description) VALUES (11, 'Keep summaries of loops evicted by the history limit');
@@ -0,0 +1,81 @@
+import subprocess
+import sys
+from argparse import ArgumentParser, Namespace
+
+from src.cli.docker.manager import DockerManager, DockerManagerError
+from src.cli.ui.console import console, print_error, print_warning
+from src.cli.ui.formatters import format_loop_analytics_table
+from src.utils.loop_state import LoopTypeAnalytics
+
+
+def add_arguments(parser: ArgumentParser) -> None:
+    """Add command-specific arguments.
+
+    Args:
+        parser: Argument parser for this command
+    """
+    parser.add_argument('--project', help='Only include loops of this project (default: all projects)')
+    parser.add_argument('--json', action='store_true', help='Print one JSON object per loop type instead of a table')
+
+
+def run(args: Namespace) -> int:
+    """Report refinement loop analytics from the MCP server's database.
+
+    Args:
+        args: Command arguments
+
+    Returns:
+        Exit code (0 for success, non-zero for failure)
+    """
+    try:
+        manager = DockerManager()
+        status = manager.get_container_status()
+
+        if not status['running']:
+            print_error('MCP server container is not running')
+            print_error('Run: respec-ai docker start')
+            return 1
+
+        command = ['docker', 'exec', status['name'], 'uv', 'run', 'respec-loop-analytics']
+        if args.project:
+            command += ['--project', args.project]
+
+        # The server prints one JSON line per loop type as rows arrive
+        analytics: list[LoopTypeAnalytics] = []
+        with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=sys.stderr, text=True) as process:
+            for line in process.stdout or ():
+                if args.json:
+                    sys.stdout.write(line)
+                    sys.stdout.flush()
+                else:
+                    analytics.append(LoopTypeAnalytics.model_validate_json(line))
+
+        if process.returncode != 0:
+            print_error('Loop analytics query failed in the server container')
+            return process.returncode
+
+        if args.json:
+            return 0
+
+        if not analytics:
+            print_warning('No refinement loops stored yet')
+            return 0
+
+        console.print()
+        console.print(format_loop_analytics_table(analytics))
+        console.print()
+        return 0
+
+    except DockerManagerError as e:
+        print_error(f'Docker error: {e}')
+        return 1
+    except Exception as e:
+        print_error(f'Loop analytics failed: {e}')
+        return 1
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Report respec-ai refinement loop analytics')
+    add_arguments(parser)
+    args = parser.parse_args()
+    sys.exit(run(args))
@@ -13,6 +13,7 @@ Provides commands for:
 - MCP unregistration (unregister-mcp)
 - Cleanup (cleanup)
 - Docker container management (docker)
+- Refinement loop analytics (loop-analytics)
 """
 
 import sys
@@ -22,6 +23,7 @@ from src.cli.commands import (
     cleanup,
     docker,
     init,
+    loop_analytics,
     mcp_server,
     platform,
     rebuild,
@@ -142,6 +144,13 @@ def main() -> int:
 
     mcp_server.add_arguments(mcp_server_parser)
 
+    loop_analytics_parser = subparsers.add_parser(
+        'loop-analytics',
+        help='Report refinement loop outcomes per loop type (iterations, stagnation, scores)',
+    )
+
+    loop_analytics.add_arguments(loop_analytics_parser)
+
     args = parser.parse_args()
 
     match args.command:
@@ -169,6 +178,8 @@ def main() -> int:
             return docker.run(args)
         case 'mcp-server':
             return mcp_server.run(args)
+        case 'loop-analytics':
+            return loop_analytics.run(args)
         case _:
             parser.print_help()
             return 1
@@ -4,6 +4,7 @@ from rich.panel import Panel
 from rich.table import Table
 
 from src.cli.ui.console import console
+from src.utils.loop_state import LoopTypeAnalytics
 
 
 def format_project_config_table(
@@ -104,6 +105,45 @@ def format_file_counts_table(
     return table
 
 
+def format_loop_analytics_table(analytics: list[LoopTypeAnalytics]) -> Table:
+    """Format per-loop-type analytics as a Rich table.
+
+    Args:
+        analytics: One entry per loop type
+
+    Returns:
+        Rich Table object
+    """
+    table = Table(title='Loop Analytics')
+    table.add_column('Loop Type', style='cyan', no_wrap=True)
+    table.add_column('Loops', justify='right')
+    table.add_column('Completed', justify='right')
+    table.add_column('Iterations (mean / median)', justify='right')
+    table.add_column('Stagnation', justify='right')
+    table.add_column('Score (min / p25 / median / p75 / max)', justify='right')
+
+    for entry in analytics:
+        iterations = '-'
+        if entry.mean_iterations_to_completion is not None and entry.median_iterations_to_completion is not None:
+            iterations = f'{entry.mean_iterations_to_completion:.1f} / {entry.median_iterations_to_completion:g}'
+
+        scores = '-'
+        if entry.score_distribution is not None:
+            dist = entry.score_distribution
+            scores = f'{dist.minimum} / {dist.p25:g} / {dist.median:g} / {dist.p75:g} / {dist.maximum}'
+
+        table.add_row(
+            entry.loop_type.value,
+            str(entry.loop_count),
+            str(entry.completed_count),
+            iterations,
+            f'{entry.stagnation_rate:.0%}',
+            scores,
+        )
+
+    return table
+
+
 def print_setup_complete(
     project_path: Path,
     platform: str,
@@ -0,0 +1,22 @@
+import asyncio
+from argparse import ArgumentParser
+
+from src.utils.state_manager import PostgresStateManager
+
+
+async def stream_loop_analytics(project_name: str | None = None) -> None:
+    # Runs beside the MCP server rather than inside it, so the shared database is the only loop store to report on
+    manager = PostgresStateManager()
+    await manager.initialize()
+    try:
+        for analytics in await manager.get_loop_analytics(project_name):
+            print(analytics.model_dump_json(), flush=True)
+    finally:
+        await manager.close()
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Print per-loop-type refinement analytics as JSON lines')
+    parser.add_argument('--project', help='Only include loops of this project')
+    args = parser.parse_args()
+    asyncio.run(stream_loop_analytics(args.project))
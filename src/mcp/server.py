@@ -8,6 +8,7 @@ from fastmcp.server.middleware.error_handling import ErrorHandlingMiddleware
 from fastmcp.server.middleware.logging import LoggingMiddleware
 
 from src.mcp.tools import register_all_tools
+from src.models.cache import parse_cache
 from src.utils.enums import HealthState
 from src.utils.loop_state import HealthStatus
 from src.utils.setting_configs import mcp_settings
@@ -117,6 +118,7 @@ def create_mcp_server() -> FastMCP:
     log_level = getattr(logging, mcp_settings.log_level.upper(), logging.INFO)
 
     mcp = FastMCP(mcp_settings.server_name)
+    parse_cache.configure(mcp_settings.parse_cache_max_entries, mcp_settings.parse_cache_max_bytes)
     error_logger = logging.getLogger('mcp_errors')
 
     def handle_error(error: Exception, context: MiddlewareContext) -> None:
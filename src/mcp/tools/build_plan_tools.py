@@ -4,7 +4,7 @@ from pydantic import ValidationError
 
 from src.models.build_plan import BuildPlan
 from src.shared import state_manager
-from src.utils.enums import LoopStatus
+from src.utils.enums import LoopArtifactKind, LoopStatus
 from src.utils.errors import LoopNotFoundError
 from src.utils.loop_state import MCPResponse
 from src.utils.state_manager import StateManager
@@ -13,18 +13,17 @@ from src.utils.state_manager import StateManager
 class BuildPlanTools:
     def __init__(self, state: StateManager) -> None:
         self.state = state
-        self._build_plans: dict[str, BuildPlan] = {}  # loop_id -> BuildPlan
 
     async def store_build_plan(self, loop_id: str, plan: BuildPlan) -> MCPResponse:
         try:
-            loop_state = await self.state.get_loop(loop_id)
+            loop_status = await self.state.get_loop_status(loop_id)
             if plan is None:
                 raise ValueError('BuildPlan cannot be None')
 
-            self._build_plans[loop_id] = plan
+            await self.state.store_loop_artifact(loop_id, LoopArtifactKind.BUILD_PLAN, plan.model_dump_json())
             return MCPResponse(
                 id=loop_id,
-                status=loop_state.status,
+                status=loop_status.status,
                 message=f'Stored build plan: {plan.project_name}',
             )
         except ValidationError:
@@ -38,12 +37,14 @@ class BuildPlanTools:
 
     async def get_build_plan_data(self, loop_id: str) -> BuildPlan:
         try:
-            await self.state.get_loop(loop_id)
+            if not await self.state.loop_exists(loop_id):
+                raise LoopNotFoundError(f'Loop not found: {loop_id}')
 
-            if loop_id not in self._build_plans:
+            stored_plan = await self.state.get_loop_artifact(loop_id, LoopArtifactKind.BUILD_PLAN)
+            if stored_plan is None:
                 raise ResourceError('No build plan stored for this loop')
 
-            return self._build_plans[loop_id]
+            return BuildPlan.model_validate_json(stored_plan)
         except LoopNotFoundError:
             raise ResourceError('Loop does not exist')
         except (ResourceError, ToolError):
@@ -53,11 +54,11 @@ class BuildPlanTools:
 
     async def get_build_plan_markdown(self, loop_id: str) -> MCPResponse:
         try:
-            loop_state = await self.state.get_loop(loop_id)
+            loop_status = await self.state.get_loop_status(loop_id)
             build_plan = await self.get_build_plan_data(loop_id)
 
             markdown = build_plan.build_markdown()
-            return MCPResponse(id=loop_id, status=loop_state.status, message=markdown)
+            return MCPResponse(id=loop_id, status=loop_status.status, message=markdown)
         except LoopNotFoundError:
             raise ResourceError('Loop does not exist')
         except Exception as e:
@@ -65,14 +66,15 @@ class BuildPlanTools:
 
     async def list_build_plans(self, count: int = 10) -> MCPResponse:
         try:
-            if not self._build_plans:
+            plan_items = await self.state.list_loop_artifacts(LoopArtifactKind.BUILD_PLAN, count)
+            if not plan_items:
                 return MCPResponse(id='list', status=LoopStatus.INITIALIZED, message='No build plans found')
 
-            plan_items = list(self._build_plans.items())[-count:]
             plan_count = len(plan_items)
 
             plan_summaries = []
-            for loop_id, plan in plan_items:
+            for loop_id, stored_plan in plan_items:
+                plan = BuildPlan.model_validate_json(stored_plan)
                 summary = f'ID: {loop_id}, Project: {plan.project_name}'
                 plan_summaries.append(summary)
 
@@ -83,11 +85,12 @@ class BuildPlanTools:
 
     async def delete_build_plan(self, loop_id: str) -> MCPResponse:
         try:
-            await self.state.get_loop(loop_id)
+            if not await self.state.loop_exists(loop_id):
+                raise LoopNotFoundError(f'Loop not found: {loop_id}')
 
-            if loop_id in self._build_plans:
-                plan_name = self._build_plans[loop_id].project_name
-                del self._build_plans[loop_id]
+            stored_plan = await self.state.delete_loop_artifact(loop_id, LoopArtifactKind.BUILD_PLAN)
+            if stored_plan is not None:
+                plan_name = BuildPlan.model_validate_json(stored_plan).project_name
             else:
                 plan_name = 'Unknown'
             return MCPResponse(id=loop_id, status=LoopStatus.COMPLETED, message=f'Deleted build plan: {plan_name}')
@@ -5,6 +5,7 @@ from fastmcp.exceptions import ResourceError, ToolError
 
 from src.models.feedback import CriticFeedback
 from src.shared import state_manager
+from src.utils.enums import LoopArtifactKind
 from src.utils.errors import LoopNotFoundError
 from src.utils.loop_state import MCPResponse
 from src.utils.state_manager import StateManager
@@ -22,12 +23,9 @@ class UnifiedFeedbackTools:
     """
 
     def __init__(self, state: StateManager) -> None:
+        # User feedback (simple markdown strings) and plan-analyst analysis are kept by the state manager
+        # alongside the loop; critic feedback goes into LoopState.feedback_history (structured CriticFeedback)
         self.state = state
-        # Store user feedback separately (simple markdown strings)
-        # Critic feedback goes into LoopState.feedback_history (structured CriticFeedback objects)
-        self._user_feedback: dict[str, list[str]] = {}  # loop_id -> list of feedback
-        # Analysis storage for plan-analyst workflow
-        self._analysis_storage: dict[str, str] = {}  # loop_id -> analysis
 
     async def store_critic_feedback(self, loop_id: str, feedback_markdown: str) -> MCPResponse:
         """Store structured critic feedback from automated assessment.
@@ -44,20 +42,18 @@ class UnifiedFeedbackTools:
         if not feedback_markdown or not feedback_markdown.strip():
             raise ToolError('Feedback markdown cannot be empty')
 
-        try:
-            loop_state = await self.state.get_loop(loop_id)
-        except LoopNotFoundError:
-            raise ResourceError('Loop does not exist')
-
         # Parse and validate critic feedback
         feedback = self._parse_and_validate_feedback(feedback_markdown)
 
-        # Add to loop state (updates score, adds to feedback_history)
-        loop_state.add_feedback(feedback)
+        # Persist feedback and its score in one state manager call
+        try:
+            loop_status = await self.state.append_feedback(loop_id, feedback)
+        except LoopNotFoundError:
+            raise ResourceError('Loop does not exist')
 
         return MCPResponse(
             id=loop_id,
-            status=loop_state.status,
+            status=loop_status.status,
             message=f'Stored critic feedback for loop {loop_id} (Score: {feedback.overall_score})',
         )
 
@@ -77,22 +73,15 @@ class UnifiedFeedbackTools:
             raise ToolError('User feedback cannot be empty')
 
         try:
-            loop_state = await self.state.get_loop(loop_id)
+            loop_status = await self.state.get_loop_status(loop_id)
+            # Append user feedback (chronological order)
+            await self.state.append_user_feedback(loop_id, feedback_markdown)
         except LoopNotFoundError:
             raise ResourceError('Loop does not exist')
 
-        storage_key = loop_id
-
-        # Initialize user feedback list if needed
-        if storage_key not in self._user_feedback:
-            self._user_feedback[storage_key] = []
-
-        # Append user feedback (chronological order)
-        self._user_feedback[storage_key].append(feedback_markdown)
-
         return MCPResponse(
             id=loop_id,
-            status=loop_state.status,
+            status=loop_status.status,
             message=f'Stored user feedback for loop {loop_id}',
         )
 
@@ -117,17 +106,15 @@ class UnifiedFeedbackTools:
             raise ToolError('Count must be a positive integer')
 
         try:
-            loop_state = await self.state.get_loop(loop_id)
+            loop_state = await self.state.get_loop(loop_id, feedback_limit=count)
         except LoopNotFoundError:
             raise ResourceError('Loop does not exist')
 
-        storage_key = loop_id
-
         # Get recent critic feedback from loop state (limited by count)
         critic_feedback_list = loop_state.get_recent_feedback(count=count)
 
         # Get user feedback (all of it - typically sparse, high-value signal)
-        user_feedback_list = self._user_feedback.get(storage_key, [])
+        user_feedback_list = await self.state.get_user_feedback(loop_id)
 
         # Build combined feedback markdown
         if not critic_feedback_list and not user_feedback_list:
@@ -188,13 +175,12 @@ class UnifiedFeedbackTools:
             raise ToolError('Analysis cannot be empty')
 
         try:
-            loop_state = await self.state.get_loop(loop_id)
+            loop_status = await self.state.get_loop_status(loop_id)
+            await self.state.store_loop_artifact(loop_id, LoopArtifactKind.ANALYSIS, analysis)
         except LoopNotFoundError:
             raise ResourceError('Loop does not exist')
 
-        storage_key = loop_id
-        self._analysis_storage[storage_key] = analysis
-        return MCPResponse(id=loop_id, status=loop_state.status, message=f'Stored analysis for loop {loop_id}')
+        return MCPResponse(id=loop_id, status=loop_status.status, message=f'Stored analysis for loop {loop_id}')
 
     async def get_previous_analysis(self, loop_id: str) -> MCPResponse:
         """Get previous analysis (used by plan-analyst workflow).
@@ -209,18 +195,17 @@ class UnifiedFeedbackTools:
             raise ToolError('Loop ID cannot be empty')
 
         try:
-            loop_state = await self.state.get_loop(loop_id)
+            loop_status = await self.state.get_loop_status(loop_id)
         except LoopNotFoundError:
             raise ResourceError('Loop does not exist')
 
-        storage_key = loop_id
-        analysis = self._analysis_storage.get(storage_key, '')
+        analysis = await self.state.get_loop_artifact(loop_id, LoopArtifactKind.ANALYSIS)
         if analysis:
             message = f'Previous analysis for loop {loop_id}:\n\n{analysis}'
         else:
             message = f'No previous analysis found for loop {loop_id}'
 
-        return MCPResponse(id=loop_id, status=loop_state.status, message=message)
+        return MCPResponse(id=loop_id, status=loop_status.status, message=message)
 
     def _parse_and_validate_feedback(self, feedback_markdown: str) -> CriticFeedback:
         try:
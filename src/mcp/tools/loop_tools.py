@@ -1,8 +1,8 @@
 from fastmcp import Context, FastMCP
 from src.shared import state_manager
-from src.utils.enums import LoopType
+from src.utils.enums import LoopStatus, LoopType
 from src.utils.errors import LoopAlreadyExistsError, LoopNotFoundError, LoopStateError, LoopValidationError
-from src.utils.loop_state import LoopState, MCPResponse
+from src.utils.loop_state import LoopState, LoopTypeAnalytics, MCPResponse
 from src.utils.state_manager import StateManager
 
 
@@ -34,12 +34,27 @@ class LoopTools:
         except Exception as e:
             raise LoopStateError(loop_id, 'status_retrieval', f'Unexpected error: {str(e)}')
 
-    async def list_active_loops(self, project_name: str) -> list[MCPResponse]:
+    async def list_active_loops(
+        self,
+        project_name: str,
+        statuses: list[LoopStatus] | None = None,
+        loop_types: list[LoopType] | None = None,
+        after_loop_id: str | None = None,
+        limit: int | None = None,
+    ) -> list[MCPResponse]:
+        if limit is not None and limit < 1:
+            raise LoopValidationError('limit', 'Limit must be at least 1')
         try:
-            return await self.state.list_active_loops(project_name)
+            return await self.state.list_active_loops(project_name, statuses, loop_types, after_loop_id, limit)
         except Exception as e:
             raise LoopStateError('all', 'list_retrieval', f'Failed to retrieve loop list: {str(e)}')
 
+    async def get_loop_analytics(self, project_name: str | None = None) -> list[LoopTypeAnalytics]:
+        try:
+            return await self.state.get_loop_analytics(project_name)
+        except Exception as e:
+            raise LoopStateError('all', 'analytics', f'Failed to aggregate loop analytics: {str(e)}')
+
     async def decide_loop_next_action(self, loop_id: str) -> MCPResponse:
         """MCP tool to decide the next action for a refinement loop.
 
@@ -61,6 +76,20 @@ class LoopTools:
         except Exception as e:
             raise LoopStateError(loop_id, 'decision', f'Unexpected error: {str(e)}')
 
+    async def decide_loops_next_action(self, loop_ids: list[str]) -> list[MCPResponse]:
+        if not loop_ids:
+            raise LoopValidationError('loop_ids', 'At least one loop id is required')
+        batch = ', '.join(loop_ids)
+        try:
+            return await self.state.decide_loops_next_action(loop_ids)
+        except LoopNotFoundError as e:
+            raise LoopStateError(batch, 'decision', str(e))
+        except ValueError as e:
+            # Raised when a loop has no feedback for score extraction
+            raise LoopStateError(batch, 'decision', str(e))
+        except Exception as e:
+            raise LoopStateError(batch, 'decision', f'Unexpected error: {str(e)}')
+
     async def get_previous_objective_feedback(self, loop_id: str) -> MCPResponse:
         try:
             return await self.state.get_objective_feedback(loop_id)
@@ -85,7 +114,8 @@ class LoopTools:
         feedback count, and recent assessment summaries.
         """
         try:
-            loop_state = await self.state.get_loop(loop_id)
+            # Totals come from the feedback aggregates, so only the entries shown are loaded
+            loop_state = await self.state.get_loop(loop_id, feedback_limit=3)
             recent_feedback = loop_state.get_recent_feedback(3)
 
             if not recent_feedback:
@@ -96,7 +126,7 @@ class LoopTools:
                 )
 
             # Build feedback summary for decision context
-            feedback_count = len(loop_state.feedback_history)
+            feedback_count = loop_state.feedback_stats.count
             current_score = loop_state.current_score
             score_trend = self._calculate_score_trend(loop_state.score_history)
 
@@ -123,31 +153,20 @@ class LoopTools:
         intelligent refinement strategy decisions.
         """
         try:
-            loop_state = await self.state.get_loop(loop_id)
-            feedback_history = loop_state.feedback_history
+            loop_state = await self.state.get_loop(loop_id, feedback_limit=1)
+            stats = loop_state.feedback_stats
 
-            if len(feedback_history) < 2:
+            if stats.count < 2:
                 return MCPResponse(
                     id=loop_id,
                     status=loop_state.status,
                     message='Insufficient feedback history for improvement analysis - need at least 2 assessments',
                 )
 
-            # Analyze improvement patterns
-            score_improvements = []
-            for i in range(1, len(feedback_history)):
-                score_improvements.append(feedback_history[i].overall_score - feedback_history[i - 1].overall_score)
-
-            avg_improvement = sum(score_improvements) / len(score_improvements)
-            last_improvement = score_improvements[-1] if score_improvements else 0
-
-            # Identify recurring issues
-            all_issues = [issue for fb in feedback_history for issue in fb.key_issues]
-            issue_counts: dict[str, int] = {}
-            for issue in all_issues:
-                issue_counts[issue] = issue_counts.get(issue, 0) + 1
-
-            recurring_issues = [issue for issue, count in issue_counts.items() if count >= 2]
+            # Improvement patterns and recurring issues are maintained as feedback is added
+            avg_improvement = stats.mean_improvement
+            last_improvement = stats.last_improvement
+            recurring_issues = stats.recurring_issues(limit=3)
 
             # Build analysis message
             trend_desc = 'improving' if avg_improvement > 0 else 'declining' if avg_improvement < 0 else 'stable'
@@ -157,7 +176,7 @@ class LoopTools:
             )
 
             if recurring_issues:
-                analysis_message += f'Recurring issues: {", ".join(recurring_issues[:3])}. '
+                analysis_message += f'Recurring issues: {", ".join(recurring_issues)}. '
             else:
                 analysis_message += 'No recurring issues identified. '
 
@@ -211,6 +230,28 @@ def register_loop_tools(mcp: FastMCP) -> None:
         await ctx.info(f'Decision result for loop {loop_id}: {result.status}')
         return result
 
+    @mcp.tool()
+    async def decide_loops_next_action(loop_ids: list[str], ctx: Context) -> list[MCPResponse]:
+        """Decide next action for several refinement loops in one call.
+
+        Batch form of decide_loop_next_action for orchestrators running loops
+        in parallel: every loop's score is taken from its latest critic
+        feedback and all decisions are stored together. If any loop is missing
+        or has no feedback, no loop is changed.
+
+        Parameters:
+        - loop_ids: Unique identifiers of the loops to process
+
+        Returns:
+        - list[MCPResponse]: One decision per distinct loop id, in the given order
+        """
+        await ctx.info(f'Processing decisions for {len(loop_ids)} loops')
+        result = await loop_tools.decide_loops_next_action(loop_ids)
+        await ctx.info(
+            f'Decision results: {", ".join(f"{response.id}={response.status.value}" for response in result)}'
+        )
+        return result
+
     @mcp.tool()
     async def initialize_refinement_loop(project_name: str, loop_type: str, ctx: Context) -> MCPResponse:
         """Initialize a new refinement loop.
@@ -250,23 +291,55 @@ def register_loop_tools(mcp: FastMCP) -> None:
         return result
 
     @mcp.tool()
-    async def list_active_loops(project_name: str, ctx: Context) -> list[MCPResponse]:
-        """List all currently active refinement loops.
-
-        Returns summary information for all active loops in the current
-        session. Useful for managing multiple concurrent refinement processes.
+    async def list_active_loops(
+        project_name: str,
+        ctx: Context,
+        statuses: list[LoopStatus] | None = None,
+        loop_types: list[LoopType] | None = None,
+        after_loop_id: str | None = None,
+        limit: int | None = None,
+    ) -> list[MCPResponse]:
+        """List currently active refinement loops for a project.
+
+        Returns summary information for the project's active loops in creation
+        order. Useful for managing multiple concurrent refinement processes.
 
         Parameters:
         - project_name: Name of the project (from .respec-ai/config.json)
+        - statuses: Only include loops in these statuses (optional)
+        - loop_types: Only include loops of these types (optional)
+        - after_loop_id: Id of the last loop from the previous page, to fetch the next page (optional)
+        - limit: Maximum number of loops to return (optional)
 
         Returns:
         - list[MCPResponse]: List of active loops with their current status
         """
         await ctx.info(f'Retrieving list of active loops for {project_name}')
-        result = await loop_tools.list_active_loops(project_name)
+        result = await loop_tools.list_active_loops(project_name, statuses, loop_types, after_loop_id, limit)
         await ctx.info(f'Found {len(result)} active loops')
         return result
 
+    @mcp.tool()
+    async def get_loop_analytics(ctx: Context, project_name: str | None = None) -> list[LoopTypeAnalytics]:
+        """Report refinement outcomes per loop type across all stored loops.
+
+        Aggregates iterations to completion, stagnation rate and latest-score
+        distribution for each loop type, to support tuning the LOOP_* thresholds
+        and checkpoint frequencies. Loops evicted by the loop history limit are
+        included through the summary kept when they were evicted.
+
+        Parameters:
+        - project_name: Only include this project's loops (optional, default all projects)
+
+        Returns:
+        - list[LoopTypeAnalytics]: One entry per loop type with stored loops
+        """
+        scope = project_name or 'all projects'
+        await ctx.info(f'Aggregating loop analytics for {scope}')
+        result = await loop_tools.get_loop_analytics(project_name)
+        await ctx.info(f'Aggregated analytics for {len(result)} loop types')
+        return result
+
     @mcp.tool()
     async def get_previous_objective_feedback(loop_id: str, ctx: Context) -> MCPResponse:
         """Retrieve previous objective validation feedback for analyst-critic.
@@ -4,7 +4,7 @@ from pydantic import ValidationError
 
 from src.models.plan_completion_report import PlanCompletionReport
 from src.shared import state_manager
-from src.utils.enums import LoopStatus
+from src.utils.enums import LoopArtifactKind, LoopStatus
 from src.utils.errors import LoopNotFoundError
 from src.utils.loop_state import MCPResponse
 from src.utils.state_manager import StateManager
@@ -13,7 +13,14 @@ from src.utils.state_manager import StateManager
 class PlanCompletionReportTools:
     def __init__(self, state: StateManager) -> None:
         self.state = state
-        self._completion_reports: dict[str, PlanCompletionReport] = {}
+
+    async def _store_report(self, loop_id: str, completion_report: PlanCompletionReport) -> None:
+        await self.state.store_loop_artifact(
+            loop_id, LoopArtifactKind.COMPLETION_REPORT, completion_report.model_dump_json()
+        )
+
+    async def _has_report(self, loop_id: str) -> bool:
+        return await self.state.get_loop_artifact(loop_id, LoopArtifactKind.COMPLETION_REPORT) is not None
 
     async def create_completion_report(
         self, project_path: str, completion_report: PlanCompletionReport, loop_id: str
@@ -29,16 +36,16 @@ class PlanCompletionReportTools:
                 raise ValueError('Loop ID cannot be empty')
 
             # Verify loop exists
-            loop_state = await self.state.get_loop(loop_id)
+            loop_status = await self.state.get_loop_status(loop_id)
 
             # Check if report already exists for this loop
-            if loop_id in self._completion_reports:
+            if await self._has_report(loop_id):
                 raise ValueError(f'Completion report already exists for loop {loop_id}')
 
-            self._completion_reports[loop_id] = completion_report
+            await self._store_report(loop_id, completion_report)
             return MCPResponse(
                 id=loop_id,
-                status=loop_state.status,
+                status=loop_status.status,
                 message=f'Created completion report for {completion_report.report_title}',
             )
         except ValidationError:
@@ -63,11 +70,11 @@ class PlanCompletionReportTools:
             if not loop_id or not loop_id.strip():
                 raise ValueError('Loop ID cannot be empty')
 
-            loop_state = await self.state.get_loop(loop_id)
-            self._completion_reports[loop_id] = completion_report
+            loop_status = await self.state.get_loop_status(loop_id)
+            await self._store_report(loop_id, completion_report)
             return MCPResponse(
                 id=loop_id,
-                status=loop_state.status,
+                status=loop_status.status,
                 message=f'Stored completion report for {completion_report.report_title}',
             )
         except ValidationError:
@@ -88,12 +95,14 @@ class PlanCompletionReportTools:
                 raise ValueError('Loop ID cannot be empty')
 
             # Check if loop exists
-            await self.state.get_loop(loop_id)
+            if not await self.state.loop_exists(loop_id):
+                raise LoopNotFoundError(f'Loop not found: {loop_id}')
 
-            if loop_id not in self._completion_reports:
+            stored_report = await self.state.get_loop_artifact(loop_id, LoopArtifactKind.COMPLETION_REPORT)
+            if stored_report is None:
                 raise ResourceError('No completion report stored for this loop')
 
-            return self._completion_reports[loop_id]
+            return PlanCompletionReport.model_validate_json(stored_report)
         except ValueError as e:
             raise ToolError(f'Invalid input: {str(e)}')
         except LoopNotFoundError:
@@ -108,11 +117,11 @@ class PlanCompletionReportTools:
             if not project_path or not project_path.strip():
                 raise ValueError('Project path cannot be empty')
 
-            loop_state = await self.state.get_loop(loop_id)
+            loop_status = await self.state.get_loop_status(loop_id)
             completion_report = await self.get_completion_report_data(project_path, loop_id)
 
             markdown = completion_report.build_markdown()
-            return MCPResponse(id=loop_id, status=loop_state.status, message=markdown)
+            return MCPResponse(id=loop_id, status=loop_status.status, message=markdown)
         except LoopNotFoundError:
             raise ResourceError('Loop does not exist')
         except Exception as e:
@@ -132,14 +141,14 @@ class PlanCompletionReportTools:
                 raise ValueError('Loop ID cannot be empty')
 
             # Check if loop and report exist
-            loop_state = await self.state.get_loop(loop_id)
-            if loop_id not in self._completion_reports:
+            loop_status = await self.state.get_loop_status(loop_id)
+            if not await self._has_report(loop_id):
                 raise ResourceError('No completion report stored for this loop')
 
-            self._completion_reports[loop_id] = completion_report
+            await self._store_report(loop_id, completion_report)
             return MCPResponse(
                 id=loop_id,
-                status=loop_state.status,
+                status=loop_status.status,
                 message=f'Updated completion report for {completion_report.report_title}',
             )
         except ValidationError:
@@ -161,15 +170,16 @@ class PlanCompletionReportTools:
             if count <= 0:
                 raise ValueError('Count must be a positive integer')
 
-            if not self._completion_reports:
+            # Get recent reports (limited by count)
+            report_items = await self.state.list_loop_artifacts(LoopArtifactKind.COMPLETION_REPORT, count)
+            if not report_items:
                 return MCPResponse(id='list', status=LoopStatus.INITIALIZED, message='No completion reports found')
 
-            # Get recent reports (limited by count)
-            report_items = list(self._completion_reports.items())[-count:]
             report_count = len(report_items)
 
             report_summaries = []
-            for loop_id, report in report_items:
+            for loop_id, stored_report in report_items:
+                report = PlanCompletionReport.model_validate_json(stored_report)
                 summary = f'ID: {loop_id}, Report: {report.report_title}, Score: {report.final_plan_score}%'
                 report_summaries.append(summary)
 
@@ -191,12 +201,13 @@ class PlanCompletionReportTools:
                 raise ValueError('Loop ID cannot be empty')
 
             # Check if loop exists
-            await self.state.get_loop(loop_id)
+            if not await self.state.loop_exists(loop_id):
+                raise LoopNotFoundError(f'Loop not found: {loop_id}')
 
             # Remove completion report
-            if loop_id in self._completion_reports:
-                report_title = self._completion_reports[loop_id].report_title
-                del self._completion_reports[loop_id]
+            stored_report = await self.state.delete_loop_artifact(loop_id, LoopArtifactKind.COMPLETION_REPORT)
+            if stored_report is not None:
+                report_title = PlanCompletionReport.model_validate_json(stored_report).report_title
             else:
                 report_title = 'Unknown'
             return MCPResponse(
@@ -1,12 +1,19 @@
+import asyncio
+import io
+
 from fastmcp import Context, FastMCP
 from fastmcp.exceptions import ResourceError, ToolError
 from src.models.roadmap import Roadmap
 from src.models.spec import TechnicalSpec
 from src.shared import state_manager
-from src.utils.state_manager import StateManager
+from src.utils.loop_state import RoadmapPage
+from src.utils.state_manager import StateManager, normalize_spec_name
 
 
 class RoadmapTools:
+    # Specs loaded and rendered per batch when a whole roadmap is requested
+    RENDER_BATCH_SIZE = 8
+
     def __init__(self, state: StateManager) -> None:
         self.state = state
 
@@ -23,13 +30,15 @@ class RoadmapTools:
             roadmap = Roadmap.parse_markdown(roadmap_metadata)
             await self.state.store_roadmap(project_name, roadmap)
 
-            # Parse and store each spec individually
-            specs = []
-            for i, spec_block in enumerate(spec_blocks[1:], 1):
-                spec_markdown = f'# Technical Specification:{spec_block}'
-                spec = TechnicalSpec.parse_markdown(spec_markdown)
-                specs.append(spec)
-                await self.state.store_spec(project_name, spec)
+            # Parse specs in worker threads so large roadmaps don't stall the event loop,
+            # then write them as one batch
+            specs = await asyncio.gather(
+                *(
+                    asyncio.to_thread(TechnicalSpec.parse_markdown, f'# Technical Specification:{spec_block}')
+                    for spec_block in spec_blocks[1:]
+                )
+            )
+            await self.state.store_specs_bulk(project_name, specs)
 
             return f'Created roadmap "{roadmap.project_name}" with {len(specs)} specs for project {project_name}'
         except Exception as e:
@@ -41,8 +50,73 @@ class RoadmapTools:
 
         try:
             roadmap = await self.state.get_roadmap(project_name)
-            specs = await self.state.get_roadmap_specs(project_name)
-            return roadmap.build_markdown(specs)
+            spec_count = len(await self.state.list_specs(project_name))
+
+            # Render batch by batch into one buffer, so only a batch of spec models and
+            # the output itself are held at once
+            document = io.StringIO()
+            specs = await self.state.get_roadmap_specs(project_name, 0, self.RENDER_BATCH_SIZE)
+            document.writelines(roadmap.iter_markdown(specs, spec_count=spec_count))
+            offset = len(specs)
+            while specs and offset < spec_count:
+                specs = await self.state.get_roadmap_specs(project_name, offset, self.RENDER_BATCH_SIZE)
+                if specs:
+                    document.write('\n\n')
+                    document.writelines(roadmap.iter_markdown(specs, include_metadata=False))
+                offset += len(specs)
+            return document.getvalue()
+        except Exception as e:
+            raise ResourceError(f'Roadmap not found for project {project_name}: {str(e)}')
+
+    async def get_roadmap_page(
+        self,
+        project_name: str,
+        offset: int = 0,
+        limit: int | None = None,
+        spec_names: list[str] | None = None,
+        include_metadata: bool = True,
+        sections: list[str] | None = None,
+    ) -> RoadmapPage:
+        if not project_name:
+            raise ToolError('Project name cannot be empty')
+        if offset < 0:
+            raise ToolError('Offset cannot be negative')
+        if limit is not None and limit < 1:
+            raise ToolError('Limit must be at least 1')
+
+        try:
+            roadmap = await self.state.get_roadmap(project_name)
+            all_spec_names = await self.state.list_specs(project_name)
+            if spec_names is not None:
+                wanted_names = {normalize_spec_name(name) for name in spec_names}
+                total_specs = sum(1 for name in all_spec_names if name in wanted_names)
+            else:
+                total_specs = len(all_spec_names)
+
+            # Only the requested window of specs is loaded and rendered
+            specs = await self.state.get_roadmap_specs(project_name, offset, limit, spec_names)
+            if sections is not None:
+                available = {name.lower() for spec in specs for name in spec.section_names()}
+                unknown = [name for name in sections if name.strip().lower() not in available]
+                if specs and unknown:
+                    raise ToolError(f'Unknown spec section(s): {", ".join(unknown)}')
+            markdown = ''.join(
+                roadmap.iter_markdown(
+                    specs, spec_count=total_specs, include_metadata=include_metadata, sections=sections
+                )
+            )
+
+            next_offset = offset + len(specs)
+            return RoadmapPage(
+                project_name=project_name,
+                markdown=markdown,
+                offset=offset,
+                spec_count=len(specs),
+                total_specs=total_specs,
+                next_offset=next_offset if next_offset < total_specs else None,
+            )
+        except ToolError:
+            raise
         except Exception as e:
             raise ResourceError(f'Roadmap not found for project {project_name}: {str(e)}')
 
@@ -70,6 +144,9 @@ def register_roadmap_tools(mcp: FastMCP) -> None:
     async def get_roadmap(project_name: str, ctx: Context) -> str:
         """Retrieve roadmap as markdown.
 
+        Returns the whole document in one string; use get_roadmap_page to fetch
+        large roadmaps in windows or only selected spec sections.
+
         Parameters:
         - project_name: Name of the project
 
@@ -81,5 +158,38 @@ def register_roadmap_tools(mcp: FastMCP) -> None:
         await ctx.info(f'Got roadmap for project: {project_name}')
         return result
 
+    @mcp.tool()
+    async def get_roadmap_page(
+        project_name: str,
+        ctx: Context,
+        offset: int = 0,
+        limit: int | None = None,
+        spec_names: list[str] | None = None,
+        include_metadata: bool = True,
+        sections: list[str] | None = None,
+    ) -> RoadmapPage:
+        """Retrieve a window of the roadmap as markdown.
+
+        Renders only the requested specs instead of the whole roadmap, for
+        roadmaps too large to fetch in one call.
+
+        Parameters:
+        - project_name: Name of the project
+        - offset: Index of the first spec to include (creation order)
+        - limit: Maximum number of specs to include (omit for all remaining)
+        - spec_names: Only include these specs (applied before offset/limit)
+        - include_metadata: Include the roadmap metadata sections before the specs
+        - sections: Only render these spec sections, e.g. ['Architecture', 'Testing Strategy'] (optional)
+
+        Returns:
+        - RoadmapPage: markdown for the window, plus total_specs and next_offset (None on the last page)
+        """
+        await ctx.info(f'Getting roadmap page for project: {project_name} (offset={offset}, limit={limit})')
+        result = await roadmap_tools.get_roadmap_page(
+            project_name, offset, limit, spec_names, include_metadata, sections
+        )
+        await ctx.info(f'Got roadmap page for project: {project_name}')
+        return result
+
 
 roadmap_tools = RoadmapTools(state_manager)
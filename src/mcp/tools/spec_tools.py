@@ -4,7 +4,7 @@ from pydantic import ValidationError
 from src.models.spec import TechnicalSpec
 from src.shared import state_manager
 from src.utils.enums import LoopStatus
-from src.utils.errors import LoopNotFoundError, RoadmapNotFoundError, SpecNotFoundError
+from src.utils.errors import LoopNotFoundError, RoadmapNotFoundError, SpecNotFoundError, SpecVersionConflictError
 from src.utils.loop_state import MCPResponse
 from src.utils.state_manager import StateManager
 
@@ -52,18 +52,46 @@ class SpecTools:
         except Exception as e:
             raise ToolError(f'Failed to update spec: {str(e)}')
 
+    async def patch_spec(self, project_name: str, spec_name: str, section_patches: dict[str, str]) -> str:
+        if not project_name:
+            raise ToolError('Project name cannot be empty')
+        if not spec_name:
+            raise ToolError('Spec name cannot be empty')
+        if not section_patches:
+            raise ToolError('Section patches cannot be empty')
+
+        try:
+            existing_spec = await self.state.get_spec(project_name, spec_name)
+            patched_spec = existing_spec.apply_section_patches(section_patches)
+            # Reject the write if another update landed since the read, instead of losing it
+            return await self.state.update_spec(
+                project_name, spec_name, patched_spec, expected_version=existing_spec.version
+            )
+        except SpecNotFoundError as e:
+            raise ResourceError(f'Spec not found: {str(e)}')
+        except SpecVersionConflictError as e:
+            raise ToolError(f'Spec was modified concurrently, re-read it and patch again: {str(e)}')
+        except RoadmapNotFoundError as e:
+            raise ResourceError(str(e))
+        except ValidationError:
+            raise ToolError('Invalid specification data provided')
+        except ValueError as e:
+            raise ToolError(str(e))
+        except Exception as e:
+            raise ToolError(f'Failed to patch spec: {str(e)}')
+
     async def get_spec_markdown(
         self, project_name: str | None, spec_name: str | None, loop_id: str | None
     ) -> MCPResponse:
         try:
             if loop_id:
-                loop_state = await self.state.get_loop(loop_id)
+                loop_status = await self.state.get_loop_status(loop_id)
                 spec = await self.state.get_spec_by_loop(loop_id)
                 markdown = spec.build_markdown()
                 char_length = len(markdown)
                 return MCPResponse(
                     id=loop_id,
-                    status=loop_state.status,
+                    status=loop_status.status,
                     message=markdown,
                     char_length=char_length,
                 )
@@ -87,6 +115,38 @@ class SpecTools:
         except Exception as e:
             raise ToolError(f'Failed to retrieve spec: {str(e)}')
 
+    async def get_spec_sections(
+        self, project_name: str | None, spec_name: str | None, loop_id: str | None, section_names: list[str]
+    ) -> MCPResponse:
+        if not section_names:
+            raise ToolError('At least one section name must be provided')
+
+        try:
+            if loop_id:
+                loop_status = await self.state.get_loop_status(loop_id)
+                spec = await self.state.get_spec_by_loop(loop_id)
+                response_id, status = loop_id, loop_status.status
+            elif project_name and spec_name:
+                spec = await self.state.get_spec(project_name, spec_name)
+                response_id, status = f'{project_name}/{spec_name}', LoopStatus.COMPLETED
+            else:
+                raise ToolError('Either loop_id OR (project_name AND spec_name) must be provided')
+
+            markdown = spec.build_sections_markdown(section_names)
+            return MCPResponse(id=response_id, status=status, message=markdown, char_length=len(markdown))
+        except ToolError:
+            raise
+        except LoopNotFoundError:
+            raise ResourceError('Loop does not exist or is not linked to a spec')
+        except RoadmapNotFoundError as e:
+            raise ResourceError(str(e))
+        except SpecNotFoundError as e:
+            raise ResourceError(str(e))
+        except ValueError as e:
+            raise ToolError(str(e))
+        except Exception as e:
+            raise ToolError(f'Failed to retrieve spec sections: {str(e)}')
+
     async def list_specs(self, project_name: str) -> MCPResponse:
         if not project_name:
             raise ToolError('Project name cannot be empty')
@@ -155,10 +215,10 @@ class SpecTools:
 
         try:
             await self.state.link_loop_to_spec(loop_id, project_name, spec_name)
-            loop_state = await self.state.get_loop(loop_id)
+            loop_status = await self.state.get_loop_status(loop_id)
             return MCPResponse(
                 id=loop_id,
-                status=loop_state.status,
+                status=loop_status.status,
                 message=f'Linked loop {loop_id} to spec "{spec_name}" in project {project_name}',
             )
         except SpecNotFoundError as e:
@@ -174,17 +234,17 @@ class SpecTools:
 
         try:
             result = await self.state.unlink_loop(loop_id)
-            loop_state = await self.state.get_loop(loop_id)
+            loop_status = await self.state.get_loop_status(loop_id)
             if result:
                 project_name, spec_name = result
                 return MCPResponse(
                     id=loop_id,
-                    status=loop_state.status,
+                    status=loop_status.status,
                     message=f'Unlinked loop {loop_id} from spec "{spec_name}" in project {project_name}',
                 )
             else:
                 return MCPResponse(
-                    id=loop_id, status=loop_state.status, message=f'Loop {loop_id} was not linked to any spec'
+                    id=loop_id, status=loop_status.status, message=f'Loop {loop_id} was not linked to any spec'
                 )
         except LoopNotFoundError:
             raise ResourceError('Loop does not exist')
@@ -245,6 +305,34 @@ def register_spec_tools(mcp: FastMCP) -> None:
             await ctx.error(f'Failed to update spec: {str(e)}')
             raise
 
+    @mcp.tool()
+    async def patch_spec(project_name: str, spec_name: str, section_patches: dict[str, str], ctx: Context) -> str:
+        """Replace individual sections of an existing technical specification.
+
+        Applies per-section replacements to the stored spec instead of re-sending the
+        complete document. Frozen initial fields (objectives, scope, dependencies,
+        deliverables) cannot be patched. Auto-increments iteration and version. The patch is
+        rejected if another update changed the spec while it was being applied; patch again.
+
+        Parameters:
+        - project_name: Project identifier from .respec-ai/config.json
+        - spec_name: Name/phase of the specification to patch
+        - section_patches: Map of section path to new content, e.g.
+          {"System Design/Architecture": "...", "Testing Strategy": "...", "Data Models": "..."}.
+          Unmapped H2 names create or replace additional sections; empty content clears a section.
+
+        Returns:
+        - str: Confirmation message with iteration and version
+        """
+        await ctx.info(f'Patching {len(section_patches)} section(s) of spec "{spec_name}" for project {project_name}')
+        try:
+            result = await spec_tools.patch_spec(project_name, spec_name, section_patches)
+            await ctx.info(f'Patched spec "{spec_name}" for project {project_name}')
+            return result
+        except Exception as e:
+            await ctx.error(f'Failed to patch spec: {str(e)}')
+            raise
+
     @mcp.tool()
     async def get_spec_markdown(
         project_name: str | None, spec_name: str | None, loop_id: str | None, ctx: Context
@@ -272,6 +360,35 @@ def register_spec_tools(mcp: FastMCP) -> None:
             await ctx.error(f'Failed to retrieve spec: {str(e)}')
             raise
 
+    @mcp.tool()
+    async def get_spec_sections(
+        project_name: str | None, spec_name: str | None, loop_id: str | None, section_names: list[str], ctx: Context
+    ) -> MCPResponse:
+        """Retrieve only selected sections of a specification as markdown.
+
+        Renders the requested sections straight from stored fields instead of the whole
+        document, keeping payloads small when an agent only needs part of a spec.
+        Uses the same two retrieval modes as get_spec_markdown.
+
+        Parameters:
+        - project_name: Project identifier from .respec-ai/config.json (required if not using loop_id)
+        - spec_name: Spec name (required if not using loop_id)
+        - loop_id: Loop identifier (alternative to project_name + spec_name)
+        - section_names: Section headers to include, e.g. ["Architecture", "Testing Strategy"].
+          H2 group names (e.g. "System Design") include every section under them.
+
+        Returns:
+        - MCPResponse: Contains the spec title and requested sections in message field
+        """
+        await ctx.info(f'Retrieving spec sections: {", ".join(section_names)}')
+        try:
+            result = await spec_tools.get_spec_sections(project_name, spec_name, loop_id, section_names)
+            await ctx.info('Retrieved spec sections')
+            return result
+        except Exception as e:
+            await ctx.error(f'Failed to retrieve spec sections: {str(e)}')
+            raise
+
     @mcp.tool()
     async def list_specs(project_name: str, ctx: Context) -> MCPResponse:
         """List all specifications for a project.
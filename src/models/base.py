@@ -1,10 +1,218 @@
 import re
 from abc import ABC, abstractmethod
+from functools import cached_property
+from collections.abc import Iterator, Mapping
 from typing import Any, ClassVar, Self
+from weakref import WeakKeyDictionary
 
 from markdown_it import MarkdownIt
 from markdown_it.tree import SyntaxTreeNode
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+
+from .cache import parse_cache
+
+
+_FENCE_PATTERN = re.compile(r'^ {0,3}(`{3,}|~{3,})')
+_CLOSING_SEQUENCE_PATTERN = re.compile(r'(?:^|\s+)#+\s*$')
+# Lines markdown-it may read as (or hide) headings where the raw ``# ``/``## `` check disagrees:
+# indented or tab-separated ATX headings, empty ATX headings and blockquotes
+_TREE_ONLY_HEADING_PATTERN = re.compile(r'^(?: {1,3}#{1,6}(?:[ \t]|$)|#{1,6}(?:\t|$)| {0,3}>)')
+_SETEXT_UNDERLINE_PATTERN = re.compile(r'^ {0,3}(?:=+|-+)[ \t]*$')
+# Characters that may change heading text once markdown-it renders inline markup
+INLINE_MARKUP_PATTERN = re.compile(r'[*_`\[\]<>&\\!]')
+
+_KEBAB_CASE_PATTERN = re.compile(r'^[a-z0-9]+(-[a-z0-9]+)*$')
+
+_MARKDOWN_PARSER = MarkdownIt('commonmark')
+
+
+# Node type -> nodes in document order, built on first lookup against each parsed tree
+_NODE_TYPE_INDEXES: WeakKeyDictionary[SyntaxTreeNode, dict[str, list[SyntaxTreeNode]]] = WeakKeyDictionary()
+
+
+def _iter_nodes(node: SyntaxTreeNode) -> Iterator[SyntaxTreeNode]:
+    """Pre-order walk using an explicit stack, so deeply nested lists cannot hit the recursion limit."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        yield current
+        if current.children:
+            stack.extend(reversed(current.children))
+
+
+def _build_node_type_index(tree: SyntaxTreeNode) -> dict[str, list[SyntaxTreeNode]]:
+    index: dict[str, list[SyntaxTreeNode]] = {}
+    for node in _iter_nodes(tree):
+        index.setdefault(node.type, []).append(node)
+    return index
+
+
+class MarkdownSectionIndex:
+    """One-pass H2/H3 offset table over raw markdown.
+
+    Header lines are matched the same way the original line scanner matched them:
+    a line starting with ``## `` (or ``### ``) whose text contains the requested
+    header. The first matching H2 wins, and H3 lookups are confined to that H2.
+
+    The same pass records H1/H2 heading text outside fenced code blocks, so titles
+    and unmapped sections can be discovered without a markdown-it parse. Lines whose
+    heading structure only markdown-it can settle (setext underlines, indented ATX
+    headings, blockquotes) set requires_tree, and heading lookups then use the tree.
+    """
+
+    def __init__(self, markdown: str) -> None:
+        self._markdown = markdown
+        # (header_line, content_start, content_end, h3_sections)
+        self._h2_sections: list[tuple[str, int, int, list[tuple[str, int, int]]]] = []
+        # (level, heading_text) for ATX headings outside fenced code blocks
+        self._headings: list[tuple[int, str]] = []
+        self.requires_tree = False
+
+        h2_sections = self._h2_sections
+        current_h3: list[tuple[str, int, int]] | None = None
+        fence: str | None = None
+        previous_line = ''
+        offset = 0
+        for line in markdown.split('\n'):
+            line_end = offset + len(line)
+            fence_match = _FENCE_PATTERN.match(line)
+            if fence is not None:
+                if (
+                    fence_match
+                    and fence_match.group(1)[0] == fence[0]
+                    and len(fence_match.group(1)) >= len(fence)
+                    and not line[fence_match.end() :].strip()
+                ):
+                    fence = None
+            elif fence_match:
+                fence = fence_match.group(1)
+            elif line.startswith('# '):
+                self._headings.append((1, self._heading_text(line[2:])))
+            elif _TREE_ONLY_HEADING_PATTERN.match(line) or (
+                previous_line.strip() and _SETEXT_UNDERLINE_PATTERN.match(line)
+            ):
+                self.requires_tree = True
+
+            if line.startswith('## '):
+                if h2_sections:
+                    self._close_h2(offset)
+                current_h3 = []
+                h2_sections.append((line, line_end + 1, len(markdown), current_h3))
+                if fence is None:
+                    self._headings.append((2, self._heading_text(line[3:])))
+            elif line.startswith('### ') and current_h3 is not None:
+                if current_h3:
+                    h3_line, h3_start, _ = current_h3[-1]
+                    current_h3[-1] = (h3_line, h3_start, offset)
+                current_h3.append((line, line_end + 1, len(markdown)))
+            previous_line = line
+            offset = line_end + 1
+
+    @staticmethod
+    def _heading_text(text: str) -> str:
+        return _CLOSING_SEQUENCE_PATTERN.sub('', text.strip()).strip()
+
+    def _close_h2(self, end: int) -> None:
+        h2_line, h2_start, _, h3_sections = self._h2_sections[-1]
+        self._h2_sections[-1] = (h2_line, h2_start, end, h3_sections)
+        if h3_sections:
+            h3_line, h3_start, _ = h3_sections[-1]
+            h3_sections[-1] = (h3_line, h3_start, end)
+
+    def _slice(self, start: int, end: int) -> str:
+        if start >= end:
+            return ''
+        return self._markdown[start:end].strip()
+
+    def get_content(self, path: tuple[str, ...]) -> str:
+        h2_header = path[0]
+        h3_header = path[1] if len(path) > 1 else None
+
+        for h2_line, h2_start, h2_end, h3_sections in self._h2_sections:
+            if h2_header not in h2_line:
+                continue
+            if h3_header is None:
+                return self._slice(h2_start, h2_end)
+            for h3_line, h3_start, h3_end in h3_sections:
+                if h3_header in h3_line:
+                    return self._slice(h3_start, h3_end)
+            return ''
+
+        return ''
+
+    def heading_texts(self, level: int) -> list[str]:
+        return [text for heading_level, text in self._headings if heading_level == level]
+
+
+class MarkdownDocument:
+    """Markdown source shared by every extractor during a single parse.
+
+    The raw section index is always built; the markdown-it token tree is only
+    built on first access, so models that never touch it skip tokenization.
+    """
+
+    def __init__(self, markdown: str) -> None:
+        self.markdown = markdown
+
+    @cached_property
+    def sections(self) -> MarkdownSectionIndex:
+        return MarkdownSectionIndex(self.markdown)
+
+    @cached_property
+    def tree(self) -> SyntaxTreeNode:
+        return SyntaxTreeNode(_MARKDOWN_PARSER.parse(self.markdown))
+
+
+class FieldExtraction(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    field_name: str
+    header_path: tuple[str, ...]
+    is_list: bool
+
+
+class ExtractionPlan(BaseModel):
+    """Parse-time facts derived once per MCPModel subclass from its class configuration."""
+
+    model_config = ConfigDict(frozen=True)
+
+    title_prefix: str
+    missing_title_message: str
+    validate_kebab_title: bool
+    extractions: tuple[FieldExtraction, ...]
+    skipped_h2_headers: frozenset[str]
+    captures_additional_sections: bool
+
+    @classmethod
+    def compile(cls, model_class: type['MCPModel']) -> 'ExtractionPlan':
+        # Convert class name from CamelCase to readable format
+        readable_name = (
+            model_class.__name__.replace('Plan', ' Plan')
+            .replace('Spec', ' Spec')
+            .replace('Requirements', ' Requirements')
+        )
+        readable_name = ' '.join(readable_name.split()).lower()
+
+        extractions = tuple(
+            FieldExtraction(
+                # List fields are stored under the base field name
+                field_name=field_name.replace('_list', '') if field_name.endswith('_list') else field_name,
+                header_path=header_path,
+                is_list=field_name.endswith('_list'),
+            )
+            for field_name, header_path in model_class.HEADER_FIELD_MAPPING.items()
+        )
+
+        return cls(
+            title_prefix=model_class.TITLE_PATTERN.replace('# ', '').split(':')[0],
+            missing_title_message=f'Invalid {readable_name} format: missing title',
+            validate_kebab_title=model_class.TITLE_FIELD == 'phase_name',
+            extractions=extractions,
+            skipped_h2_headers=frozenset(
+                {header_path[0] for header_path in model_class.HEADER_FIELD_MAPPING.values()} | {'Metadata'}
+            ),
+            captures_additional_sections='additional_sections' in model_class.model_fields,
+        )
 
 
 class MCPModel(BaseModel, ABC):
@@ -13,25 +221,52 @@ class MCPModel(BaseModel, ABC):
     TITLE_FIELD: ClassVar[str] = ''
     HEADER_FIELD_MAPPING: ClassVar[dict[str, tuple[str, ...]]] = {}
 
-    @classmethod
-    def _find_nodes_by_type(cls, node: SyntaxTreeNode, node_type: str) -> list[SyntaxTreeNode]:
-        nodes = []
+    # Compiled from the class variables above when each subclass is created
+    _EXTRACTION_PLAN: ClassVar[ExtractionPlan]
+
+    # Rendered markdown memo, cleared whenever a model field is assigned.
+    # In-place mutation of container fields (lists, dicts) is not tracked.
+    _rendered_markdown: str | None = PrivateAttr(default=None)
 
-        if node.type == node_type:
-            nodes.append(node)
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._EXTRACTION_PLAN = ExtractionPlan.compile(cls)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._rendered_markdown = None
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._rendered_markdown = None
+        return copied
+
+    def seed_rendered_markdown(self, markdown: str) -> None:
+        """Install previously rendered markdown (e.g. persisted next to a database row).
+
+        The caller guarantees the text matches what _render_markdown() would produce
+        for the current field values.
+        """
+        self._rendered_markdown = markdown
 
-        if hasattr(node, 'children') and node.children:
-            for child in node.children:
-                nodes.extend(cls._find_nodes_by_type(child, node_type))
+    @classmethod
+    def _find_nodes_by_type(cls, node: SyntaxTreeNode, node_type: str) -> list[SyntaxTreeNode]:
+        if node.is_root:
+            index = _NODE_TYPE_INDEXES.get(node)
+            if index is None:
+                index = _build_node_type_index(node)
+                _NODE_TYPE_INDEXES[node] = index
+            return list(index.get(node_type, ()))
 
-        return nodes
+        return [descendant for descendant in _iter_nodes(node) if descendant.type == node_type]
 
     @classmethod
     def _extract_text_content(cls, node: SyntaxTreeNode) -> str:
-        if not hasattr(node, 'children') or not node.children:
-            return getattr(node, 'content', '')
-
-        return ' '.join(cls._extract_text_content(child) for child in node.children)
+        # Joining every level with spaces is the same as joining all leaves in document order
+        return ' '.join(getattr(leaf, 'content', '') for leaf in _iter_nodes(node) if not leaf.children)
 
     @classmethod
     def _extract_content_from_raw_markdown(cls, markdown: str, path: tuple[str, ...]) -> str:
@@ -40,53 +275,7 @@ class MCPModel(BaseModel, ABC):
         This extracts the raw markdown text between headers without parsing,
         preserving code blocks, lists, blockquotes, and all other formatting.
         """
-        h2_header = path[0]
-        h3_header = path[1] if len(path) > 1 else None
-
-        lines = markdown.split('\n')
-
-        # Find h2 header
-        h2_idx = None
-        for i, line in enumerate(lines):
-            if line.startswith('## ') and h2_header in line:
-                h2_idx = i
-                break
-
-        if h2_idx is None:
-            return ''
-
-        # If no h3 specified, get content from h2 until next h2
-        if h3_header is None:
-            content_lines = []
-            for i in range(h2_idx + 1, len(lines)):
-                if lines[i].startswith('## '):
-                    break
-                content_lines.append(lines[i])
-
-            content = '\n'.join(content_lines).strip()
-            return content if content else ''
-
-        # Find h3 header after h2
-        h3_idx = None
-        for i in range(h2_idx + 1, len(lines)):
-            if lines[i].startswith('## '):
-                break  # Stop at next h2
-            if lines[i].startswith('### ') and h3_header in lines[i]:
-                h3_idx = i
-                break
-
-        if h3_idx is None:
-            return ''
-
-        # Extract content from h3 until next h2 or h3
-        content_lines = []
-        for i in range(h3_idx + 1, len(lines)):
-            if lines[i].startswith('## ') or lines[i].startswith('### '):
-                break
-            content_lines.append(lines[i])
-
-        content = '\n'.join(content_lines).strip()
-        return content if content else ''
+        return MarkdownSectionIndex(markdown).get_content(path)
 
     @classmethod
     def _extract_content_by_header_path(cls, tree: SyntaxTreeNode, path: tuple[str, ...]) -> str:
@@ -216,28 +405,48 @@ class MCPModel(BaseModel, ABC):
 
         return []
 
+    @classmethod
+    def _heading_texts(cls, document: MarkdownDocument, level: int) -> list[str]:
+        """Heading text at the given level, read from raw lines when no inline markup is present.
+
+        Headings containing inline markup, and documents with lines the raw scanner
+        cannot classify, fall back to the markdown-it tree so the result matches the
+        tree path (emphasis stripped, entities decoded, setext and nested headings).
+        """
+        raw_texts = document.sections.heading_texts(level)
+        if not document.sections.requires_tree and not any(INLINE_MARKUP_PATTERN.search(text) for text in raw_texts):
+            return raw_texts
+
+        tag = f'h{level}'
+        return [
+            cls._extract_text_content(node).strip()
+            for node in cls._find_nodes_by_type(document.tree, 'heading')
+            if node.tag == tag
+        ]
+
     @classmethod
     def parse_markdown(cls, markdown: str) -> Self:
+        cached = parse_cache.get(cls, markdown)
+        if cached is not None:
+            return cached
+
+        model = cls._parse_markdown(markdown)
+        parse_cache.put(cls, markdown, model)
+        return model
+
+    @classmethod
+    def _parse_markdown(cls, markdown: str) -> Self:
+        plan = cls._EXTRACTION_PLAN
         if cls.TITLE_PATTERN not in markdown:
-            # Convert class name from CamelCase to readable format
-            readable_name = (
-                cls.__name__.replace('Plan', ' Plan').replace('Spec', ' Spec').replace('Requirements', ' Requirements')
-            )
-            readable_name = ' '.join(readable_name.split()).lower()
-            raise ValueError(f'Invalid {readable_name} format: missing title')
+            raise ValueError(plan.missing_title_message)
 
-        md = MarkdownIt('commonmark')
-        tree = SyntaxTreeNode(md.parse(markdown))
+        document = MarkdownDocument(markdown)
 
         fields: dict[str, Any] = {}
 
         # Extract title
-        for node in cls._find_nodes_by_type(tree, 'heading'):
-            if node.tag != 'h1':
-                continue
-            title_text = cls._extract_text_content(node)
-            title_pattern = cls.TITLE_PATTERN.replace('# ', '').split(':')[0]
-            if title_pattern not in title_text:
+        for title_text in cls._heading_texts(document, 1):
+            if plan.title_prefix not in title_text:
                 continue
             # Handle titles with and without colons
             if ':' in title_text:
@@ -247,7 +456,7 @@ class MCPModel(BaseModel, ABC):
                 title_value = title_text.strip()
 
             # Validate strict kebab-case format for spec names
-            if cls.TITLE_FIELD == 'phase_name' and not re.match(r'^[a-z0-9]+(-[a-z0-9]+)*$', title_value):
+            if plan.validate_kebab_title and not _KEBAB_CASE_PATTERN.match(title_value):
                 raise ValueError(
                     f"Invalid spec name format: '{title_value}'. "
                     f'Spec name must be lowercase kebab-case. '
@@ -257,47 +466,40 @@ class MCPModel(BaseModel, ABC):
             fields[cls.TITLE_FIELD] = title_value
             break
 
-        # Extract fields using header path mapping
-        for field_name, header_path in cls.HEADER_FIELD_MAPPING.items():
-            if field_name.endswith('_list'):
-                # Handle list fields - extract as list and store under base field name
-                base_field = field_name.replace('_list', '')
-                extracted_list = cls._extract_list_items_by_header_path(tree, header_path)
-                if extracted_list:  # Only set if we found actual content
-                    # Store the list under the base field name
-                    fields[base_field] = extracted_list
+        # Extract fields using the compiled header path dispatch table
+        for extraction in plan.extractions:
+            extracted: str | list[str]
+            if extraction.is_list:
+                extracted = cls._extract_list_items_by_header_path(document.tree, extraction.header_path)
             else:
-                # Handle content fields - extract raw markdown preserving all formatting
-                extracted_content = cls._extract_content_from_raw_markdown(markdown, header_path)
-                if extracted_content:  # Only set if we found actual content
-                    fields[field_name] = extracted_content
+                # Content fields keep raw markdown, preserving all formatting
+                extracted = document.sections.get_content(extraction.header_path)
+            if extracted:  # Only set if we found actual content
+                fields[extraction.field_name] = extracted
 
-        # Capture unmapped H2 sections in additional_sections (for models that support it)
-        # Build set of mapped H2 headers
-        mapped_h2_headers = {header_path[0] for header_path in cls.HEADER_FIELD_MAPPING.values()}
+        if not plan.captures_additional_sections:
+            return cls(**fields)
 
-        # Find all H2 headers in markdown
+        # Capture unmapped H2 sections (skipping mapped headers and Metadata) in additional_sections
         additional_sections: dict[str, str] = {}
-        for node in cls._find_nodes_by_type(tree, 'heading'):
-            if node.tag != 'h2':
-                continue
-            h2_text = cls._extract_text_content(node).strip()
-
-            # Skip if this H2 is in mapped headers or is Metadata
-            if h2_text in mapped_h2_headers or h2_text == 'Metadata':
+        for h2_text in cls._heading_texts(document, 2):
+            if h2_text in plan.skipped_h2_headers:
                 continue
 
-            # Extract content for this unmapped H2 section
-            content = cls._extract_content_from_raw_markdown(markdown, (h2_text,))
+            content = document.sections.get_content((h2_text,))
             if content:  # Only store if there's actual content
                 additional_sections[h2_text] = content
 
-        # Set additional_sections if we found any unmapped sections
         if additional_sections:
             fields['additional_sections'] = additional_sections
 
         return cls(**fields)
 
-    @abstractmethod
     def build_markdown(self) -> str:
+        if self._rendered_markdown is None:
+            self._rendered_markdown = self._render_markdown()
+        return self._rendered_markdown
+
+    @abstractmethod
+    def _render_markdown(self) -> str:
         pass
@@ -48,7 +48,7 @@ class BuildPlan(MCPModel):
     security_implementation: str = 'Security Implementation not specified'
     build_status: BuildStatus = BuildStatus.PLANNING
 
-    def build_markdown(self) -> str:
+    def _render_markdown(self) -> str:
         return f"""{self.TITLE_PATTERN}: {self.project_name}
 
 ## Project Overview
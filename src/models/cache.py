@@ -0,0 +1,125 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, TypeVar, cast
+
+
+if TYPE_CHECKING:
+    from .base import MCPModel
+
+
+ModelT = TypeVar('ModelT', bound='MCPModel')
+
+DEFAULT_PARSE_CACHE_MAX_ENTRIES = 256
+DEFAULT_PARSE_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+
+class ParseCache:
+    """Bounded LRU of validated models keyed by model class and markdown content hash.
+
+    Entries are bounded both by count and by the total length of the cached markdown
+    sources. Setting either bound to 0 disables caching. Hits return a deep copy with
+    any default-factory fields (generated ids, timestamps) regenerated, so callers can
+    mutate the result and repeated parses stay indistinguishable from uncached ones.
+    """
+
+    def __init__(
+        self, max_entries: int = DEFAULT_PARSE_CACHE_MAX_ENTRIES, max_bytes: int = DEFAULT_PARSE_CACHE_MAX_BYTES
+    ) -> None:
+        self._entries: OrderedDict[tuple[type, bytes], tuple['MCPModel', int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._size_bytes = 0
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(model_class: type, markdown: str) -> tuple[type, bytes]:
+        return (model_class, hashlib.blake2b(markdown.encode(), digest_size=16).digest())
+
+    @staticmethod
+    def _fresh_copy(model: ModelT) -> ModelT:
+        regenerated = {
+            name: field.get_default(call_default_factory=True)
+            for name, field in type(model).model_fields.items()
+            if field.default_factory is not None and name not in model.model_fields_set
+        }
+        return model.model_copy(update=regenerated, deep=True)
+
+    def get(self, model_class: type[ModelT], markdown: str) -> ModelT | None:
+        if not self.enabled:
+            return None
+
+        key = self._key(model_class, markdown)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        return self._fresh_copy(cast(ModelT, entry[0]))
+
+    def put(self, model_class: type[ModelT], markdown: str, model: ModelT) -> None:
+        size = len(markdown)
+        if not self.enabled or size > self.max_bytes:
+            return
+
+        key = self._key(model_class, markdown)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size_bytes -= previous[1]
+            self._entries[key] = (model.model_copy(deep=True), size)
+            self._size_bytes += size
+            self._evict()
+
+    def _evict(self) -> None:
+        while self._entries and (len(self._entries) > self.max_entries or self._size_bytes > self.max_bytes):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._size_bytes -= size
+            self.evictions += 1
+
+    def configure(self, max_entries: int, max_bytes: int) -> None:
+        with self._lock:
+            self.max_entries = max_entries
+            self.max_bytes = max_bytes
+            if self.enabled:
+                self._evict()
+            else:
+                self._entries.clear()
+                self._size_bytes = 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'size_bytes': self._size_bytes,
+        }
+
+
+parse_cache = ParseCache()
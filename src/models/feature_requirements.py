@@ -50,7 +50,7 @@ class FeatureRequirements(MCPModel):
     wont_have_features: str = "Won't Have Features not specified"
     requirements_status: RequirementsStatus = RequirementsStatus.DRAFT
 
-    def build_markdown(self) -> str:
+    def _render_markdown(self) -> str:
         return f"""{self.TITLE_PATTERN}: {self.project_name}
 
 ## Overview
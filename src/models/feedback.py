@@ -1,14 +1,172 @@
+import re
 from datetime import datetime
 from typing import Self
 
-from markdown_it import MarkdownIt
 from markdown_it.tree import SyntaxTreeNode
 from pydantic import Field, field_validator
 
-from .base import MCPModel
+from .base import INLINE_MARKUP_PATTERN, MarkdownDocument, MCPModel
 from .enums import CriticAgent
 
 
+# (critic name from title, list item texts, detailed feedback, key issues, recommendations)
+_FeedbackParts = tuple[str, list[str], str, list[str], list[str]]
+
+# (kind, heading level, text, bullet items) where kind is 'heading', 'paragraph' or 'bullet_list'
+_Block = tuple[str, int, str, list[str]]
+
+_HEADING_LINE = re.compile(r'(#{1,3}) ([^#]*[^#\s])$')
+_LABELLED_ITEM_LINE = re.compile(r'- \*\*([^\s*_`\[\]<>&\\!](?:[^*_`\[\]<>&\\!]*[^\s*_`\[\]<>&\\!])?)\*\*(.*)$')
+_PLAIN_TEXT_START = re.compile(r'[A-Za-z0-9]')
+_ORDERED_ITEM_START = re.compile(r'\d+[.)]($|\s)')
+_PLACEHOLDER_ITEMS = ('None identified', 'None provided')
+
+
+def _plain_text(text: str) -> bool:
+    return not INLINE_MARKUP_PATTERN.search(text)
+
+
+def _scan_blocks(markdown: str) -> list[_Block] | None:
+    """Split markdown into top-level blocks when every line is one the layout scanner understands.
+
+    Only ATX headings up to H3, single-line ``-`` bullet items (plain or with a bold
+    label) and plain paragraphs without inline markup are accepted. Anything else
+    (fences, indentation, nested or ordered lists, emphasis, links, entities) returns
+    None so the caller can fall back to the markdown-it tree.
+    """
+    if '\r' in markdown or '\0' in markdown:
+        return None
+
+    blocks: list[_Block] = []
+    paragraph: list[str] = []
+    items: list[str] | None = None
+    previous_kind = 'blank'
+
+    for line in markdown.split('\n'):
+        stripped = line.rstrip()
+        if not stripped:
+            if paragraph:
+                blocks.append(('paragraph', 0, '  '.join(paragraph), []))
+                paragraph = []
+            previous_kind = 'blank'
+            continue
+        if stripped[0] in ' \t':
+            return None
+
+        if stripped.startswith('#'):
+            heading = _HEADING_LINE.match(stripped)
+            if heading is None or not _plain_text(heading.group(2)):
+                return None
+            if paragraph:
+                blocks.append(('paragraph', 0, '  '.join(paragraph), []))
+                paragraph = []
+            items = None
+            blocks.append(('heading', len(heading.group(1)), heading.group(2).strip(), []))
+            previous_kind = 'heading'
+            continue
+
+        if stripped.startswith('- '):
+            labelled = _LABELLED_ITEM_LINE.match(stripped)
+            if labelled is not None:
+                label, tail = labelled.groups()
+                if not _plain_text(tail):
+                    return None
+                # The tree yields empty text nodes around the strong node when nothing else is there
+                item_text = f' {label} {tail}'
+            else:
+                item_text = stripped[2:]
+                if not _PLAIN_TEXT_START.match(item_text) or not _plain_text(item_text):
+                    return None
+                if _ORDERED_ITEM_START.match(item_text):
+                    return None
+            if paragraph:
+                blocks.append(('paragraph', 0, '  '.join(paragraph), []))
+                paragraph = []
+            if items is None or previous_kind not in ('item', 'blank'):
+                items = []
+                blocks.append(('bullet_list', 0, '', items))
+            items.append(item_text)
+            previous_kind = 'item'
+            continue
+
+        # Paragraph line: must not be a lazy continuation of a list item or start another block type
+        if previous_kind == 'item' or not _PLAIN_TEXT_START.match(stripped) or not _plain_text(stripped):
+            return None
+        if _ORDERED_ITEM_START.match(stripped):
+            return None
+        items = None
+        paragraph.append(stripped)
+        previous_kind = 'paragraph'
+
+    if paragraph:
+        blocks.append(('paragraph', 0, '  '.join(paragraph), []))
+    return blocks
+
+
+def _section_blocks(blocks: list[_Block], h2_header: str, h3_header: str | None = None) -> list[_Block]:
+    start = next(
+        (i for i, block in enumerate(blocks) if block[0] == 'heading' and block[1] == 2 and block[2] == h2_header),
+        None,
+    )
+    if start is None:
+        return []
+
+    if h3_header is not None:
+        for i in range(start + 1, len(blocks)):
+            block = blocks[i]
+            if block[0] == 'heading' and block[1] == 2:
+                return []
+            if block[0] == 'heading' and block[1] == 3 and block[2] == h3_header:
+                start = i
+                break
+        else:
+            return []
+
+    stop_levels = (2,) if h3_header is None else (2, 3)
+    section: list[_Block] = []
+    for block in blocks[start + 1 :]:
+        if block[0] == 'heading' and block[1] in stop_levels:
+            break
+        section.append(block)
+    return section
+
+
+def _scan_conforming_layout(markdown: str) -> _FeedbackParts | None:
+    """Line-oriented parse of the layout emitted by ``CriticFeedback.build_markdown``.
+
+    Produces exactly what the markdown-it tree walk would for the documents it accepts,
+    and returns None for anything outside that subset.
+    """
+    blocks = _scan_blocks(markdown)
+    if blocks is None:
+        return None
+
+    critic_name = 'UNKNOWN'
+    for block in blocks:
+        if block[0] == 'heading' and block[1] == 1 and 'Critic Feedback:' in block[2]:
+            critic_name = block[2].split(':', 1)[1].strip()
+            break
+
+    item_texts = [item.strip() for block in blocks for item in block[3]]
+
+    analysis_parts: list[str] = []
+    for block in _section_blocks(blocks, 'Analysis'):
+        if block[0] == 'paragraph':
+            analysis_parts.append(block[2].strip())
+        elif block[0] == 'bullet_list':
+            analysis_parts.append(' '.join(block[3]).strip())
+    detailed_feedback = '\n\n'.join(analysis_parts).strip()
+
+    def list_items(h3_header: str) -> list[str]:
+        for block in _section_blocks(blocks, 'Issues and Recommendations', h3_header):
+            if block[0] == 'bullet_list':
+                items = [item.strip() for item in block[3]]
+                return [item for item in items if item and item not in _PLACEHOLDER_ITEMS]
+        return []
+
+    return critic_name, item_texts, detailed_feedback, list_items('Key Issues'), list_items('Recommendations')
+
+
 class CriticFeedback(MCPModel):
     loop_id: str
     critic_agent: CriticAgent
@@ -32,11 +190,14 @@ class CriticFeedback(MCPModel):
         return self.overall_score
 
     @classmethod
-    def parse_markdown(cls, markdown: str) -> Self:
-        md = MarkdownIt('commonmark')
-        tree = SyntaxTreeNode(md.parse(markdown))
+    def _parse_markdown(cls, markdown: str) -> Self:
+        parts = _scan_conforming_layout(markdown)
+        if parts is None:
+            parts = cls._extract_parts_from_tree(MarkdownDocument(markdown).tree)
+        return cls._from_parts(parts)
 
-        fields = {}
+    @classmethod
+    def _extract_parts_from_tree(cls, tree: SyntaxTreeNode) -> _FeedbackParts:
         critic_name = 'UNKNOWN'
 
         # Extract title
@@ -49,8 +210,25 @@ class CriticFeedback(MCPModel):
                 break
 
         # Extract all field data from lists
-        for item in cls._find_nodes_by_type(tree, 'list_item'):
-            text = cls._extract_text_content(item).strip()
+        item_texts = [cls._extract_text_content(item).strip() for item in cls._find_nodes_by_type(tree, 'list_item')]
+
+        # Extract detailed feedback
+        detailed_feedback = cls._extract_content_by_header_path(tree, ('Analysis',))
+
+        # Extract issues and recommendations using a special list extraction method
+        key_issues = cls._extract_list_items_by_header_path(tree, ('Issues and Recommendations', 'Key Issues'))
+        recommendations = cls._extract_list_items_by_header_path(
+            tree, ('Issues and Recommendations', 'Recommendations')
+        )
+
+        return critic_name, item_texts, detailed_feedback, key_issues, recommendations
+
+    @classmethod
+    def _from_parts(cls, parts: _FeedbackParts) -> Self:
+        critic_name, item_texts, detailed_feedback, key_issues, recommendations = parts
+
+        fields = {}
+        for text in item_texts:
             if ':' not in text:
                 continue
             field_part, value_part = text.split(':', 1)
@@ -62,19 +240,6 @@ class CriticFeedback(MCPModel):
             model_field_name = field_mapping.get(field_name, field_name)
             fields[model_field_name] = field_value
 
-        # Extract detailed feedback
-        detailed_feedback = cls._extract_content_by_header_path(tree, ('Analysis',))
-
-        # Extract key issues and recommendations
-        key_issues = []
-        recommendations = []
-
-        # Extract issues and recommendations using a special list extraction method
-        key_issues = cls._extract_list_items_by_header_path(tree, ('Issues and Recommendations', 'Key Issues'))
-        recommendations = cls._extract_list_items_by_header_path(
-            tree, ('Issues and Recommendations', 'Recommendations')
-        )
-
         # Set defaults for missing fields
         if 'loop_id' not in fields:
             fields['loop_id'] = 'unknown'
@@ -130,7 +295,7 @@ class CriticFeedback(MCPModel):
             recommendations=recommendations,
         )
 
-    def build_markdown(self) -> str:
+    def _render_markdown(self) -> str:
         issues_md = '\n'.join([f'- {issue}' for issue in self.key_issues]) if self.key_issues else '- None identified'
         recommendations_md = (
             '\n'.join([f'- {rec}' for rec in self.recommendations]) if self.recommendations else '- None provided'
@@ -99,7 +99,7 @@ class PlanCompletionReport(MCPModel):
             raise ValueError(f'Plan completion status must be one of: {", ".join(valid_statuses)}')
         return v
 
-    def build_markdown(self) -> str:
+    def _render_markdown(self) -> str:
         return f"""# {self.report_title}
 
 ## Plan Quality
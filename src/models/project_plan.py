@@ -74,7 +74,7 @@ class ProjectPlan(MCPModel):
     documentation_standards: str = 'Documentation Standards not specified'
     project_status: ProjectStatus = ProjectStatus.DRAFT
 
-    def build_markdown(self) -> str:
+    def _render_markdown(self) -> str:
         return f"""{self.TITLE_PATTERN}: {self.project_name}
 
 ## Executive Summary
@@ -1,3 +1,4 @@
+from collections.abc import Iterator, Sequence
 from typing import ClassVar
 
 from .base import MCPModel
@@ -49,9 +50,8 @@ class Roadmap(MCPModel):
     performance_targets: str = 'Performance Targets not specified'
     roadmap_status: RoadmapStatus = RoadmapStatus.DRAFT
 
-    def build_markdown(self, specs: list[TechnicalSpec] | None = None) -> str:
-        spec_count = len(specs) if specs else 0
-        roadmap_metadata = f"""{self.TITLE_PATTERN}: {self.project_name}
+    def _render_markdown(self) -> str:
+        return f"""{self.TITLE_PATTERN}: {self.project_name}
 
 ## Project Details
 
@@ -113,13 +113,42 @@ class Roadmap(MCPModel):
 
 ### Status
 {self.roadmap_status.value}
-
-### Spec Count
-{spec_count}
 """
+
+    def build_metadata_markdown(self) -> str:
+        """Memoized roadmap document without the spec count and spec sections."""
+        return super().build_markdown()
+
+    def iter_markdown(
+        self,
+        specs: Sequence[TechnicalSpec] | None = None,
+        spec_count: int | None = None,
+        include_metadata: bool = True,
+        sections: Sequence[str] | None = None,
+    ) -> Iterator[str]:
+        """Yield the roadmap document incrementally, one section at a time.
+
+        spec_count overrides the reported count when specs is only a window of the
+        roadmap's specs. With include_metadata=False only the spec sections are yielded.
+        sections limits each spec to those sections (see TechnicalSpec.build_sections_markdown);
+        a spec without any of them is rendered as its title only.
+        """
+        specs = specs or []
+        if include_metadata:
+            yield self.build_metadata_markdown()
+            yield f'\n### Spec Count\n{len(specs) if spec_count is None else spec_count}\n'
+
         # Append full TechnicalSpec markdown for round-trip consistency
-        if specs:
-            specs_markdown = '\n\n'.join(spec.build_markdown() for spec in specs)
-            return roadmap_metadata + '\n' + specs_markdown
+        for index, spec in enumerate(specs):
+            if index:
+                yield '\n\n'
+            elif include_metadata:
+                yield '\n'
+            if sections is None:
+                yield spec.build_markdown()
+                continue
+            available = {name.lower() for name in spec.section_names()}
+            yield spec.build_sections_markdown([name for name in sections if name.strip().lower() in available])
 
-        return roadmap_metadata
+    def build_markdown(self, specs: list[TechnicalSpec] | None = None) -> str:
+        return ''.join(self.iter_markdown(specs))
@@ -1,3 +1,4 @@
+from collections.abc import Mapping, Sequence
 from typing import ClassVar
 from uuid import uuid4
 
@@ -7,6 +8,10 @@ from .base import MCPModel
 from .enums import SpecStatus
 
 
+# Initial-spec fields that updates and patches never change
+FROZEN_SPEC_FIELDS = ('objectives', 'scope', 'dependencies', 'deliverables')
+
+
 class TechnicalSpec(MCPModel):
     # Class configuration for MCPModel
     TITLE_PATTERN: ClassVar[str] = '# Technical Specification'
@@ -60,7 +65,7 @@ class TechnicalSpec(MCPModel):
     version: int = 1
     spec_status: SpecStatus = SpecStatus.DRAFT
 
-    def build_markdown(self) -> str:
+    def _render_markdown(self) -> str:
         sections = [f'{self.TITLE_PATTERN}: {self.phase_name}']
 
         sections.append('\n## Overview')
@@ -112,3 +117,118 @@ class TechnicalSpec(MCPModel):
         sections.append(f'\n### Status\n{self.spec_status.value}')
 
         return '\n'.join(sections) + '\n'
+
+    def _section_entries(self) -> list[tuple[str, str | None, str | None]]:
+        # (H2 header, H3 header or None, content) in the same order _render_markdown emits them
+        entries: list[tuple[str, str | None, str | None]] = []
+        metadata: list[tuple[str, str | None, str | None]] = []
+        for field_name, (h2_header, h3_header) in self.HEADER_FIELD_MAPPING.items():
+            value = getattr(self, field_name)
+            content = value.value if isinstance(value, SpecStatus) else value
+            target = metadata if h2_header == 'Metadata' else entries
+            target.append((h2_header, h3_header, None if content is None else str(content)))
+
+        for section_name, section_content in (self.additional_sections or {}).items():
+            entries.append((section_name, None, section_content))
+
+        return entries + metadata
+
+    def section_names(self) -> list[str]:
+        names: list[str] = []
+        for h2_header, h3_header, _ in self._section_entries():
+            for name in (h2_header, h3_header):
+                if name is not None and name not in names:
+                    names.append(name)
+        return names
+
+    def build_sections_markdown(self, section_names: Sequence[str]) -> str:
+        """Render only the requested sections, straight from the stored fields.
+
+        Names match H2 groups (e.g. 'System Design'), H3 sections (e.g. 'Architecture')
+        or additional_sections keys, case-insensitively. Requested sections without
+        content are omitted, and output keeps document order under the spec title.
+
+        Raises:
+            ValueError: If any requested name is not a section of this spec
+        """
+        requested = {name.strip().lower() for name in section_names}
+        available = {name.lower() for name in self.section_names()}
+        unknown = [name for name in section_names if name.strip().lower() not in available]
+        if unknown:
+            raise ValueError(
+                f'Unknown spec section(s): {", ".join(unknown)}. Available sections: {", ".join(self.section_names())}'
+            )
+
+        sections = [f'{self.TITLE_PATTERN}: {self.phase_name}']
+        open_h2: str | None = None
+        for h2_header, h3_header, content in self._section_entries():
+            if not content:
+                continue
+            if h2_header.lower() not in requested and (h3_header is None or h3_header.lower() not in requested):
+                continue
+            if h3_header is None:
+                sections.append(f'\n## {h2_header}\n{content}')
+                open_h2 = None
+                continue
+            if open_h2 != h2_header:
+                sections.append(f'\n## {h2_header}')
+                open_h2 = h2_header
+            sections.append(f'\n### {h3_header}\n{content}')
+
+        return '\n'.join(sections) + '\n'
+
+    def apply_section_patches(self, patches: Mapping[str, str]) -> 'TechnicalSpec':
+        """Return a copy with the given sections replaced, leaving every other field untouched.
+
+        Keys are header paths such as 'System Design/Architecture', a bare H3 name such as
+        'Architecture', or an additional section H2 name such as 'Data Models'. Values are
+        the new section content; an empty value clears an optional section. Iteration and
+        version are not patchable since updates bump them.
+
+        Raises:
+            ValueError: If a key does not resolve to a patchable section or targets a frozen field
+        """
+        h3_fields: dict[str, list[tuple[str, str]]] = {}
+        for field_name, (h2_header, h3_header) in self.HEADER_FIELD_MAPPING.items():
+            h3_fields.setdefault(h3_header.lower(), []).append((h2_header.lower(), field_name))
+        mapped_h2_headers = {h2_header.lower() for h2_header, _ in self.HEADER_FIELD_MAPPING.values()}
+
+        field_updates: dict[str, str | None] = {}
+        additional_sections = dict(self.additional_sections or {})
+        for key, value in patches.items():
+            path = [part.strip() for part in key.split('/') if part.strip()]
+            content = value.strip()
+
+            if len(path) == 1 and path[0].lower() not in h3_fields:
+                if path[0].lower() in mapped_h2_headers:
+                    raise ValueError(f"Section '{key}' groups several sections; patch its H3 sections instead")
+                if content:
+                    additional_sections[path[0]] = content
+                else:
+                    additional_sections.pop(path[0], None)
+                continue
+
+            if len(path) not in (1, 2):
+                raise ValueError(f"Invalid section path '{key}': expected 'H2/H3' or a single section name")
+            candidates = [
+                field_name
+                for h2_header, field_name in h3_fields.get(path[-1].lower(), [])
+                if len(path) == 1 or h2_header == path[0].lower()
+            ]
+            if len(candidates) != 1:
+                raise ValueError(f"Unknown spec section '{key}'")
+
+            field_name = candidates[0]
+            if field_name in FROZEN_SPEC_FIELDS:
+                raise ValueError(f"Section '{key}' is frozen after the initial spec and cannot be patched")
+            if field_name in ('iteration', 'version'):
+                raise ValueError(f"Section '{key}' is managed automatically and cannot be patched")
+            field_updates[field_name] = content or None
+
+        return TechnicalSpec.model_validate(
+            {
+                **self.model_dump(),
+                **field_updates,
+                'additional_sections': additional_sections or None,
+            }
+        )
@@ -75,10 +75,12 @@ class RespecAITool(Enum):
     # Loop Management Tools
     INITIALIZE_REFINEMENT_LOOP = 'mcp__respec-ai__initialize_refinement_loop'
     DECIDE_LOOP_NEXT_ACTION = 'mcp__respec-ai__decide_loop_next_action'
+    DECIDE_LOOPS_NEXT_ACTION = 'mcp__respec-ai__decide_loops_next_action'
     GET_LOOP_STATUS = 'mcp__respec-ai__get_loop_status'
     LIST_ACTIVE_LOOPS = 'mcp__respec-ai__list_active_loops'
     GET_LOOP_FEEDBACK_SUMMARY = 'mcp__respec-ai__get_loop_feedback_summary'
     GET_LOOP_IMPROVEMENT_ANALYSIS = 'mcp__respec-ai__get_loop_improvement_analysis'
+    GET_LOOP_ANALYTICS = 'mcp__respec-ai__get_loop_analytics'
     GET_PREVIOUS_OBJECTIVE_FEEDBACK = 'mcp__respec-ai__get_previous_objective_feedback'
     STORE_CURRENT_OBJECTIVE_FEEDBACK = 'mcp__respec-ai__store_current_objective_feedback'
 
@@ -99,11 +101,14 @@ class RespecAITool(Enum):
     # Roadmap Management Tools
     CREATE_ROADMAP = 'mcp__respec-ai__create_roadmap'
     GET_ROADMAP = 'mcp__respec-ai__get_roadmap'
+    GET_ROADMAP_PAGE = 'mcp__respec-ai__get_roadmap_page'
 
     # Spec Management Tools
     GET_SPEC_MARKDOWN = 'mcp__respec-ai__get_spec_markdown'
+    GET_SPEC_SECTIONS = 'mcp__respec-ai__get_spec_sections'
     STORE_SPEC = 'mcp__respec-ai__store_spec'
     UPDATE_SPEC = 'mcp__respec-ai__update_spec'
+    PATCH_SPEC = 'mcp__respec-ai__patch_spec'
     LIST_SPECS = 'mcp__respec-ai__list_specs'
     DELETE_SPEC = 'mcp__respec-ai__delete_spec'
     LINK_LOOP_TO_SPEC = 'mcp__respec-ai__link_loop_to_spec'
@@ -1,7 +1,14 @@
 import logging
 import os
 
-from src.utils.state_manager import InMemoryStateManager, PostgresStateManager, StateManager
+from src.utils.setting_configs import database_settings, mcp_settings
+from src.utils.state_manager import (
+    CachedStateManager,
+    InMemoryStateManager,
+    PostgresCacheInvalidationChannel,
+    PostgresStateManager,
+    StateManager,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -24,12 +31,26 @@ async def create_state_manager_async() -> StateManager:
     logger.info(f'Initializing state manager: {manager_type}')
 
     if manager_type == 'memory':
-        return InMemoryStateManager()
+        return InMemoryStateManager(
+            snapshot_every=mcp_settings.state_snapshot_every,
+            snapshot_on_error=mcp_settings.state_snapshot_on_error,
+            max_spec_versions=mcp_settings.spec_history_size,
+        )
     elif manager_type == 'database':
         manager = PostgresStateManager()
         await manager.initialize()
         logger.info('PostgresStateManager initialized')
-        return manager
+        # LISTEN needs a session-pooled connection, which PgBouncer in transaction mode does not provide
+        if database_settings.cache_size == 0 or database_settings.pgbouncer_mode:
+            return manager
+        cached_manager = CachedStateManager(
+            manager,
+            max_entries=database_settings.cache_size,
+            channel=PostgresCacheInvalidationChannel(),
+            ttl=database_settings.cache_ttl or None,
+        )
+        await cached_manager.start()
+        return cached_manager
     else:
         raise ValueError(f'Unknown STATE_MANAGER value: {manager_type}. Valid options: "memory", "database"')
 
@@ -58,7 +79,11 @@ def create_state_manager() -> StateManager:
     logger.info(f'Initializing state manager: {manager_type}')
 
     if manager_type == 'memory':
-        return InMemoryStateManager()
+        return InMemoryStateManager(
+            snapshot_every=mcp_settings.state_snapshot_every,
+            snapshot_on_error=mcp_settings.state_snapshot_on_error,
+            max_spec_versions=mcp_settings.spec_history_size,
+        )
     else:
         raise ValueError(f'Unknown STATE_MANAGER value: {manager_type}. Valid options: "memory", "database"')
 
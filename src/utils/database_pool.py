@@ -3,6 +3,7 @@ import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+from src.utils.prepared_statements import statement_registry
 from src.utils.setting_configs import database_settings
 
 
@@ -19,6 +20,10 @@ class DatabasePool:
 
         logger.info(f'Initializing database pool: {database_settings.url.split("@")[1]}')
 
+        # Behind PgBouncer a later transaction may land on a backend that never saw our
+        # PREPARE, so both the statement catalog and asyncpg's implicit cache are disabled.
+        statement_registry.prepare = not database_settings.pgbouncer_mode
+
         self._pool = await asyncpg.create_pool(
             dsn=database_settings.url,
             min_size=database_settings.pool_min_size,
@@ -26,6 +31,8 @@ class DatabasePool:
             timeout=database_settings.pool_timeout,
             command_timeout=database_settings.command_timeout,
             max_inactive_connection_lifetime=database_settings.max_inactive_connection_lifetime,
+            statement_cache_size=0 if database_settings.pgbouncer_mode else 100,
+            init=statement_registry.prepare_connection,
         )
 
         logger.info('Database pool initialized')
@@ -38,6 +45,10 @@ class DatabasePool:
         await self._pool.close()
         self._pool = None
 
+    async def connect(self) -> asyncpg.Connection:
+        """Open a dedicated connection outside the pool, for sessions held open such as LISTEN."""
+        return await asyncpg.connect(dsn=database_settings.url, command_timeout=database_settings.command_timeout)
+
     @asynccontextmanager
     async def acquire(self) -> AsyncGenerator[asyncpg.Connection, None]:
         if self._pool is None:
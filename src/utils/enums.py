@@ -32,6 +32,12 @@ class LoopStatus(Enum):
     REFINE = 'refine'
 
 
+class LoopArtifactKind(Enum):
+    ANALYSIS = 'analysis'
+    BUILD_PLAN = 'build_plan'
+    COMPLETION_REPORT = 'completion_report'
+
+
 class OperationStatus(Enum):
     SUCCESS = 'success'
     ERROR = 'error'
@@ -34,6 +34,9 @@ class RoadmapNotFoundError(RoadmapError): ...
 class SpecNotFoundError(RoadmapError): ...
 
 
+class SpecVersionConflictError(RoadmapError): ...
+
+
 class ProjectPlanError(Exception): ...
 
 
@@ -1,7 +1,10 @@
+import bisect
 import uuid
+from collections import Counter
 from datetime import datetime
+from itertools import accumulate
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from src.models.feedback import CriticFeedback
 from src.models.roadmap import Roadmap
 from src.utils.enums import HealthState, LoopStatus, LoopType, OperationStatus
@@ -13,6 +16,15 @@ class MCPRoadMapResponse(BaseModel):
     roadmap: Roadmap
 
 
+class RoadmapPage(BaseModel):
+    project_name: str
+    markdown: str
+    offset: int
+    spec_count: int
+    total_specs: int
+    next_offset: int | None = None
+
+
 class MCPResponse(BaseModel):
     id: str
     status: LoopStatus
@@ -26,6 +38,206 @@ class OperationResponse(BaseModel):
     message: str = ''
 
 
+def counted_percentile(counts: Counter[int], fraction: float) -> float:
+    """Percentile of the values a Counter holds, without expanding it into a list."""
+    # Linear interpolation between closest ranks, as Postgres percentile_cont does
+    values = sorted(value for value, count in counts.items() if count > 0)
+    rank_ends = list(accumulate(counts[value] for value in values))
+    position = fraction * (rank_ends[-1] - 1)
+    lower = int(position)
+    upper = min(lower + 1, rank_ends[-1] - 1)
+    lower_value = values[bisect.bisect_right(rank_ends, lower)]
+    upper_value = values[bisect.bisect_right(rank_ends, upper)]
+    return lower_value + (upper_value - lower_value) * (position - lower)
+
+
+class ScoreDistribution(BaseModel):
+    minimum: int
+    p25: float
+    median: float
+    p75: float
+    maximum: int
+    mean: float
+
+    @classmethod
+    def from_counts(cls, score_counts: Counter[int]) -> 'ScoreDistribution':
+        present = [score for score, count in score_counts.items() if count > 0]
+        total = sum(score_counts.values())
+        return cls(
+            minimum=min(present),
+            p25=counted_percentile(score_counts, 0.25),
+            median=counted_percentile(score_counts, 0.5),
+            p75=counted_percentile(score_counts, 0.75),
+            maximum=max(present),
+            mean=sum(score * count for score, count in score_counts.items()) / total,
+        )
+
+
+class LoopSummary(BaseModel):
+    """Outcome of one loop, as counted by the loop analytics."""
+
+    loop_type: LoopType
+    status: LoopStatus
+    current_score: int
+    assessments: int
+    stagnated: bool
+
+
+class LoopTypeAnalytics(BaseModel):
+    """Aggregate outcomes of every loop of one type, for tuning LoopConfig.
+
+    Covers stored loops and the summaries of loops evicted by the history limit.
+    Iterations count critic assessments. A loop counts as stagnated if two successive
+    assessments each improved on the previous one by less than the type's
+    improvement_threshold. The score distribution covers the latest score of every
+    assessed loop.
+    """
+
+    loop_type: LoopType
+    loop_count: int
+    completed_count: int
+    mean_iterations_to_completion: float | None = None
+    median_iterations_to_completion: float | None = None
+    stagnation_rate: float = 0.0
+    score_distribution: ScoreDistribution | None = None
+
+
+class LoopOutcomeTotals:
+    """Running outcome counts for one loop type, folded from LoopSummary values.
+
+    Completion iterations and latest scores are kept as value counts, so memory is
+    bounded by the score and iteration ranges rather than the number of loops, and
+    the analytics derived from them stay exact.
+    """
+
+    def __init__(self) -> None:
+        self.loop_count = 0
+        self.completed_count = 0
+        self.stagnated_count = 0
+        self.completion_iterations: Counter[int] = Counter()
+        self.latest_scores: Counter[int] = Counter()
+
+    def add(self, summary: LoopSummary) -> None:
+        self.loop_count += 1
+        if summary.assessments:
+            self.latest_scores[summary.current_score] += 1
+        if summary.status == LoopStatus.COMPLETED:
+            self.completed_count += 1
+            self.completion_iterations[summary.assessments] += 1
+        if summary.stagnated:
+            self.stagnated_count += 1
+
+    def merge(self, other: 'LoopOutcomeTotals') -> None:
+        self.loop_count += other.loop_count
+        self.completed_count += other.completed_count
+        self.stagnated_count += other.stagnated_count
+        self.completion_iterations.update(other.completion_iterations)
+        self.latest_scores.update(other.latest_scores)
+
+    def analytics(self, loop_type: LoopType) -> LoopTypeAnalytics:
+        iterations = self.completion_iterations
+        return LoopTypeAnalytics(
+            loop_type=loop_type,
+            loop_count=self.loop_count,
+            completed_count=self.completed_count,
+            mean_iterations_to_completion=(
+                sum(value * count for value, count in iterations.items()) / self.completed_count
+                if self.completed_count
+                else None
+            ),
+            median_iterations_to_completion=counted_percentile(iterations, 0.5) if self.completed_count else None,
+            stagnation_rate=self.stagnated_count / self.loop_count,
+            score_distribution=ScoreDistribution.from_counts(self.latest_scores) if self.latest_scores else None,
+        )
+
+
+class FeedbackStats:
+    """Running aggregates over a loop's critic feedback, updated one entry at a time.
+
+    Score deltas telescope, so the mean improvement only needs the first, previous and
+    latest scores. Issue counts accumulate in a Counter, and recurring issues are kept
+    in first-seen order as they reach RECURRING_THRESHOLD occurrences. An issue is first
+    seen at (feedback index, position in that entry's key_issues), which is also how the
+    database persists it.
+    """
+
+    RECURRING_THRESHOLD = 2
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.latest: CriticFeedback | None = None
+        self.issue_counts: Counter[str] = Counter()
+        self._first_score = 0
+        self._previous_score = 0
+        self._latest_score = 0
+        self._first_seen: dict[str, tuple[int, int]] = {}
+        self._recurring: list[tuple[tuple[int, int], str]] = []
+
+    @classmethod
+    def from_history(cls, feedback_history: list[CriticFeedback]) -> 'FeedbackStats':
+        stats = cls()
+        for feedback in feedback_history:
+            stats.add(feedback)
+        return stats
+
+    @classmethod
+    def from_aggregates(
+        cls,
+        count: int,
+        first_score: int,
+        previous_score: int,
+        latest_score: int,
+        issues: dict[str, tuple[tuple[int, int], int]],
+        latest: CriticFeedback | None = None,
+    ) -> 'FeedbackStats':
+        """Restore stats from persisted aggregates; issues maps issue -> (first seen, occurrences)."""
+        stats = cls()
+        stats.count = count
+        stats.latest = latest
+        stats._first_score = first_score
+        stats._previous_score = previous_score
+        stats._latest_score = latest_score
+        for issue, (first_seen, occurrences) in issues.items():
+            stats._first_seen[issue] = first_seen
+            stats.issue_counts[issue] = occurrences
+            if occurrences >= cls.RECURRING_THRESHOLD:
+                stats._recurring.append((first_seen, issue))
+        stats._recurring.sort()
+        return stats
+
+    def add(self, feedback: CriticFeedback) -> None:
+        index = self.count
+        score = feedback.overall_score
+        if index == 0:
+            self._first_score = score
+        self._previous_score = self._latest_score
+        self._latest_score = score
+        self.count += 1
+        self.latest = feedback
+
+        for position, issue in enumerate(feedback.key_issues):
+            first_seen = self._first_seen.setdefault(issue, (index, position))
+            self.issue_counts[issue] += 1
+            if self.issue_counts[issue] == self.RECURRING_THRESHOLD:
+                bisect.insort(self._recurring, (first_seen, issue))
+
+    @property
+    def mean_improvement(self) -> float:
+        if self.count < 2:
+            return 0.0
+        return (self._latest_score - self._first_score) / (self.count - 1)
+
+    @property
+    def last_improvement(self) -> int:
+        if self.count < 2:
+            return 0
+        return self._latest_score - self._previous_score
+
+    def recurring_issues(self, limit: int | None = None) -> list[str]:
+        recurring = self._recurring if limit is None else self._recurring[:limit]
+        return [issue for _, issue in recurring]
+
+
 class LoopState(BaseModel):
     model_config = ConfigDict(validate_assignment=True)
 
@@ -39,10 +251,39 @@ class LoopState(BaseModel):
     feedback_history: list[CriticFeedback] = Field(default_factory=list)
     updated_at: datetime = Field(default_factory=datetime.now)
 
+    _feedback_stats: FeedbackStats = PrivateAttr(default_factory=FeedbackStats)
+
+    def __eq__(self, other: object) -> bool:
+        # _feedback_stats is derived from feedback_history, so only the fields decide equality
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
     @property
     def mcp_response(self) -> MCPResponse:
         return MCPResponse(id=self.id, status=self.status)
 
+    @property
+    def feedback_stats(self) -> FeedbackStats:
+        """Aggregates over the loop's whole feedback history.
+
+        Seeded stats keep covering the whole history when feedback_history only holds
+        the newest entries (a loop loaded with a feedback_limit). They are rebuilt once
+        from feedback_history if it was changed without add_feedback.
+        """
+        history = self.feedback_history
+        stats = self._feedback_stats
+        if stats.latest is not (history[-1] if history else None) or stats.count < len(history):
+            stats = self._feedback_stats = FeedbackStats.from_history(history)
+        return stats
+
+    def seed_feedback_stats(self, stats: FeedbackStats) -> None:
+        """Install aggregates persisted next to the loop, covering its full feedback history.
+
+        stats.latest must be the last entry of feedback_history (None when it is empty).
+        """
+        self._feedback_stats = stats
+
     def is_first_iteration(self) -> bool:
         return self.iteration == 1
 
@@ -86,7 +327,9 @@ class LoopState(BaseModel):
         return all(improvement < threshold for improvement in recent_improvements)
 
     def add_feedback(self, feedback: CriticFeedback) -> None:
+        stats = self.feedback_stats
         self.feedback_history.append(feedback)
+        stats.add(feedback)
         self.add_score(feedback.quality_score)
         self.updated_at = datetime.now()
 
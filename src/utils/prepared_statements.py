@@ -0,0 +1,195 @@
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from asyncpg import Connection, InvalidCachedStatementError, Record
+from asyncpg.prepared_stmt import PreparedStatement
+
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar('R')
+
+
+class Statement:
+    """A named SQL statement in a ``StatementRegistry`` catalog.
+
+    Calls go through the registry, which runs the statement's per-connection prepared
+    handle when one exists and falls back to plain query text otherwise.
+    """
+
+    def __init__(self, registry: 'StatementRegistry', name: str, query: str) -> None:
+        self.registry = registry
+        self.name = name
+        self.query = query
+
+    async def execute(self, conn: Connection, *args: Any) -> str:
+        return await self.registry.execute(conn, self, *args)
+
+    async def executemany(self, conn: Connection, args: list[tuple[Any, ...]]) -> None:
+        await self.registry.executemany(conn, self, args)
+
+    async def fetchmany(self, conn: Connection, args: list[tuple[Any, ...]]) -> list[Record]:
+        return await self.registry.fetchmany(conn, self, args)
+
+    async def fetch(self, conn: Connection, *args: Any) -> list[Record]:
+        return await self.registry.fetch(conn, self, *args)
+
+    async def fetchrow(self, conn: Connection, *args: Any) -> Record | None:
+        return await self.registry.fetchrow(conn, self, *args)
+
+    async def fetchval(self, conn: Connection, *args: Any) -> Any:
+        return await self.registry.fetchval(conn, self, *args)
+
+
+class StatementRegistry:
+    """Catalog of SQL statements prepared lazily per pooled connection, with per-statement timing.
+
+    ``prepare_connection`` is installed as the pool's ``init`` hook and starts tracking the
+    connection; each statement is then parsed and planned on that connection the first
+    time it runs there, so a connection only prepares the statements it actually uses.
+    Prepared handles are tracked by server backend pid and dropped when the connection
+    terminates. A handle invalidated by a schema change is re-prepared and the call
+    retried once, unless the connection is inside a transaction, which the failed call
+    has already aborted.
+
+    With ``prepare`` disabled (PgBouncer transaction mode, where a server-side
+    prepared statement may not exist on the backend serving the next transaction),
+    statements run as plain query text and the pool should be created with
+    ``statement_cache_size=0`` so asyncpg uses unnamed statements only.
+    """
+
+    def __init__(self, prepare: bool = True) -> None:
+        self.prepare = prepare
+        self._statements: dict[str, Statement] = {}
+        self._prepared: dict[int, dict[str, PreparedStatement]] = {}
+        self._timings: dict[str, list[float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._statements
+
+    def register(self, name: str, query: str) -> Statement:
+        if name in self._statements:
+            raise ValueError(f'Statement already registered: {name}')
+        statement = Statement(self, name, query)
+        self._statements[name] = statement
+        return statement
+
+    async def prepare_connection(self, conn: Connection) -> None:
+        if not self.prepare:
+            return
+
+        pid = conn.get_server_pid()
+        prepared: dict[str, PreparedStatement] = {}
+        self._prepared[pid] = prepared
+
+        def _forget(_: Connection) -> None:
+            if self._prepared.get(pid) is prepared:
+                del self._prepared[pid]
+
+        conn.add_termination_listener(_forget)
+        logger.debug('Tracking prepared statements on connection %d', pid)
+
+    async def _prepared_for(self, conn: Connection, statement: Statement) -> PreparedStatement | None:
+        if not self._prepared:
+            return None
+        prepared = self._prepared.get(conn.get_server_pid())
+        if prepared is None:
+            return None
+        handle = prepared.get(statement.name)
+        if handle is None:
+            handle = prepared[statement.name] = await conn.prepare(statement.query)
+        return handle
+
+    async def _run(
+        self,
+        conn: Connection,
+        statement: Statement,
+        run_text: Callable[[], Awaitable[R]],
+        run_prepared: Callable[[PreparedStatement], Awaitable[R]],
+    ) -> R:
+        started = time.perf_counter()
+        try:
+            prepared = await self._prepared_for(conn, statement)
+            if prepared is None:
+                return await run_text()
+            try:
+                return await run_prepared(prepared)
+            except InvalidCachedStatementError:
+                handles = self._prepared.get(conn.get_server_pid(), {})
+                if handles.get(statement.name) is prepared:
+                    del handles[statement.name]
+                if conn.is_in_transaction():
+                    raise
+                logger.debug('Re-preparing invalidated statement %s', statement.name)
+                prepared = await self._prepared_for(conn, statement)
+                if prepared is None:
+                    return await run_text()
+                return await run_prepared(prepared)
+        finally:
+            self._record(statement, started)
+
+    def _record(self, statement: Statement, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        timing = self._timings.get(statement.name)
+        if timing is None:
+            self._timings[statement.name] = [1, elapsed, elapsed]
+            return
+        timing[0] += 1
+        timing[1] += elapsed
+        if elapsed > timing[2]:
+            timing[2] = elapsed
+
+    async def execute(self, conn: Connection, statement: Statement, *args: Any) -> str:
+        async def run_prepared(prepared: PreparedStatement) -> str:
+            await prepared.fetch(*args)
+            return prepared.get_statusmsg()
+
+        return await self._run(conn, statement, lambda: conn.execute(statement.query, *args), run_prepared)
+
+    async def executemany(self, conn: Connection, statement: Statement, args: list[tuple[Any, ...]]) -> None:
+        await self._run(
+            conn,
+            statement,
+            lambda: conn.executemany(statement.query, args),
+            lambda prepared: prepared.executemany(args),
+        )
+
+    async def fetchmany(self, conn: Connection, statement: Statement, args: list[tuple[Any, ...]]) -> list[Record]:
+        return await self._run(
+            conn,
+            statement,
+            lambda: conn.fetchmany(statement.query, args),
+            lambda prepared: prepared.fetchmany(args),
+        )
+
+    async def fetch(self, conn: Connection, statement: Statement, *args: Any) -> list[Record]:
+        return await self._run(
+            conn, statement, lambda: conn.fetch(statement.query, *args), lambda prepared: prepared.fetch(*args)
+        )
+
+    async def fetchrow(self, conn: Connection, statement: Statement, *args: Any) -> Record | None:
+        return await self._run(
+            conn, statement, lambda: conn.fetchrow(statement.query, *args), lambda prepared: prepared.fetchrow(*args)
+        )
+
+    async def fetchval(self, conn: Connection, statement: Statement, *args: Any) -> Any:
+        return await self._run(
+            conn, statement, lambda: conn.fetchval(statement.query, *args), lambda prepared: prepared.fetchval(*args)
+        )
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        return {
+            name: {'calls': calls, 'total_ms': total * 1000, 'mean_ms': total * 1000 / calls, 'max_ms': longest * 1000}
+            for name, (calls, total, longest) in self._timings.items()
+        }
+
+    def reset_stats(self) -> None:
+        self._timings.clear()
+
+
+statement_registry = StatementRegistry()
@@ -62,8 +62,25 @@ class MCPSettings(BaseSettings):
         description='Log file path. Set to "stdout" for container environments, or absolute path for file logging. None = stderr only',
     )
 
+    # Markdown parse cache (content-addressed, shared by all MCPModel.parse_markdown calls)
+    parse_cache_max_entries: int = Field(
+        default=256, ge=0, description='Maximum number of cached parsed models. 0 disables the parse cache'
+    )
+    parse_cache_max_bytes: int = Field(
+        default=16 * 1024 * 1024, ge=0, description='Maximum total markdown size (characters) held by the parse cache'
+    )
+
     # State Manager Configuration
     state_manager: str = Field(default='memory', description='State manager type: memory or database')
+    spec_history_size: int = Field(
+        default=10, ge=0, description='Prior spec versions retained per spec by the in-memory state manager'
+    )
+    state_snapshot_every: int = Field(
+        default=0, ge=0, description='Log a full in-memory state snapshot every N state manager calls. 0 disables'
+    )
+    state_snapshot_on_error: bool = Field(
+        default=False, description='Log a full in-memory state snapshot when a state manager call raises'
+    )
 
     @field_validator('state_manager')
     @classmethod
@@ -93,6 +110,20 @@ class DatabaseSettings(BaseSettings):
     pool_timeout: float = Field(default=30.0, ge=1.0, le=120.0)
     command_timeout: float = Field(default=60.0, ge=1.0, le=300.0)
     max_inactive_connection_lifetime: float = Field(default=300.0, ge=60.0)
+    pgbouncer_mode: bool = Field(
+        default=False,
+        description='Skip server-side prepared statements so the pool works behind PgBouncer in transaction mode',
+    )
+    cache_size: int = Field(
+        default=256,
+        ge=0,
+        description='Specs, roadmaps, project plans and loops kept by the read-through state cache (0 disables it)',
+    )
+    cache_ttl: float = Field(
+        default=60.0,
+        ge=0,
+        description='Seconds a cached state entry is served before it is re-read (0 keeps entries until invalidated)',
+    )
 
 
 loop_config = LoopConfig()
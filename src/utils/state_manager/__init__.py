@@ -1,6 +1,15 @@
 from .base import StateManager, normalize_spec_name
+from .cached import CachedStateManager
 from .in_memory import InMemoryStateManager, Queue
-from .postgres import PostgresStateManager
+from .postgres import PostgresCacheInvalidationChannel, PostgresStateManager
 
 
-__all__ = ['InMemoryStateManager', 'PostgresStateManager', 'StateManager', 'normalize_spec_name', 'Queue']
+__all__ = [
+    'CachedStateManager',
+    'InMemoryStateManager',
+    'PostgresCacheInvalidationChannel',
+    'PostgresStateManager',
+    'StateManager',
+    'normalize_spec_name',
+    'Queue',
+]
@@ -1,20 +1,22 @@
 import logging
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from typing import TypeVar
 
+from src.models.feedback import CriticFeedback
 from src.models.project_plan import ProjectPlan
 from src.models.roadmap import Roadmap
 from src.models.spec import TechnicalSpec
-from src.utils.loop_state import LoopState, MCPResponse
+from src.utils.enums import LoopArtifactKind, LoopStatus, LoopType
+from src.utils.errors import SpecNotFoundError
+from src.utils.loop_state import LoopState, LoopTypeAnalytics, MCPResponse
 
 
 logger = logging.getLogger('state_manager')
 
 T = TypeVar('T')
 
-FROZEN_SPEC_FIELDS = ('objectives', 'scope', 'dependencies', 'deliverables')
-
 
 def normalize_spec_name(spec_name: str) -> str:
     """
@@ -45,22 +47,96 @@ def normalize_spec_name(spec_name: str) -> str:
     return normalized
 
 
+def rank_spec_matches(normalized_partial: str, spec_names: Iterable[str]) -> list[str]:
+    """Order candidate spec names best-first: prefix matches, then closest in length, then alphabetically."""
+    return sorted(
+        spec_names,
+        key=lambda name: (not name.startswith(normalized_partial), len(name) - len(normalized_partial), name),
+    )
+
+
 class StateManager(ABC):
     # Loop Management
     @abstractmethod
     async def add_loop(self, loop: LoopState, project_name: str) -> None: ...
 
     @abstractmethod
-    async def get_loop(self, loop_id: str) -> LoopState: ...
+    async def get_loop(self, loop_id: str, feedback_limit: int | None = None) -> LoopState:
+        """
+        Return a loop with its feedback history.
+
+        feedback_limit bounds how many of the most recent feedback entries a backend
+        must load (None loads all). Backends that hold loops in memory may return the
+        full history, so callers still slice with get_recent_feedback.
+        """
+        ...
 
     @abstractmethod
-    async def get_loop_status(self, loop_id: str) -> MCPResponse: ...
+    async def get_loop_status(self, loop_id: str) -> MCPResponse:
+        """
+        Return a loop's id and status without loading the rest of the loop.
+
+        Raises:
+            LoopNotFoundError: If the loop does not exist
+        """
+        ...
+
+    @abstractmethod
+    async def loop_exists(self, loop_id: str) -> bool: ...
+
+    @abstractmethod
+    async def append_feedback(self, loop_id: str, feedback: CriticFeedback) -> MCPResponse:
+        """
+        Append critic feedback to a loop and record its score.
+
+        Mirrors LoopState.add_feedback: the score becomes current_score and is appended
+        to score_history, and an initialized loop moves to in_progress.
+
+        Raises:
+            LoopNotFoundError: If the loop does not exist
+        """
+        ...
 
     @abstractmethod
     async def decide_loop_next_action(self, loop_id: str) -> MCPResponse: ...
 
     @abstractmethod
-    async def list_active_loops(self, project_name: str) -> list[MCPResponse]: ...
+    async def decide_loops_next_action(self, loop_ids: list[str]) -> list[MCPResponse]:
+        """
+        Decide the next action for several loops at once, one response per distinct loop id in given order.
+
+        All-or-nothing: if any loop does not exist (LoopNotFoundError) or has no feedback
+        (ValueError), no loop is changed.
+        """
+        ...
+
+    @abstractmethod
+    async def list_active_loops(
+        self,
+        project_name: str,
+        statuses: list[LoopStatus] | None = None,
+        loop_types: list[LoopType] | None = None,
+        after_loop_id: str | None = None,
+        limit: int | None = None,
+    ) -> list[MCPResponse]:
+        """List a project's loops in creation order.
+
+        statuses/loop_types restrict the result when given. Pagination is keyset-based:
+        pass the id of the last loop from the previous page as after_loop_id. An unknown
+        after_loop_id yields an empty page.
+        """
+        ...
+
+    @abstractmethod
+    async def get_loop_analytics(self, project_name: str | None = None) -> list[LoopTypeAnalytics]:
+        """Aggregate stored loops per loop type, across all projects unless project_name is given.
+
+        Loops evicted by the history limit are included through the outcome summaries
+        or totals each backend keeps when evicting them. Only loop types with at least one loop are
+        reported, ordered by loop type value. Backends aggregate in place rather than
+        loading every loop as a LoopState.
+        """
+        ...
 
     @abstractmethod
     async def get_objective_feedback(self, loop_id: str) -> MCPResponse: ...
@@ -68,6 +144,54 @@ class StateManager(ABC):
     @abstractmethod
     async def store_objective_feedback(self, loop_id: str, feedback: str) -> MCPResponse: ...
 
+    # Loop Artifacts (analysis, build plans, completion reports, user feedback)
+    # Artifacts belong to their loop and are discarded when the loop drops out of loop history.
+    @abstractmethod
+    async def store_loop_artifact(self, loop_id: str, kind: LoopArtifactKind, content: str) -> None:
+        """
+        Store a loop's artifact of the given kind, replacing any previous one.
+
+        Replacing an artifact keeps its original position in list_loop_artifacts.
+
+        Raises:
+            LoopNotFoundError: If the loop does not exist
+        """
+        ...
+
+    @abstractmethod
+    async def get_loop_artifact(self, loop_id: str, kind: LoopArtifactKind) -> str | None: ...
+
+    @abstractmethod
+    async def list_loop_artifacts(self, kind: LoopArtifactKind, count: int) -> list[tuple[str, str]]:
+        """
+        Return the last count (loop_id, content) pairs of a kind, in the order they were first stored.
+        """
+        ...
+
+    @abstractmethod
+    async def delete_loop_artifact(self, loop_id: str, kind: LoopArtifactKind) -> str | None:
+        """
+        Delete a loop's artifact of the given kind, returning its content (None if nothing was stored).
+        """
+        ...
+
+    @abstractmethod
+    async def append_user_feedback(self, loop_id: str, feedback: str) -> None:
+        """
+        Append user-provided feedback to a loop.
+
+        Raises:
+            LoopNotFoundError: If the loop does not exist
+        """
+        ...
+
+    @abstractmethod
+    async def get_user_feedback(self, loop_id: str) -> list[str]:
+        """
+        Return a loop's user feedback in the order it was given.
+        """
+        ...
+
     # Roadmap Management
     @abstractmethod
     async def store_roadmap(self, project_name: str, roadmap: Roadmap) -> str: ...
@@ -76,31 +200,84 @@ class StateManager(ABC):
     async def get_roadmap(self, project_name: str) -> Roadmap: ...
 
     @abstractmethod
-    async def get_roadmap_specs(self, project_name: str) -> list[TechnicalSpec]: ...
+    async def get_roadmap_specs(
+        self, project_name: str, offset: int = 0, limit: int | None = None, spec_names: list[str] | None = None
+    ) -> list[TechnicalSpec]:
+        """
+        Return the project's specs in creation order.
+
+        offset/limit select a window (limit=None means all remaining specs);
+        spec_names restricts the result to those specs before windowing.
+        """
+        ...
 
     # Unified Spec Management (replaces InitialSpec + TechnicalSpec separation)
     @abstractmethod
-    async def store_spec(self, project_name: str, spec: TechnicalSpec) -> str: ...
+    async def store_spec(self, project_name: str, spec: TechnicalSpec) -> str:
+        """
+        Insert a spec, or version an existing spec of the same normalized name.
+
+        Versioning an existing spec bumps iteration and version and keeps the frozen
+        fields, as one atomic step so concurrent writers never lose a version.
+        """
+        ...
+
+    async def store_specs_bulk(self, project_name: str, specs: list[TechnicalSpec]) -> list[str]:
+        """Store several specs with the same semantics as calling store_spec for each in order.
+
+        Repeated names within the batch version on top of each other. Backends with a
+        per-call round trip override this to write the whole batch at once.
+        """
+        return [await self.store_spec(project_name, spec) for spec in specs]
 
     @abstractmethod
-    async def update_spec(self, project_name: str, spec_name: str, updated_spec: TechnicalSpec) -> str:
+    async def update_spec(
+        self, project_name: str, spec_name: str, updated_spec: TechnicalSpec, expected_version: int | None = None
+    ) -> str:
         """
         MUST not mutate the following fields:
             - objectives
             - scope
             - dependencies
             - deliverables
+
+        With expected_version, the update only applies if the stored spec is still at that
+        version, so a read-modify-write cannot overwrite a concurrent update.
+
+        Raises:
+            SpecNotFoundError: If the spec does not exist
+            SpecVersionConflictError: If the stored version differs from expected_version
         """
         ...
 
     @abstractmethod
     async def get_spec(self, project_name: str, spec_name: str) -> TechnicalSpec: ...
 
+    async def get_spec_version(self, project_name: str, spec_name: str, version: int) -> TechnicalSpec:
+        """Return a specific version of a spec.
+
+        Backends that keep no version history can only serve the current version.
+
+        Raises:
+            SpecNotFoundError: If the spec does not exist or the version is not retained
+        """
+        spec = await self.get_spec(project_name, spec_name)
+        if spec.version != version:
+            raise SpecNotFoundError(f'Spec version not found: {spec_name} version {version} in project {project_name}')
+        return spec
+
     @abstractmethod
     async def list_specs(self, project_name: str) -> list[str]: ...
 
     @abstractmethod
-    async def resolve_spec_name(self, project_name: str, partial_name: str) -> tuple[str | None, list[str]]: ...
+    async def resolve_spec_name(self, project_name: str, partial_name: str) -> tuple[str | None, list[str]]:
+        """Resolve a partial spec name to (canonical name, ranked candidates).
+
+        Candidates are the specs whose normalized name contains the normalized partial,
+        best match first. An exact match is returned alone; canonical is set only when
+        there is exactly one candidate.
+        """
+        ...
 
     @abstractmethod
     async def delete_spec(self, project_name: str, spec_name: str) -> bool: ...
@@ -0,0 +1,391 @@
+import json
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from time import monotonic
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from src.models.feedback import CriticFeedback
+from src.models.project_plan import ProjectPlan
+from src.models.roadmap import Roadmap
+from src.models.spec import TechnicalSpec
+from src.utils.enums import LoopArtifactKind, LoopStatus, LoopType
+from src.utils.loop_state import LoopState, LoopTypeAnalytics, MCPResponse
+
+from .base import StateManager, logger, normalize_spec_name
+
+
+T = TypeVar('T', bound=BaseModel)
+
+CacheKey = tuple[str, ...]
+
+
+def encode_cache_key(key: CacheKey) -> str:
+    return json.dumps(list(key))
+
+
+def decode_cache_key(payload: str) -> CacheKey:
+    return tuple(json.loads(payload))
+
+
+class ModelCache:
+    """LRU of model instances keyed by entity, e.g. ('spec', project_name, spec_name).
+
+    Invalidation takes a key prefix, so ('spec', project_name) drops every cached spec of
+    a project. Every invalidation bumps a generation counter; a read captures it before
+    going to the backend and only populates the cache if no invalidation happened in
+    between, so a slow read can never re-cache a value a concurrent write replaced.
+
+    With a ttl, entries also expire that many seconds after they were cached, which bounds
+    how long a value can outlive an invalidation that never arrived.
+    """
+
+    def __init__(self, max_entries: int, ttl: float | None = None) -> None:
+        if max_entries < 1:
+            raise ValueError('Cache size must be at least 1')
+        if ttl is not None and ttl <= 0:
+            raise ValueError('Cache TTL must be positive')
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[CacheKey, tuple[Any, float | None]] = OrderedDict()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: CacheKey) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        value, expires_at = entry
+        if expires_at is not None and monotonic() >= expires_at:
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: CacheKey, value: Any, generation: int) -> None:
+        if generation != self._generation:
+            return
+        expires_at = monotonic() + self.ttl if self.ttl is not None else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, prefix: CacheKey) -> None:
+        self._generation += 1
+        stale = [key for key in self._entries if key[: len(prefix)] == prefix]
+        for key in stale:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'expirations': self.expirations,
+        }
+
+
+class CacheInvalidationChannel(ABC):
+    """Broadcasts cache invalidations between server processes sharing one backend."""
+
+    @abstractmethod
+    async def publish(self, keys: list[CacheKey]) -> None: ...
+
+    @abstractmethod
+    async def subscribe(self, on_invalidate: Callable[[CacheKey], None], on_reset: Callable[[], None]) -> None:
+        """
+        Start delivering invalidations published by any process to on_invalidate.
+
+        on_reset is called when delivery is interrupted and invalidations may have been
+        missed; the channel reports listening=False until it is delivering again.
+        """
+        ...
+
+    @property
+    @abstractmethod
+    def listening(self) -> bool: ...
+
+    @abstractmethod
+    async def close(self) -> None: ...
+
+
+class CachedStateManager(StateManager):
+    """Read-through/write-through cache in front of another StateManager.
+
+    get_spec, get_roadmap, get_project_plan and get_loop are served from a ModelCache;
+    every write goes to the wrapped manager first and then invalidates the affected keys,
+    locally and, when a channel is given, in every other process. While the channel is
+    not listening the cache is bypassed, since other processes' writes would go unseen.
+
+    Entries are not checked against the row's version on read. Invalidation keeps them
+    current, ttl expires them in case a notification was lost, and the channel resets the
+    whole cache whenever its listener reconnects. Every caller gets its own deep copy, so
+    mutating a returned model never changes what the next caller sees.
+    """
+
+    def __init__(
+        self,
+        inner: StateManager,
+        max_entries: int = 256,
+        channel: CacheInvalidationChannel | None = None,
+        ttl: float | None = 60.0,
+    ) -> None:
+        self._inner = inner
+        self._cache = ModelCache(max_entries, ttl)
+        self._channel = channel
+        logger.info('CachedStateManager initialized with max_entries=%s, ttl=%s', max_entries, ttl)
+
+    @property
+    def inner(self) -> StateManager:
+        return self._inner
+
+    def cache_stats(self) -> dict[str, int]:
+        return self._cache.stats()
+
+    async def start(self) -> None:
+        if self._channel is not None:
+            await self._channel.subscribe(self._cache.invalidate, self._cache.clear)
+
+    async def close(self) -> None:
+        if self._channel is not None:
+            await self._channel.close()
+        self._cache.clear()
+
+    def _enabled(self) -> bool:
+        return self._channel is None or self._channel.listening
+
+    async def _invalidate(self, *keys: CacheKey) -> None:
+        for key in keys:
+            self._cache.invalidate(key)
+        if self._channel is None:
+            return
+        # Runs after failed writes too; a publish error must not replace the write's own error
+        try:
+            await self._channel.publish(list(keys))
+        except Exception:
+            logger.exception('Failed to publish cache invalidation for %s', list(keys))
+
+    async def _read_through(self, key: CacheKey, load: Callable[[], Awaitable[T]]) -> T:
+        if not self._enabled():
+            return await load()
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
+        generation = self._cache.generation
+        value = await load()
+        self._cache.put(key, value.model_copy(deep=True), generation)
+        return value
+
+    @staticmethod
+    def _spec_key(project_name: str, spec_name: str) -> CacheKey:
+        return ('spec', project_name, normalize_spec_name(spec_name))
+
+    # Loop Management
+    async def add_loop(self, loop: LoopState, project_name: str) -> None:
+        await self._inner.add_loop(loop, project_name)
+        # Adding a loop can evict others from loop history
+        await self._invalidate(('loop',))
+
+    async def get_loop(self, loop_id: str, feedback_limit: int | None = None) -> LoopState:
+        if not self._enabled():
+            return await self._inner.get_loop(loop_id, feedback_limit)
+
+        key = ('loop', loop_id)
+        cached = self._cache.get(key)
+        if cached is not None:
+            loop = cached.model_copy(deep=True)
+            if feedback_limit is not None:
+                loop.feedback_history = loop.feedback_history[max(len(loop.feedback_history) - feedback_limit, 0) :]
+            return loop
+
+        generation = self._cache.generation
+        loop = await self._inner.get_loop(loop_id, feedback_limit)
+        # Only complete feedback histories are cached
+        if feedback_limit is None:
+            self._cache.put(key, loop.model_copy(deep=True), generation)
+        return loop
+
+    async def get_loop_status(self, loop_id: str) -> MCPResponse:
+        if self._enabled():
+            cached = self._cache.get(('loop', loop_id))
+            if cached is not None:
+                return cached.mcp_response
+        return await self._inner.get_loop_status(loop_id)
+
+    async def loop_exists(self, loop_id: str) -> bool:
+        if self._enabled() and self._cache.get(('loop', loop_id)) is not None:
+            return True
+        return await self._inner.loop_exists(loop_id)
+
+    async def append_feedback(self, loop_id: str, feedback: CriticFeedback) -> MCPResponse:
+        try:
+            return await self._inner.append_feedback(loop_id, feedback)
+        finally:
+            await self._invalidate(('loop', loop_id))
+
+    async def decide_loop_next_action(self, loop_id: str) -> MCPResponse:
+        try:
+            return await self._inner.decide_loop_next_action(loop_id)
+        finally:
+            await self._invalidate(('loop', loop_id))
+
+    async def decide_loops_next_action(self, loop_ids: list[str]) -> list[MCPResponse]:
+        try:
+            return await self._inner.decide_loops_next_action(loop_ids)
+        finally:
+            await self._invalidate(*(('loop', loop_id) for loop_id in dict.fromkeys(loop_ids)))
+
+    async def list_active_loops(
+        self,
+        project_name: str,
+        statuses: list[LoopStatus] | None = None,
+        loop_types: list[LoopType] | None = None,
+        after_loop_id: str | None = None,
+        limit: int | None = None,
+    ) -> list[MCPResponse]:
+        return await self._inner.list_active_loops(project_name, statuses, loop_types, after_loop_id, limit)
+
+    async def get_loop_analytics(self, project_name: str | None = None) -> list[LoopTypeAnalytics]:
+        return await self._inner.get_loop_analytics(project_name)
+
+    async def get_objective_feedback(self, loop_id: str) -> MCPResponse:
+        return await self._inner.get_objective_feedback(loop_id)
+
+    async def store_objective_feedback(self, loop_id: str, feedback: str) -> MCPResponse:
+        return await self._inner.store_objective_feedback(loop_id, feedback)
+
+    # Loop Artifacts
+    async def store_loop_artifact(self, loop_id: str, kind: LoopArtifactKind, content: str) -> None:
+        await self._inner.store_loop_artifact(loop_id, kind, content)
+
+    async def get_loop_artifact(self, loop_id: str, kind: LoopArtifactKind) -> str | None:
+        return await self._inner.get_loop_artifact(loop_id, kind)
+
+    async def list_loop_artifacts(self, kind: LoopArtifactKind, count: int) -> list[tuple[str, str]]:
+        return await self._inner.list_loop_artifacts(kind, count)
+
+    async def delete_loop_artifact(self, loop_id: str, kind: LoopArtifactKind) -> str | None:
+        return await self._inner.delete_loop_artifact(loop_id, kind)
+
+    async def append_user_feedback(self, loop_id: str, feedback: str) -> None:
+        await self._inner.append_user_feedback(loop_id, feedback)
+
+    async def get_user_feedback(self, loop_id: str) -> list[str]:
+        return await self._inner.get_user_feedback(loop_id)
+
+    # Roadmap Management
+    async def store_roadmap(self, project_name: str, roadmap: Roadmap) -> str:
+        try:
+            return await self._inner.store_roadmap(project_name, roadmap)
+        finally:
+            await self._invalidate(('roadmap', project_name))
+
+    async def get_roadmap(self, project_name: str) -> Roadmap:
+        return await self._read_through(('roadmap', project_name), lambda: self._inner.get_roadmap(project_name))
+
+    async def get_roadmap_specs(
+        self, project_name: str, offset: int = 0, limit: int | None = None, spec_names: list[str] | None = None
+    ) -> list[TechnicalSpec]:
+        return await self._inner.get_roadmap_specs(project_name, offset, limit, spec_names)
+
+    # Spec Management
+    async def store_spec(self, project_name: str, spec: TechnicalSpec) -> str:
+        try:
+            return await self._inner.store_spec(project_name, spec)
+        finally:
+            await self._invalidate(self._spec_key(project_name, spec.phase_name))
+
+    async def store_specs_bulk(self, project_name: str, specs: list[TechnicalSpec]) -> list[str]:
+        try:
+            return await self._inner.store_specs_bulk(project_name, specs)
+        finally:
+            keys = dict.fromkeys(self._spec_key(project_name, spec.phase_name) for spec in specs)
+            await self._invalidate(*keys)
+
+    async def update_spec(
+        self, project_name: str, spec_name: str, updated_spec: TechnicalSpec, expected_version: int | None = None
+    ) -> str:
+        try:
+            return await self._inner.update_spec(project_name, spec_name, updated_spec, expected_version)
+        finally:
+            await self._invalidate(self._spec_key(project_name, spec_name))
+
+    async def get_spec(self, project_name: str, spec_name: str) -> TechnicalSpec:
+        return await self._read_through(
+            self._spec_key(project_name, spec_name), lambda: self._inner.get_spec(project_name, spec_name)
+        )
+
+    async def get_spec_version(self, project_name: str, spec_name: str, version: int) -> TechnicalSpec:
+        return await self._inner.get_spec_version(project_name, spec_name, version)
+
+    async def list_specs(self, project_name: str) -> list[str]:
+        return await self._inner.list_specs(project_name)
+
+    async def resolve_spec_name(self, project_name: str, partial_name: str) -> tuple[str | None, list[str]]:
+        return await self._inner.resolve_spec_name(project_name, partial_name)
+
+    async def delete_spec(self, project_name: str, spec_name: str) -> bool:
+        try:
+            return await self._inner.delete_spec(project_name, spec_name)
+        finally:
+            await self._invalidate(self._spec_key(project_name, spec_name))
+
+    # Loop-to-Spec Mapping
+    async def link_loop_to_spec(self, loop_id: str, project_name: str, spec_name: str) -> None:
+        await self._inner.link_loop_to_spec(loop_id, project_name, spec_name)
+
+    async def get_spec_by_loop(self, loop_id: str) -> TechnicalSpec:
+        return await self._inner.get_spec_by_loop(loop_id)
+
+    async def update_spec_by_loop(self, loop_id: str, spec: TechnicalSpec) -> None:
+        try:
+            await self._inner.update_spec_by_loop(loop_id, spec)
+        finally:
+            # The linked project is only known to the wrapped manager
+            await self._invalidate(('spec',))
+
+    async def unlink_loop(self, loop_id: str) -> tuple[str, str] | None:
+        return await self._inner.unlink_loop(loop_id)
+
+    # Project Plan Management
+    async def store_project_plan(self, project_name: str, project_plan: ProjectPlan) -> str:
+        try:
+            return await self._inner.store_project_plan(project_name, project_plan)
+        finally:
+            await self._invalidate(('project_plan', project_name))
+
+    async def get_project_plan(self, project_name: str) -> ProjectPlan:
+        return await self._read_through(
+            ('project_plan', project_name), lambda: self._inner.get_project_plan(project_name)
+        )
+
+    async def list_project_plans(self) -> list[str]:
+        return await self._inner.list_project_plans()
+
+    async def delete_project_plan(self, project_name: str) -> bool:
+        try:
+            return await self._inner.delete_project_plan(project_name)
+        finally:
+            await self._invalidate(('project_plan', project_name))
@@ -1,19 +1,24 @@
+import logging
 from collections import deque
 from typing import Generic, TypeVar
 
+from src.models.feedback import CriticFeedback
 from src.models.project_plan import ProjectPlan
 from src.models.roadmap import Roadmap
-from src.models.spec import TechnicalSpec
+from src.models.spec import FROZEN_SPEC_FIELDS, TechnicalSpec
+from src.utils.enums import LoopArtifactKind, LoopStatus, LoopType
 from src.utils.errors import (
     LoopAlreadyExistsError,
     LoopNotFoundError,
     ProjectPlanNotFoundError,
     RoadmapNotFoundError,
     SpecNotFoundError,
+    SpecVersionConflictError,
 )
-from src.utils.loop_state import LoopState, MCPResponse
+from src.utils.loop_state import LoopOutcomeTotals, LoopState, LoopSummary, LoopTypeAnalytics, MCPResponse
 
-from .base import FROZEN_SPEC_FIELDS, StateManager, logger, normalize_spec_name
+from .base import StateManager, logger, normalize_spec_name, rank_spec_matches
+from .tracing import SnapshotSampler, traced
 
 
 T = TypeVar('T')
@@ -35,11 +40,99 @@ class Queue(Generic[T]):
         return dropped_item
 
 
+def _has_stagnated(scores: list[int], improvement_threshold: int) -> bool:
+    return any(
+        middle - first < improvement_threshold and last - middle < improvement_threshold
+        for first, middle, last in zip(scores, scores[1:], scores[2:])
+    )
+
+
+def _summarize_loop(loop: LoopState) -> LoopSummary:
+    scores = [feedback.overall_score for feedback in loop.feedback_history]
+    return LoopSummary(
+        loop_type=loop.loop_type,
+        status=loop.status,
+        current_score=loop.current_score,
+        assessments=len(scores),
+        stagnated=_has_stagnated(scores, loop.loop_type.improvement_threshold),
+    )
+
+
+class SpecNameIndex:
+    """Incremental n-gram index over one project's normalized spec names.
+
+    Every substring of up to GRAM_SIZE characters maps to the names containing it, so
+    short partials are a single lookup and longer ones intersect their trigram sets
+    before a final substring check.
+    """
+
+    GRAM_SIZE = 3
+
+    def __init__(self) -> None:
+        self._names: set[str] = set()
+        self._grams: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
+
+    def _name_grams(self, name: str) -> set[str]:
+        return {
+            name[start : start + size] for size in range(1, self.GRAM_SIZE + 1) for start in range(len(name) - size + 1)
+        }
+
+    def add(self, name: str) -> None:
+        if name in self._names:
+            return
+        self._names.add(name)
+        for gram in self._name_grams(name):
+            self._grams.setdefault(gram, set()).add(name)
+
+    def remove(self, name: str) -> None:
+        if name not in self._names:
+            return
+        self._names.discard(name)
+        for gram in self._name_grams(name):
+            names = self._grams[gram]
+            names.discard(name)
+            if not names:
+                del self._grams[gram]
+
+    def containing(self, partial: str) -> set[str]:
+        if not partial:
+            return set(self._names)
+        if len(partial) <= self.GRAM_SIZE:
+            return set(self._grams.get(partial, ()))
+
+        trigram_sets = sorted(
+            (self._grams.get(partial[start : start + self.GRAM_SIZE], set()) for start in range(len(partial) - 2)),
+            key=len,
+        )
+        candidates = set(trigram_sets[0]).intersection(*trigram_sets[1:])
+        return {name for name in candidates if partial in name}
+
+
 class InMemoryStateManager(StateManager):
-    def __init__(self, max_history_size: int = 10) -> None:
+    def __init__(
+        self,
+        max_history_size: int = 10,
+        snapshot_every: int = 0,
+        snapshot_on_error: bool = False,
+        max_spec_versions: int = 10,
+    ) -> None:
         self._active_loops: dict[str, LoopState] = {}
+        # Secondary index: project_name -> loop ids in creation order (dict keys keep insertion order)
+        self._project_loops: dict[str, dict[str, None]] = {}
+        self._loop_projects: dict[str, str] = {}
         self._loop_history: Queue[str] = Queue(maxlen=max_history_size)
+        # Outcome totals of loops dropped from the history, for analytics (project_name -> loop_type -> totals)
+        self._evicted_loop_totals: dict[str, dict[LoopType, LoopOutcomeTotals]] = {}
         self._objective_feedback: dict[str, str] = {}
+        # Per-loop tool artifacts, evicted together with their loop (kind -> {loop_id -> content})
+        self._loop_artifacts: dict[LoopArtifactKind, dict[str, str]] = {kind: {} for kind in LoopArtifactKind}
+        self._user_feedback: dict[str, list[str]] = {}  # loop_id -> feedback in order given
         self._roadmaps: dict[str, Roadmap] = {}
         self._project_plans: dict[str, ProjectPlan] = {}  # project_name -> ProjectPlan
 
@@ -49,67 +142,143 @@ class InMemoryStateManager(StateManager):
         # Temporary loop-to-spec mapping (for active refinement sessions)
         self._loop_to_spec: dict[str, tuple[str, str]] = {}  # loop_id -> (project_name, spec_name)
 
-        logger.info(f'InMemoryStateManager initialized with max_history_size={max_history_size}')
+        # Spec name lookup for resolve_spec_name, maintained as specs are stored and deleted
+        self._spec_name_indexes: dict[str, SpecNameIndex] = {}
+
+        # Prior spec versions, oldest first, bounded per spec (project_name -> {spec_name -> versions})
+        self._max_spec_versions = max_spec_versions
+        self._spec_history: dict[str, dict[str, deque[TechnicalSpec]]] = {}
+
+        # Full state snapshots are opt-in: every Nth traced call and/or on errors
+        self._snapshot_sampler = SnapshotSampler(every=snapshot_every, on_error=snapshot_on_error)
+
+        logger.info('InMemoryStateManager initialized with max_history_size=%s', max_history_size)
 
     def _log_state(self) -> None:
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         logger.debug(
-            f'State:\n'
-            f'  active_loops={len(self._active_loops)}\n'
-            f'  roadmaps={len(self._roadmaps)}\n'
-            f'  project_plans={len(self._project_plans)}\n'
-            f'  projects_with_specs={len(self._specs)}\n'
-            f'  loop_to_spec_mappings={len(self._loop_to_spec)}\n'
-            f'  objective_feedback={len(self._objective_feedback)}'
+            'State:\n'
+            '  active_loops=%d\n'
+            '  roadmaps=%d\n'
+            '  project_plans=%d\n'
+            '  projects_with_specs=%d\n'
+            '  loop_to_spec_mappings=%d\n'
+            '  objective_feedback=%d',
+            len(self._active_loops),
+            len(self._roadmaps),
+            len(self._project_plans),
+            len(self._specs),
+            len(self._loop_to_spec),
+            len(self._objective_feedback),
         )
 
-    def _log_state_snapshot(self, method_name: str, stage: str) -> None:
+    def _log_state_snapshot(self, method_name: str, stage: str, level: int = logging.DEBUG) -> None:
+        # Only reached for sampled calls (see SnapshotSampler); builds the key listings on demand
+        if not logger.isEnabledFor(level):
+            return
         specs_dict = {proj: list(specs.keys()) for proj, specs in self._specs.items()}
-        logger.debug(
-            f'{method_name} [{stage}] - State snapshot:\n'
-            f'  active_loops={list(self._active_loops.keys())}\n'
-            f'  roadmaps={list(self._roadmaps.keys())}\n'
-            f'  project_plans={list(self._project_plans.keys())}\n'
-            f'  specs_by_project={specs_dict}\n'
-            f'  loop_to_spec={dict(self._loop_to_spec)}\n'
-            f'  objective_feedback_loops={list(self._objective_feedback.keys())}'
+        logger.log(
+            level,
+            '%s [%s] - State snapshot:\n'
+            '  active_loops=%s\n'
+            '  roadmaps=%s\n'
+            '  project_plans=%s\n'
+            '  specs_by_project=%s\n'
+            '  loop_to_spec=%s\n'
+            '  objective_feedback_loops=%s',
+            method_name,
+            stage,
+            list(self._active_loops.keys()),
+            list(self._roadmaps.keys()),
+            list(self._project_plans.keys()),
+            specs_dict,
+            dict(self._loop_to_spec),
+            list(self._objective_feedback.keys()),
         )
 
+    @staticmethod
+    def _next_spec_version(existing_spec: TechnicalSpec, incoming_spec: TechnicalSpec) -> TechnicalSpec:
+        # Copy-on-write: the new version references the incoming and frozen field values
+        # directly instead of dumping and re-validating both specs
+        update: dict[str, object] = {field: getattr(existing_spec, field) for field in FROZEN_SPEC_FIELDS}
+        update['iteration'] = existing_spec.iteration + 1
+        update['version'] = existing_spec.version + 1
+        if incoming_spec.additional_sections is not None:
+            # The only mutable container; don't share it with the caller's instance
+            update['additional_sections'] = dict(incoming_spec.additional_sections)
+        return incoming_spec.model_copy(update=update)
+
+    def _archive_spec_version(self, project_name: str, normalized_name: str, spec: TechnicalSpec) -> None:
+        if self._max_spec_versions <= 0:
+            return
+        project_history = self._spec_history.setdefault(project_name, {})
+        versions = project_history.get(normalized_name)
+        if versions is None:
+            versions = project_history[normalized_name] = deque(maxlen=self._max_spec_versions)
+        versions.append(spec)
+
+    @traced(logger)
     async def add_loop(self, loop: LoopState, project_name: str) -> None:
-        self._log_state_snapshot('add_loop', 'ENTRY')
-        logger.info(f'add_loop: loop_id={loop.id}, project_name={project_name}')
+        logger.info('add_loop: loop_id=%s, project_name=%s', loop.id, project_name)
         if loop.id in self._active_loops:
-            logger.error(f'add_loop failed: Loop already exists: {loop.id}')
+            logger.error('add_loop failed: Loop already exists: %s', loop.id)
             raise LoopAlreadyExistsError(f'Loop already exists: {loop.id}')
         self._active_loops[loop.id] = loop
+        self._project_loops.setdefault(project_name, {})[loop.id] = None
+        self._loop_projects[loop.id] = project_name
         dropped_loop_id = self._loop_history.append(loop.id)
         if dropped_loop_id:
-            logger.info(f'add_loop: Dropped oldest loop from history: {dropped_loop_id}')
-            self._active_loops.pop(dropped_loop_id)
+            logger.info('add_loop: Dropped oldest loop from history: %s', dropped_loop_id)
+            dropped_loop = self._active_loops.pop(dropped_loop_id)
+            dropped_project = self._loop_projects.pop(dropped_loop_id, None)
+            if dropped_project is not None:
+                # Analytics keep covering loops that left the history
+                project_totals = self._evicted_loop_totals.setdefault(dropped_project, {})
+                project_totals.setdefault(dropped_loop.loop_type, LoopOutcomeTotals()).add(
+                    _summarize_loop(dropped_loop)
+                )
+                project_loop_ids = self._project_loops[dropped_project]
+                project_loop_ids.pop(dropped_loop_id, None)
+                if not project_loop_ids:
+                    del self._project_loops[dropped_project]
+            self._objective_feedback.pop(dropped_loop_id, None)
+            self._user_feedback.pop(dropped_loop_id, None)
+            for artifacts in self._loop_artifacts.values():
+                artifacts.pop(dropped_loop_id, None)
         self._log_state()
-        self._log_state_snapshot('add_loop', 'EXIT')
 
-    async def get_loop(self, loop_id: str) -> LoopState:
-        self._log_state_snapshot('get_loop', 'ENTRY')
-        logger.debug(f'get_loop: loop_id={loop_id}')
+    @traced(logger)
+    async def get_loop(self, loop_id: str, feedback_limit: int | None = None) -> LoopState:
+        logger.debug('get_loop: loop_id=%s', loop_id)
         if loop_id in self._active_loops:
-            logger.debug(f'get_loop: Found loop {loop_id}')
-            self._log_state_snapshot('get_loop', 'EXIT')
+            logger.debug('get_loop: Found loop %s', loop_id)
             return self._active_loops[loop_id]
-        logger.error(f'get_loop failed: Loop not found: {loop_id}')
+        logger.error('get_loop failed: Loop not found: %s', loop_id)
         raise LoopNotFoundError(f'Loop not found: {loop_id}')
 
+    @traced(logger)
     async def get_loop_status(self, loop_id: str) -> MCPResponse:
-        self._log_state_snapshot('get_loop_status', 'ENTRY')
-        logger.debug(f'get_loop_status: loop_id={loop_id}')
+        logger.debug('get_loop_status: loop_id=%s', loop_id)
         loop_state = await self.get_loop(loop_id)
         response = loop_state.mcp_response
-        logger.debug(f'get_loop_status: status={response.status}')
-        self._log_state_snapshot('get_loop_status', 'EXIT')
+        logger.debug('get_loop_status: status=%s', response.status)
         return response
 
+    @traced(logger)
+    async def loop_exists(self, loop_id: str) -> bool:
+        return loop_id in self._active_loops
+
+    @traced(logger)
+    async def append_feedback(self, loop_id: str, feedback: CriticFeedback) -> MCPResponse:
+        logger.debug('append_feedback: loop_id=%s, score=%s', loop_id, feedback.overall_score)
+        loop_state = await self.get_loop(loop_id)
+        loop_state.add_feedback(feedback)
+        return loop_state.mcp_response
+
+    @traced(logger)
     async def decide_loop_next_action(self, loop_id: str) -> MCPResponse:
-        self._log_state_snapshot('decide_loop_next_action', 'ENTRY')
-        logger.info(f'decide_loop_next_action: loop_id={loop_id} (retrieving score from feedback internally)')
+        logger.info('decide_loop_next_action: loop_id=%s (retrieving score from feedback internally)', loop_id)
         loop_state = await self.get_loop(loop_id)
 
         # Retrieve latest score from stored critic feedback
@@ -121,88 +290,201 @@ class InMemoryStateManager(StateManager):
         latest_feedback = loop_state.feedback_history[-1]
         current_score = latest_feedback.overall_score
         logger.info(
-            f'decide_loop_next_action: extracted score {current_score} from latest feedback (iteration {latest_feedback.iteration})'
+            'decide_loop_next_action: extracted score %s from latest feedback (iteration %s)',
+            current_score,
+            latest_feedback.iteration,
         )
 
         loop_state.add_score(current_score)
         response = loop_state.decide_next_loop_action()
-        logger.info(f'decide_loop_next_action: decision={response.status}, message={response.message[:100]}')
-        self._log_state_snapshot('decide_loop_next_action', 'EXIT')
+        logger.info('decide_loop_next_action: decision=%s, message=%s', response.status, response.message[:100])
         return response
 
-    async def list_active_loops(self, project_name: str) -> list[MCPResponse]:
-        self._log_state_snapshot('list_active_loops', 'ENTRY')
-        logger.debug(f'list_active_loops: project_name={project_name}')
-        loops = [loop.mcp_response for loop in self._active_loops.values()]
-        logger.debug(f'list_active_loops: Found {len(loops)} active loops')
-        self._log_state_snapshot('list_active_loops', 'EXIT')
+    @traced(logger)
+    async def decide_loops_next_action(self, loop_ids: list[str]) -> list[MCPResponse]:
+        loops = [await self.get_loop(loop_id) for loop_id in dict.fromkeys(loop_ids)]
+
+        # Validate every loop before deciding any, so a bad id leaves the batch untouched
+        for loop_state in loops:
+            if not loop_state.feedback_history:
+                raise ValueError(
+                    f'No feedback available for loop {loop_state.id} - cannot make decision without quality assessment'
+                )
+
+        responses = []
+        for loop_state in loops:
+            loop_state.add_score(loop_state.feedback_history[-1].overall_score)
+            responses.append(loop_state.decide_next_loop_action())
+        return responses
+
+    @traced(logger)
+    async def list_active_loops(
+        self,
+        project_name: str,
+        statuses: list[LoopStatus] | None = None,
+        loop_types: list[LoopType] | None = None,
+        after_loop_id: str | None = None,
+        limit: int | None = None,
+    ) -> list[MCPResponse]:
+        logger.debug(
+            'list_active_loops: project_name=%s, statuses=%s, loop_types=%s, after_loop_id=%s, limit=%s',
+            project_name,
+            statuses,
+            loop_types,
+            after_loop_id,
+            limit,
+        )
+        loop_ids = self._project_loops.get(project_name, {})
+        if after_loop_id is not None and after_loop_id not in loop_ids:
+            return []
+
+        loops: list[MCPResponse] = []
+        skipping = after_loop_id is not None
+        for loop_id in loop_ids:
+            if skipping:
+                skipping = loop_id != after_loop_id
+                continue
+            if limit is not None and len(loops) >= limit:
+                break
+            loop = self._active_loops[loop_id]
+            if statuses is not None and loop.status not in statuses:
+                continue
+            if loop_types is not None and loop.loop_type not in loop_types:
+                continue
+            loops.append(loop.mcp_response)
+        logger.debug('list_active_loops: Found %s active loops', len(loops))
         return loops
 
+    @traced(logger)
+    async def get_loop_analytics(self, project_name: str | None = None) -> list[LoopTypeAnalytics]:
+        loop_ids = self._active_loops if project_name is None else self._project_loops.get(project_name, {})
+        totals: dict[LoopType, LoopOutcomeTotals] = {}
+        for loop_id in loop_ids:
+            loop = self._active_loops[loop_id]
+            totals.setdefault(loop.loop_type, LoopOutcomeTotals()).add(_summarize_loop(loop))
+
+        if project_name is None:
+            evicted = list(self._evicted_loop_totals.values())
+        else:
+            evicted = [self._evicted_loop_totals.get(project_name, {})]
+        for project_totals in evicted:
+            for loop_type, loop_type_totals in project_totals.items():
+                totals.setdefault(loop_type, LoopOutcomeTotals()).merge(loop_type_totals)
+
+        return [
+            totals[loop_type].analytics(loop_type)
+            for loop_type in sorted(totals, key=lambda loop_type: loop_type.value)
+        ]
+
+    @traced(logger)
     async def get_objective_feedback(self, loop_id: str) -> MCPResponse:
-        self._log_state_snapshot('get_objective_feedback', 'ENTRY')
-        logger.debug(f'get_objective_feedback: loop_id={loop_id}')
+        logger.debug('get_objective_feedback: loop_id=%s', loop_id)
         loop_state = await self.get_loop(loop_id)
         feedback = self._objective_feedback.get(loop_id, '')
         has_feedback = bool(feedback)
-        logger.debug(f'get_objective_feedback: has_feedback={has_feedback}')
-        self._log_state_snapshot('get_objective_feedback', 'EXIT')
+        logger.debug('get_objective_feedback: has_feedback=%s', has_feedback)
         return MCPResponse(
             id=loop_id, status=loop_state.status, message=feedback or 'No previous objective feedback found'
         )
 
+    @traced(logger)
     async def store_objective_feedback(self, loop_id: str, feedback: str) -> MCPResponse:
-        self._log_state_snapshot('store_objective_feedback', 'ENTRY')
-        logger.info(f'store_objective_feedback: loop_id={loop_id}, feedback_length={len(feedback)}')
-        logger.debug(f'store_objective_feedback: feedback_preview={feedback[:200]}...')
+        logger.info('store_objective_feedback: loop_id=%s, feedback_length=%s', loop_id, len(feedback))
+        logger.debug('store_objective_feedback: feedback_preview=%s...', feedback[:200])
         loop_state = await self.get_loop(loop_id)
         self._objective_feedback[loop_id] = feedback
         self._log_state()
-        self._log_state_snapshot('store_objective_feedback', 'EXIT')
         return MCPResponse(
             id=loop_id, status=loop_state.status, message=f'Objective feedback stored for loop {loop_id}'
         )
 
+    @traced(logger)
+    async def store_loop_artifact(self, loop_id: str, kind: LoopArtifactKind, content: str) -> None:
+        logger.debug('store_loop_artifact: loop_id=%s, kind=%s, length=%s', loop_id, kind.value, len(content))
+        await self.get_loop(loop_id)
+        self._loop_artifacts[kind][loop_id] = content
+
+    @traced(logger)
+    async def get_loop_artifact(self, loop_id: str, kind: LoopArtifactKind) -> str | None:
+        logger.debug('get_loop_artifact: loop_id=%s, kind=%s', loop_id, kind.value)
+        return self._loop_artifacts[kind].get(loop_id)
+
+    @traced(logger)
+    async def list_loop_artifacts(self, kind: LoopArtifactKind, count: int) -> list[tuple[str, str]]:
+        logger.debug('list_loop_artifacts: kind=%s, count=%s', kind.value, count)
+        if count <= 0:
+            return []
+        return list(self._loop_artifacts[kind].items())[-count:]
+
+    @traced(logger)
+    async def delete_loop_artifact(self, loop_id: str, kind: LoopArtifactKind) -> str | None:
+        logger.info('delete_loop_artifact: loop_id=%s, kind=%s', loop_id, kind.value)
+        return self._loop_artifacts[kind].pop(loop_id, None)
+
+    @traced(logger)
+    async def append_user_feedback(self, loop_id: str, feedback: str) -> None:
+        logger.debug('append_user_feedback: loop_id=%s, length=%s', loop_id, len(feedback))
+        await self.get_loop(loop_id)
+        self._user_feedback.setdefault(loop_id, []).append(feedback)
+
+    @traced(logger)
+    async def get_user_feedback(self, loop_id: str) -> list[str]:
+        logger.debug('get_user_feedback: loop_id=%s', loop_id)
+        return list(self._user_feedback.get(loop_id, ()))
+
+    @traced(logger)
     async def store_roadmap(self, project_name: str, roadmap: Roadmap) -> str:
-        self._log_state_snapshot('store_roadmap', 'ENTRY')
-        logger.info(f'store_roadmap: project_name={project_name}, roadmap_title={roadmap.project_name}')
+        logger.info('store_roadmap: project_name=%s, roadmap_title=%s', project_name, roadmap.project_name)
         self._roadmaps[project_name] = roadmap
 
         self._log_state()
-        self._log_state_snapshot('store_roadmap', 'EXIT')
         return project_name
 
+    @traced(logger)
     async def get_roadmap(self, project_name: str) -> Roadmap:
-        self._log_state_snapshot('get_roadmap', 'ENTRY')
-        logger.debug(f'get_roadmap: project_name={project_name}')
+        logger.debug('get_roadmap: project_name=%s', project_name)
         if project_name not in self._roadmaps:
-            logger.error(f'get_roadmap failed: Roadmap not found for project: {project_name}')
+            logger.error('get_roadmap failed: Roadmap not found for project: %s', project_name)
             raise RoadmapNotFoundError(f'Roadmap not found for project: {project_name}')
         roadmap = self._roadmaps[project_name]
-        logger.debug(f'get_roadmap: Found roadmap {roadmap.project_name}')
-        self._log_state_snapshot('get_roadmap', 'EXIT')
+        logger.debug('get_roadmap: Found roadmap %s', roadmap.project_name)
         return roadmap
 
-    async def get_roadmap_specs(self, project_name: str) -> list[TechnicalSpec]:
-        self._log_state_snapshot('get_roadmap_specs', 'ENTRY')
-        logger.debug(f'get_roadmap_specs: project_name={project_name}')
+    @traced(logger)
+    async def get_roadmap_specs(
+        self, project_name: str, offset: int = 0, limit: int | None = None, spec_names: list[str] | None = None
+    ) -> list[TechnicalSpec]:
+        logger.debug(
+            'get_roadmap_specs: project_name=%s, offset=%s, limit=%s, spec_names=%s',
+            project_name,
+            offset,
+            limit,
+            spec_names,
+        )
 
         if project_name not in self._roadmaps:
-            logger.error(f'get_roadmap_specs failed: Roadmap not found for project: {project_name}')
+            logger.error('get_roadmap_specs failed: Roadmap not found for project: %s', project_name)
             raise RoadmapNotFoundError(f'Roadmap not found for project: {project_name}')
 
-        specs = list(self._specs.get(project_name, {}).values())
-        logger.debug(f'get_roadmap_specs: Found {len(specs)} specs for project {project_name}')
-        self._log_state_snapshot('get_roadmap_specs', 'EXIT')
+        project_specs = self._specs.get(project_name, {})
+        if spec_names is not None:
+            wanted_names = {normalize_spec_name(name) for name in spec_names}
+            specs = [spec for name, spec in project_specs.items() if name in wanted_names]
+        else:
+            specs = list(project_specs.values())
+        specs = specs[offset : None if limit is None else offset + limit]
+        logger.debug('get_roadmap_specs: Found %s specs for project %s', len(specs), project_name)
         return specs
 
     # Unified Spec Management (single source of truth)
+    @traced(logger)
     async def store_spec(self, project_name: str, spec: TechnicalSpec) -> str:
-        self._log_state_snapshot('store_spec', 'ENTRY')
         logger.info(
-            f'store_spec: project_name={project_name}, '
-            f'spec_name={spec.phase_name}, '
-            f'iteration={spec.iteration}, '
-            f'version={spec.version}'
+            'store_spec: project_name=%s, spec_name=%s, iteration=%s, version=%s',
+            project_name,
+            spec.phase_name,
+            spec.iteration,
+            spec.version,
         )
 
         # Store in unified spec storage - initialize project storage if needed
@@ -211,256 +493,264 @@ class InMemoryStateManager(StateManager):
 
         # Normalize spec name for consistent storage
         normalized_name = normalize_spec_name(spec.phase_name)
-        logger.debug(f'store_spec: Normalized "{spec.phase_name}" -> "{normalized_name}"')
+        logger.debug('store_spec: Normalized "%s" -> "%s"', spec.phase_name, normalized_name)
 
         # Auto-increment iteration and version if spec already exists
         # Also preserve frozen fields (objectives, scope, dependencies, deliverables)
-        is_update = normalized_name in self._specs[project_name]
-        if is_update:
-            existing_spec = self._specs[project_name][normalized_name]
-            existing_data = existing_spec.model_dump()
-            new_data = spec.model_dump()
-
-            frozen_fields = {field: existing_data[field] for field in FROZEN_SPEC_FIELDS}
-
-            spec = TechnicalSpec(
-                **{
-                    **new_data,
-                    **frozen_fields,
-                    'iteration': existing_data['iteration'] + 1,
-                    'version': existing_data['version'] + 1,
-                }
-            )
+        existing_spec = self._specs[project_name].get(normalized_name)
+        if existing_spec is not None:
+            spec = self._next_spec_version(existing_spec, spec)
+            self._archive_spec_version(project_name, normalized_name, existing_spec)
             logger.info(
-                f'store_spec: Updating existing spec - '
-                f'iteration: {existing_data["iteration"]} -> {spec.iteration}, '
-                f'version: {existing_data["version"]} -> {spec.version}, '
-                f'frozen fields preserved'
+                'store_spec: Updating existing spec - iteration: %s -> %s, version: %s -> %s, frozen fields preserved',
+                existing_spec.iteration,
+                spec.iteration,
+                existing_spec.version,
+                spec.version,
             )
 
         self._specs[project_name][normalized_name] = spec
+        self._spec_name_indexes.setdefault(project_name, SpecNameIndex()).add(normalized_name)
 
         self._log_state()
-        logger.info(f'store_spec: Successfully stored spec {spec.phase_name} for project {project_name}')
-        self._log_state_snapshot('store_spec', 'EXIT')
+        logger.info('store_spec: Successfully stored spec %s for project %s', spec.phase_name, project_name)
         return spec.phase_name
 
-    async def update_spec(self, project_name: str, spec_name: str, updated_spec: TechnicalSpec) -> str:
-        self._log_state_snapshot('update_spec', 'ENTRY')
+    @traced(logger)
+    async def update_spec(
+        self, project_name: str, spec_name: str, updated_spec: TechnicalSpec, expected_version: int | None = None
+    ) -> str:
         logger.info(
-            f'update_spec: project_name={project_name}, '
-            f'spec_name={spec_name}, '
-            f'updated_iteration={updated_spec.iteration}, '
-            f'updated_version={updated_spec.version}'
+            'update_spec: project_name=%s, spec_name=%s, updated_iteration=%s, updated_version=%s',
+            project_name,
+            spec_name,
+            updated_spec.iteration,
+            updated_spec.version,
         )
 
         # Get existing spec to preserve frozen fields
         existing_spec = await self.get_spec(project_name, spec_name)
+        if expected_version is not None and existing_spec.version != expected_version:
+            logger.warning(
+                'update_spec: Version conflict for %s in project %s: expected %s, stored %s',
+                spec_name,
+                project_name,
+                expected_version,
+                existing_spec.version,
+            )
+            raise SpecVersionConflictError(
+                f'Spec {spec_name} in project {project_name} is at version {existing_spec.version}, '
+                f'expected {expected_version}'
+            )
 
         # Normalize spec name for storage
         normalized_name = normalize_spec_name(spec_name)
 
         # Create new spec with preserved frozen fields and incremented iteration/version
-        existing_data = existing_spec.model_dump()
-        new_data = updated_spec.model_dump()
-
-        frozen_fields = {field: existing_data[field] for field in FROZEN_SPEC_FIELDS}
-
-        final_spec = TechnicalSpec(
-            **{
-                **new_data,
-                **frozen_fields,
-                'iteration': existing_data['iteration'] + 1,
-                'version': existing_data['version'] + 1,
-            }
-        )
+        final_spec = self._next_spec_version(existing_spec, updated_spec)
 
         logger.info(
-            f'update_spec: Preserved frozen fields, '
-            f'iteration: {existing_data["iteration"]} -> {final_spec.iteration}, '
-            f'version: {existing_data["version"]} -> {final_spec.version}'
+            'update_spec: Preserved frozen fields, iteration: %s -> %s, version: %s -> %s',
+            existing_spec.iteration,
+            final_spec.iteration,
+            existing_spec.version,
+            final_spec.version,
         )
 
         # Store the updated spec
+        self._archive_spec_version(project_name, normalized_name, existing_spec)
         self._specs[project_name][normalized_name] = final_spec
 
         self._log_state()
-        logger.info(f'update_spec: Successfully updated spec {spec_name} for project {project_name}')
-        self._log_state_snapshot('update_spec', 'EXIT')
+        logger.info('update_spec: Successfully updated spec %s for project %s', spec_name, project_name)
         return f'Updated spec "{spec_name}" to iteration {final_spec.iteration}, version {final_spec.version}'
 
+    @traced(logger)
     async def get_spec(self, project_name: str, spec_name: str) -> TechnicalSpec:
-        self._log_state_snapshot('get_spec', 'ENTRY')
-        logger.debug(f'get_spec: project_name={project_name}, spec_name={spec_name}')
+        logger.debug('get_spec: project_name=%s, spec_name=%s', project_name, spec_name)
 
         # Normalize spec name for lookup
         normalized_name = normalize_spec_name(spec_name)
-        logger.debug(f'get_spec: Normalized "{spec_name}" -> "{normalized_name}"')
+        logger.debug('get_spec: Normalized "%s" -> "%s"', spec_name, normalized_name)
 
         if project_name not in self._specs or normalized_name not in self._specs[project_name]:
             logger.error(
-                f'get_spec failed: Spec not found: {spec_name} (normalized: {normalized_name}) '
-                f'in project {project_name}'
+                'get_spec failed: Spec not found: %s (normalized: %s) in project %s',
+                spec_name,
+                normalized_name,
+                project_name,
             )
             raise SpecNotFoundError(f'Spec not found: {spec_name} in project {project_name}')
 
         spec = self._specs[project_name][normalized_name]
         logger.debug(
-            f'get_spec: Retrieved spec using normalized name "{normalized_name}" (iteration={spec.iteration}, version={spec.version})'
+            'get_spec: Retrieved spec using normalized name "%s" (iteration=%s, version=%s)',
+            normalized_name,
+            spec.iteration,
+            spec.version,
         )
-        self._log_state_snapshot('get_spec', 'EXIT')
         return spec
 
+    @traced(logger)
+    async def get_spec_version(self, project_name: str, spec_name: str, version: int) -> TechnicalSpec:
+        logger.debug('get_spec_version: project_name=%s, spec_name=%s, version=%s', project_name, spec_name, version)
+        current_spec = await self.get_spec(project_name, spec_name)
+        if current_spec.version == version:
+            return current_spec
+
+        normalized_name = normalize_spec_name(spec_name)
+        for archived_spec in self._spec_history.get(project_name, {}).get(normalized_name, ()):
+            if archived_spec.version == version:
+                return archived_spec
+
+        logger.error(
+            'get_spec_version failed: Version %s of spec %s not retained in project %s',
+            version,
+            spec_name,
+            project_name,
+        )
+        raise SpecNotFoundError(f'Spec version not found: {spec_name} version {version} in project {project_name}')
+
+    @traced(logger)
     async def list_specs(self, project_name: str) -> list[str]:
-        self._log_state_snapshot('list_specs', 'ENTRY')
-        logger.debug(f'list_specs: project_name={project_name}')
+        logger.debug('list_specs: project_name=%s', project_name)
 
         if project_name not in self._specs:
-            logger.debug(f'list_specs: No specs found for project: {project_name}')
-            self._log_state_snapshot('list_specs', 'EXIT')
+            logger.debug('list_specs: No specs found for project: %s', project_name)
             return []
 
         spec_names = list(self._specs[project_name].keys())
-        logger.debug(f'list_specs: Found {len(spec_names)} specs: {spec_names}')
-        self._log_state_snapshot('list_specs', 'EXIT')
+        logger.debug('list_specs: Found %s specs: %s', len(spec_names), spec_names)
         return spec_names
 
+    @traced(logger)
     async def resolve_spec_name(self, project_name: str, partial_name: str) -> tuple[str | None, list[str]]:
-        self._log_state_snapshot('resolve_spec_name', 'ENTRY')
-        logger.debug(f'resolve_spec_name: project_name={project_name}, partial_name={partial_name}')
-
-        # Get all specs for project
-        all_specs = await self.list_specs(project_name)
+        logger.debug('resolve_spec_name: project_name=%s, partial_name=%s', project_name, partial_name)
 
-        if not all_specs:
-            logger.warning(f'No specs found in project {project_name}')
+        name_index = self._spec_name_indexes.get(project_name)
+        if not name_index:
+            logger.warning('No specs found in project %s', project_name)
             return (None, [])
 
         # Normalize partial name for comparison
         normalized_partial = normalize_spec_name(partial_name)
 
         # Try exact match first
-        if normalized_partial in all_specs:
-            logger.info(f'Exact match found: {normalized_partial}')
+        if normalized_partial in name_index:
+            logger.info('Exact match found: %s', normalized_partial)
             return (normalized_partial, [normalized_partial])
 
-        # Fuzzy match: partial contains
-        matches = [spec for spec in all_specs if normalized_partial in spec]
+        # Partial match: names containing the partial, best match first
+        matches = rank_spec_matches(normalized_partial, name_index.containing(normalized_partial))
 
-        logger.info(f'Found {len(matches)} matches for "{partial_name}": {matches}')
+        logger.info('Found %s matches for "%s": %s', len(matches), partial_name, matches)
 
         canonical = matches[0] if len(matches) == 1 else None
-        self._log_state_snapshot('resolve_spec_name', 'EXIT')
         return (canonical, matches)
 
+    @traced(logger)
     async def delete_spec(self, project_name: str, spec_name: str) -> bool:
-        self._log_state_snapshot('delete_spec', 'ENTRY')
-        logger.info(f'delete_spec: project_name={project_name}, spec_name={spec_name}')
+        logger.info('delete_spec: project_name=%s, spec_name=%s', project_name, spec_name)
 
         # Normalize spec name for deletion
         normalized_name = normalize_spec_name(spec_name)
-        logger.debug(f'delete_spec: Normalized "{spec_name}" -> "{normalized_name}"')
+        logger.debug('delete_spec: Normalized "%s" -> "%s"', spec_name, normalized_name)
 
         if project_name not in self._specs or normalized_name not in self._specs[project_name]:
             logger.warning(
-                f'delete_spec: Spec not found: {spec_name} (normalized: {normalized_name}) in project {project_name}'
+                'delete_spec: Spec not found: %s (normalized: %s) in project %s',
+                spec_name,
+                normalized_name,
+                project_name,
             )
-            self._log_state_snapshot('delete_spec', 'EXIT')
             return False
 
         # Remove from specs storage
         del self._specs[project_name][normalized_name]
-        logger.info(f'delete_spec: Removed {spec_name} using normalized name "{normalized_name}" from specs storage')
+        self._spec_history.get(project_name, {}).pop(normalized_name, None)
+        self._spec_name_indexes[project_name].remove(normalized_name)
+        logger.info('delete_spec: Removed %s using normalized name "%s" from specs storage', spec_name, normalized_name)
 
         self._log_state()
-        self._log_state_snapshot('delete_spec', 'EXIT')
         return True
 
     # Loop-to-Spec Mapping (for temporary refinement sessions)
+    @traced(logger)
     async def link_loop_to_spec(self, loop_id: str, project_name: str, spec_name: str) -> None:
-        self._log_state_snapshot('link_loop_to_spec', 'ENTRY')
-        logger.info(f'link_loop_to_spec: loop_id={loop_id}, project_name={project_name}, spec_name={spec_name}')
+        logger.info('link_loop_to_spec: loop_id=%s, project_name=%s, spec_name=%s', loop_id, project_name, spec_name)
 
         # Normalize spec name for consistent linking
         normalized_name = normalize_spec_name(spec_name)
-        logger.debug(f'link_loop_to_spec: Normalized "{spec_name}" -> "{normalized_name}"')
+        logger.debug('link_loop_to_spec: Normalized "%s" -> "%s"', spec_name, normalized_name)
 
         self._loop_to_spec[loop_id] = (project_name, normalized_name)
-        logger.info(f'Linked loop {loop_id} to spec {normalized_name} in project {project_name}')
+        logger.info('Linked loop %s to spec %s in project %s', loop_id, normalized_name, project_name)
         self._log_state()
-        self._log_state_snapshot('link_loop_to_spec', 'EXIT')
 
+    @traced(logger)
     async def get_spec_by_loop(self, loop_id: str) -> TechnicalSpec:
-        self._log_state_snapshot('get_spec_by_loop', 'ENTRY')
-        logger.debug(f'get_spec_by_loop: loop_id={loop_id}')
+        logger.debug('get_spec_by_loop: loop_id=%s', loop_id)
         if loop_id not in self._loop_to_spec:
-            logger.error(f'get_spec_by_loop failed: Loop not linked to any spec: {loop_id}')
+            logger.error('get_spec_by_loop failed: Loop not linked to any spec: %s', loop_id)
             raise LoopNotFoundError(f'Loop not linked to any spec: {loop_id}')
         project_name, spec_name = self._loop_to_spec[loop_id]
-        logger.debug(f'get_spec_by_loop: Loop {loop_id} linked to spec {spec_name} in project {project_name}')
-        self._log_state_snapshot('get_spec_by_loop', 'EXIT')
+        logger.debug('get_spec_by_loop: Loop %s linked to spec %s in project %s', loop_id, spec_name, project_name)
         return await self.get_spec(project_name, spec_name)
 
+    @traced(logger)
     async def update_spec_by_loop(self, loop_id: str, spec: TechnicalSpec) -> None:
-        self._log_state_snapshot('update_spec_by_loop', 'ENTRY')
-        logger.info(f'update_spec_by_loop: loop_id={loop_id}, spec_name={spec.phase_name}')
+        logger.info('update_spec_by_loop: loop_id=%s, spec_name=%s', loop_id, spec.phase_name)
         if loop_id not in self._loop_to_spec:
-            logger.error(f'update_spec_by_loop failed: Loop not linked to any spec: {loop_id}')
+            logger.error('update_spec_by_loop failed: Loop not linked to any spec: %s', loop_id)
             raise LoopNotFoundError(f'Loop not linked to any spec: {loop_id}')
         project_name, spec_name = self._loop_to_spec[loop_id]
-        logger.debug(f'update_spec_by_loop: Updating spec {spec_name} in project {project_name}')
+        logger.debug('update_spec_by_loop: Updating spec %s in project %s', spec_name, project_name)
         await self.store_spec(project_name, spec)
-        self._log_state_snapshot('update_spec_by_loop', 'EXIT')
 
+    @traced(logger)
     async def unlink_loop(self, loop_id: str) -> tuple[str, str] | None:
-        self._log_state_snapshot('unlink_loop', 'ENTRY')
-        logger.info(f'unlink_loop: loop_id={loop_id}')
+        logger.info('unlink_loop: loop_id=%s', loop_id)
         result = self._loop_to_spec.pop(loop_id, None)
         if result:
             project_name, spec_name = result
-            logger.info(f'unlink_loop: Unlinked loop {loop_id} from spec {spec_name} in project {project_name}')
+            logger.info('unlink_loop: Unlinked loop %s from spec %s in project %s', loop_id, spec_name, project_name)
         else:
-            logger.warning(f'unlink_loop: Loop {loop_id} was not linked to any spec')
+            logger.warning('unlink_loop: Loop %s was not linked to any spec', loop_id)
         self._log_state()
-        self._log_state_snapshot('unlink_loop', 'EXIT')
         return result
 
     # Project Plan Management
+    @traced(logger)
     async def store_project_plan(self, project_name: str, project_plan: ProjectPlan) -> str:
-        self._log_state_snapshot('store_project_plan', 'ENTRY')
-        logger.info(f'store_project_plan: project_name={project_name}')
+        logger.info('store_project_plan: project_name=%s', project_name)
         self._project_plans[project_name] = project_plan
         self._log_state()
-        self._log_state_snapshot('store_project_plan', 'EXIT')
         return project_name
 
+    @traced(logger)
     async def get_project_plan(self, project_name: str) -> ProjectPlan:
-        self._log_state_snapshot('get_project_plan', 'ENTRY')
-        logger.debug(f'get_project_plan: project_name={project_name}')
+        logger.debug('get_project_plan: project_name=%s', project_name)
         if project_name not in self._project_plans:
-            logger.error(f'get_project_plan failed: Project plan not found for project: {project_name}')
+            logger.error('get_project_plan failed: Project plan not found for project: %s', project_name)
             raise ProjectPlanNotFoundError(f'Project plan not found for project: {project_name}')
         project_plan = self._project_plans[project_name]
-        logger.debug(f'get_project_plan: Found project plan for {project_name}')
-        self._log_state_snapshot('get_project_plan', 'EXIT')
+        logger.debug('get_project_plan: Found project plan for %s', project_name)
         return project_plan
 
+    @traced(logger)
     async def list_project_plans(self) -> list[str]:
-        self._log_state_snapshot('list_project_plans', 'ENTRY')
         logger.debug('list_project_plans: Listing all project plans')
         plan_names = list(self._project_plans.keys())
-        logger.debug(f'list_project_plans: Found {len(plan_names)} project plans: {plan_names}')
-        self._log_state_snapshot('list_project_plans', 'EXIT')
+        logger.debug('list_project_plans: Found %s project plans: %s', len(plan_names), plan_names)
         return plan_names
 
+    @traced(logger)
     async def delete_project_plan(self, project_name: str) -> bool:
-        self._log_state_snapshot('delete_project_plan', 'ENTRY')
-        logger.info(f'delete_project_plan: project_name={project_name}')
+        logger.info('delete_project_plan: project_name=%s', project_name)
         if project_name not in self._project_plans:
-            logger.error(f'delete_project_plan failed: Project plan not found for project: {project_name}')
+            logger.error('delete_project_plan failed: Project plan not found for project: %s', project_name)
             raise ProjectPlanNotFoundError(f'Project plan not found for project: {project_name}')
         del self._project_plans[project_name]
-        logger.info(f'delete_project_plan: Deleted project plan for {project_name}')
+        logger.info('delete_project_plan: Deleted project plan for %s', project_name)
         self._log_state()
-        self._log_state_snapshot('delete_project_plan', 'EXIT')
         return True
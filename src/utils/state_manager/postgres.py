@@ -1,6 +1,8 @@
+import asyncio
 import json
+from collections.abc import Callable
 
-from asyncpg import Connection
+from asyncpg import Connection, ForeignKeyViolationError, PostgresError
 
 from src.models.project_plan import ProjectPlan
 from src.models.roadmap import Roadmap
@@ -11,17 +13,61 @@ from src.utils.errors import (
     ProjectPlanNotFoundError,
     RoadmapNotFoundError,
     SpecNotFoundError,
+    SpecVersionConflictError,
+)
+from src.utils.loop_state import FeedbackStats, LoopState, LoopTypeAnalytics, MCPResponse, ScoreDistribution
+
+from .base import StateManager, logger, normalize_spec_name
+from .cached import CacheInvalidationChannel, CacheKey, decode_cache_key, encode_cache_key
+from .statements import (
+    APPEND_LOOP_FEEDBACK,
+    DELETE_LOOP_ARTIFACT,
+    DELETE_LOOP_SPEC_MAPPING,
+    DELETE_PROJECT_PLAN,
+    DELETE_SPEC,
+    ENFORCE_LOOP_HISTORY_LIMIT,
+    GET_LOOP,
+    GET_LOOP_ARTIFACT,
+    GET_LOOPS_FOR_DECISION,
+    GET_LOOP_STATUS,
+    GET_LOOP_SPEC_MAPPING,
+    GET_LOOP_USER_FEEDBACK,
+    GET_OBJECTIVE_FEEDBACK,
+    GET_PROJECT_PLAN,
+    GET_ROADMAP,
+    GET_ROADMAP_SPECS,
+    GET_SPEC,
+    INSERT_LOOP,
+    INSERT_LOOP_FEEDBACK,
+    INSERT_LOOP_HISTORY,
+    INSERT_LOOP_USER_FEEDBACK,
+    LIST_ACTIVE_LOOPS,
+    LIST_LOOP_ARTIFACTS,
+    LIST_PROJECT_PLANS,
+    LIST_SPECS,
+    LOOP_ANALYTICS,
+    LOOP_EXISTS,
+    NOTIFY_CACHE_INVALIDATION,
+    REFRESH_LOOP_FEEDBACK_AGGREGATES,
+    RESOLVE_SPEC_NAME,
+    STORE_SPEC_RENDER,
+    UPDATE_LOOP_SCORE,
+    UPDATE_LOOP_SCORES,
+    UPDATE_SPEC,
+    UPSERT_LOOP_ARTIFACT,
+    UPSERT_LOOP_SPEC_MAPPING,
+    UPSERT_OBJECTIVE_FEEDBACK,
+    UPSERT_PROJECT_PLAN,
+    UPSERT_ROADMAP,
+    UPSERT_SPEC,
 )
-from src.utils.loop_state import LoopState, MCPResponse
-
-from .base import FROZEN_SPEC_FIELDS, StateManager, logger, normalize_spec_name
 
 
 from src.utils.database_pool import db_pool
 from src.models.enums import SpecStatus
 from datetime import datetime
 from src.models.feedback import CriticFeedback
-from src.utils.enums import LoopStatus, LoopType
+from src.utils.enums import LoopArtifactKind, LoopStatus, LoopType
 from src.models.enums import RoadmapStatus
 from src.models.enums import ProjectStatus
 
@@ -30,7 +76,7 @@ class PostgresStateManager(StateManager):
     def __init__(self, max_history_size: int = 10) -> None:
         self._max_history_size = max_history_size
         self._initialized = False
-        logger.info(f'PostgresStateManager initialized with max_history_size={max_history_size}')
+        logger.info('PostgresStateManager initialized with max_history_size=%s', max_history_size)
 
     async def initialize(self) -> None:
         if self._initialized:
@@ -53,7 +99,7 @@ class PostgresStateManager(StateManager):
                 else row['additional_sections']
             )
 
-        return TechnicalSpec(
+        spec = TechnicalSpec(
             id=str(row['id']),
             phase_name=row['phase_name'],
             objectives=row['objectives'],
@@ -74,41 +120,76 @@ class PostgresStateManager(StateManager):
             version=row['version'],
             spec_status=SpecStatus(row['spec_status']),
         )
+        if row.get('rendered_markdown'):
+            spec.seed_rendered_markdown(row['rendered_markdown'])
+        return spec
+
+    async def _rows_to_specs(self, conn: Connection, project_name: str, rows: list) -> list[TechnicalSpec]:
+        specs = [self._row_to_spec(row) for row in rows]
+
+        # Updates clear the stored render; write it back so later reads skip rendering
+        renders = [
+            (project_name, row['spec_name'], row['version'], spec.build_markdown())
+            for row, spec in zip(rows, specs)
+            if row.get('rendered_markdown') is None
+        ]
+        if renders:
+            await STORE_SPEC_RENDER.executemany(conn, renders)
+        return specs
 
     async def _enforce_loop_history_limit(self, conn: Connection) -> None:
-        await conn.execute(
-            """
-            DELETE FROM loop_states
-            WHERE id IN (
-                SELECT loop_id FROM loop_history
-                ORDER BY sequence_number DESC
-                OFFSET $1
-            )
-            """,
-            self._max_history_size,
+        await ENFORCE_LOOP_HISTORY_LIMIT.execute(conn, self._max_history_size, *self._loop_thresholds())
+
+    @staticmethod
+    def _row_to_loop(row: dict, feedback_history: list[CriticFeedback] | None = None) -> LoopState:
+        created_at = row['created_at']
+        return LoopState(
+            id=row['id'],
+            loop_type=LoopType(row['loop_type']),
+            status=LoopStatus(row['status']),
+            current_score=row['current_score'],
+            score_history=list(row['score_history']),
+            iteration=row['iteration'],
+            created_at=created_at.isoformat() if isinstance(created_at, datetime) else created_at,
+            updated_at=row['updated_at'],
+            feedback_history=feedback_history or [],
         )
 
-    async def add_loop(self, loop: LoopState, project_name: str) -> None:
-        async with db_pool.acquire() as conn:
-            existing = await conn.fetchval('SELECT id FROM loop_states WHERE id = $1', loop.id)
-
-            if existing:
-                raise LoopAlreadyExistsError(f'Loop already exists: {loop.id}')
+    @staticmethod
+    def _loop_thresholds() -> tuple[list[str], list[int]]:
+        loop_types = list(LoopType)
+        return [loop_type.value for loop_type in loop_types], [
+            loop_type.improvement_threshold for loop_type in loop_types
+        ]
+
+    @staticmethod
+    def _row_to_feedback_stats(row: dict, feedback_list: list[CriticFeedback]) -> FeedbackStats:
+        issues = (
+            json.loads(row['feedback_issues']) if isinstance(row['feedback_issues'], str) else row['feedback_issues']
+        )
+        return FeedbackStats.from_aggregates(
+            count=row['feedback_count'],
+            first_score=row['first_feedback_score'] or 0,
+            previous_score=row['previous_feedback_score'] or 0,
+            latest_score=row['latest_feedback_score'] or 0,
+            issues={
+                issue: ((entry['first_seen'][0], entry['first_seen'][1]), entry['count'])
+                for issue, entry in issues.items()
+            },
+            latest=feedback_list[-1] if feedback_list else None,
+        )
 
-            feedback_json = json.dumps([fb.model_dump(mode='json') for fb in loop.feedback_history])
+    @staticmethod
+    def _feedback_row(loop_id: str, feedback: CriticFeedback) -> tuple:
+        return (loop_id, feedback.iteration, feedback.overall_score, feedback.model_dump_json())
 
-            created_at = (
-                datetime.fromisoformat(loop.created_at) if isinstance(loop.created_at, str) else loop.created_at
-            )
+    async def add_loop(self, loop: LoopState, project_name: str) -> None:
+        created_at = datetime.fromisoformat(loop.created_at) if isinstance(loop.created_at, str) else loop.created_at
 
+        async with db_pool.acquire() as conn:
             async with conn.transaction():
-                await conn.execute(
-                    """
-                    INSERT INTO loop_states (
-                        id, project_name, loop_type, status, current_score,
-                        score_history, iteration, created_at, updated_at, feedback_history
-                    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-                    """,
+                inserted = await INSERT_LOOP.fetchval(
+                    conn,
                     loop.id,
                     project_name,
                     loop.loop_type.value,
@@ -118,58 +199,63 @@ class PostgresStateManager(StateManager):
                     loop.iteration,
                     created_at,
                     loop.updated_at,
-                    feedback_json,
                 )
 
-                await conn.execute('INSERT INTO loop_history (loop_id) VALUES ($1)', loop.id)
+                if inserted is None:
+                    raise LoopAlreadyExistsError(f'Loop already exists: {loop.id}')
+
+                if loop.feedback_history:
+                    await INSERT_LOOP_FEEDBACK.executemany(
+                        conn, [self._feedback_row(loop.id, feedback) for feedback in loop.feedback_history]
+                    )
+                    await REFRESH_LOOP_FEEDBACK_AGGREGATES.execute(conn, loop.id)
+
+                await INSERT_LOOP_HISTORY.execute(conn, loop.id)
                 await self._enforce_loop_history_limit(conn)
 
-        logger.info(f'Added loop {loop.id} to project {project_name}')
+        logger.info('Added loop %s to project %s', loop.id, project_name)
 
-    async def get_loop(self, loop_id: str) -> LoopState:
+    async def get_loop(self, loop_id: str, feedback_limit: int | None = None) -> LoopState:
         async with db_pool.acquire() as conn:
-            row = await conn.fetchrow(
-                """
-                SELECT id, loop_type, status, current_score, score_history,
-                       iteration, created_at, updated_at, feedback_history
-                FROM loop_states WHERE id = $1
-                """,
-                loop_id,
-            )
+            row = await GET_LOOP.fetchrow(conn, loop_id, feedback_limit)
 
             if not row:
                 raise LoopNotFoundError(f'Loop not found: {loop_id}')
 
-            feedback_data = (
-                json.loads(row['feedback_history'])
-                if isinstance(row['feedback_history'], str)
-                else row['feedback_history']
-            )
-            feedback_list = [CriticFeedback.model_validate(fb) for fb in feedback_data]
+            feedback_list = [
+                CriticFeedback.model_validate_json(fb) if isinstance(fb, str) else CriticFeedback.model_validate(fb)
+                for fb in row['feedback_history']
+            ]
 
-            created_at_str = (
-                row['created_at'].isoformat() if isinstance(row['created_at'], datetime) else row['created_at']
-            )
-            updated_at_dt = row['updated_at']
-
-            return LoopState(
-                id=row['id'],
-                loop_type=LoopType(row['loop_type']),
-                status=LoopStatus(row['status']),
-                current_score=row['current_score'],
-                score_history=list(row['score_history']),
-                iteration=row['iteration'],
-                created_at=created_at_str,
-                updated_at=updated_at_dt,
-                feedback_history=feedback_list,
-            )
+            loop_state = self._row_to_loop(row, feedback_list)
+            # Aggregates cover the whole history, also when feedback_limit loaded only part of it
+            loop_state.seed_feedback_stats(self._row_to_feedback_stats(row, feedback_list))
+            return loop_state
 
     async def get_loop_status(self, loop_id: str) -> MCPResponse:
-        loop_state = await self.get_loop(loop_id)
-        return loop_state.mcp_response
+        async with db_pool.acquire() as conn:
+            row = await GET_LOOP_STATUS.fetchrow(conn, loop_id)
+
+        if not row:
+            raise LoopNotFoundError(f'Loop not found: {loop_id}')
+
+        return MCPResponse(id=row['id'], status=LoopStatus(row['status']))
+
+    async def loop_exists(self, loop_id: str) -> bool:
+        async with db_pool.acquire() as conn:
+            return await LOOP_EXISTS.fetchval(conn, loop_id)
+
+    async def append_feedback(self, loop_id: str, feedback: CriticFeedback) -> MCPResponse:
+        async with db_pool.acquire() as conn:
+            row = await APPEND_LOOP_FEEDBACK.fetchrow(conn, *self._feedback_row(loop_id, feedback), feedback.key_issues)
+
+        if not row:
+            raise LoopNotFoundError(f'Loop not found: {loop_id}')
+
+        return MCPResponse(id=row['id'], status=LoopStatus(row['status']))
 
     async def decide_loop_next_action(self, loop_id: str) -> MCPResponse:
-        loop_state = await self.get_loop(loop_id)
+        loop_state = await self.get_loop(loop_id, feedback_limit=1)
 
         # Retrieve latest score from stored critic feedback
         if not loop_state.feedback_history:
@@ -184,8 +270,8 @@ class PostgresStateManager(StateManager):
         response = loop_state.decide_next_loop_action()
 
         async with db_pool.acquire() as conn:
-            await conn.execute(
-                'UPDATE loop_states SET current_score = $1, score_history = $2, status = $3 WHERE id = $4',
+            await UPDATE_LOOP_SCORE.execute(
+                conn,
                 loop_state.current_score,
                 loop_state.score_history,
                 loop_state.status.value,
@@ -194,59 +280,151 @@ class PostgresStateManager(StateManager):
 
         return response
 
-    async def list_active_loops(self, project_name: str) -> list[MCPResponse]:
+    async def decide_loops_next_action(self, loop_ids: list[str]) -> list[MCPResponse]:
+        unique_ids = list(dict.fromkeys(loop_ids))
+
         async with db_pool.acquire() as conn:
-            rows = await conn.fetch('SELECT id, status FROM loop_states WHERE project_name = $1', project_name)
+            async with conn.transaction():
+                rows = {row['id']: row for row in await GET_LOOPS_FOR_DECISION.fetch(conn, unique_ids)}
+
+                missing = [loop_id for loop_id in unique_ids if loop_id not in rows]
+                if missing:
+                    raise LoopNotFoundError(f'Loop not found: {", ".join(missing)}')
+
+                loops = []
+                for loop_id in unique_ids:
+                    row = rows[loop_id]
+                    if row['latest_score'] is None:
+                        raise ValueError(
+                            f'No feedback available for loop {loop_id} - '
+                            'cannot make decision without quality assessment'
+                        )
+                    # Decisions only read scores, so feedback history is not loaded
+                    loop_state = self._row_to_loop(row)
+                    loop_state.add_score(row['latest_score'])
+                    loop_state.decide_next_loop_action()
+                    loops.append(loop_state)
+
+                await UPDATE_LOOP_SCORES.execute(
+                    conn,
+                    unique_ids,
+                    [loop_state.current_score for loop_state in loops],
+                    [loop_state.status.value for loop_state in loops],
+                )
+
+        return [loop_state.mcp_response for loop_state in loops]
+
+    async def list_active_loops(
+        self,
+        project_name: str,
+        statuses: list[LoopStatus] | None = None,
+        loop_types: list[LoopType] | None = None,
+        after_loop_id: str | None = None,
+        limit: int | None = None,
+    ) -> list[MCPResponse]:
+        async with db_pool.acquire() as conn:
+            rows = await LIST_ACTIVE_LOOPS.fetch(
+                conn,
+                project_name,
+                None if statuses is None else [status.value for status in statuses],
+                None if loop_types is None else [loop_type.value for loop_type in loop_types],
+                after_loop_id,
+                limit,
+            )
 
         return [MCPResponse(id=row['id'], status=LoopStatus(row['status'])) for row in rows]
 
+    async def get_loop_analytics(self, project_name: str | None = None) -> list[LoopTypeAnalytics]:
+        async with db_pool.acquire() as conn:
+            rows = await LOOP_ANALYTICS.fetch(conn, project_name, *self._loop_thresholds())
+
+        analytics = []
+        for row in rows:
+            score_distribution = None
+            if row['score_quartiles'] is not None:
+                p25, median, p75 = row['score_quartiles']
+                score_distribution = ScoreDistribution(
+                    minimum=row['score_min'],
+                    p25=p25,
+                    median=median,
+                    p75=p75,
+                    maximum=row['score_max'],
+                    mean=row['score_mean'],
+                )
+            analytics.append(
+                LoopTypeAnalytics(
+                    loop_type=LoopType(row['loop_type']),
+                    loop_count=row['loop_count'],
+                    completed_count=row['completed_count'],
+                    mean_iterations_to_completion=row['mean_iterations_to_completion'],
+                    median_iterations_to_completion=row['median_iterations_to_completion'],
+                    stagnation_rate=row['stagnation_rate'],
+                    score_distribution=score_distribution,
+                )
+            )
+        return analytics
+
     async def get_objective_feedback(self, loop_id: str) -> MCPResponse:
-        loop_state = await self.get_loop(loop_id)
+        loop_status = await self.get_loop_status(loop_id)
 
         async with db_pool.acquire() as conn:
-            feedback = await conn.fetchval('SELECT feedback FROM objective_feedback WHERE loop_id = $1', loop_id)
+            feedback = await GET_OBJECTIVE_FEEDBACK.fetchval(conn, loop_id)
 
         return MCPResponse(
-            id=loop_id, status=loop_state.status, message=feedback or 'No previous objective feedback found'
+            id=loop_id, status=loop_status.status, message=feedback or 'No previous objective feedback found'
         )
 
     async def store_objective_feedback(self, loop_id: str, feedback: str) -> MCPResponse:
-        loop_state = await self.get_loop(loop_id)
+        loop_status = await self.get_loop_status(loop_id)
 
         async with db_pool.acquire() as conn:
-            await conn.execute(
-                """
-                INSERT INTO objective_feedback (loop_id, feedback)
-                VALUES ($1, $2)
-                ON CONFLICT (loop_id) DO UPDATE SET feedback = $2, stored_at = CURRENT_TIMESTAMP
-                """,
-                loop_id,
-                feedback,
-            )
+            await UPSERT_OBJECTIVE_FEEDBACK.execute(conn, loop_id, feedback)
 
         return MCPResponse(
-            id=loop_id, status=loop_state.status, message=f'Objective feedback stored for loop {loop_id}'
+            id=loop_id, status=loop_status.status, message=f'Objective feedback stored for loop {loop_id}'
         )
 
+    async def store_loop_artifact(self, loop_id: str, kind: LoopArtifactKind, content: str) -> None:
+        try:
+            async with db_pool.acquire() as conn:
+                await UPSERT_LOOP_ARTIFACT.execute(conn, loop_id, kind.value, content)
+        except ForeignKeyViolationError:
+            raise LoopNotFoundError(f'Loop not found: {loop_id}')
+
+    async def get_loop_artifact(self, loop_id: str, kind: LoopArtifactKind) -> str | None:
+        async with db_pool.acquire() as conn:
+            return await GET_LOOP_ARTIFACT.fetchval(conn, loop_id, kind.value)
+
+    async def list_loop_artifacts(self, kind: LoopArtifactKind, count: int) -> list[tuple[str, str]]:
+        if count <= 0:
+            return []
+
+        async with db_pool.acquire() as conn:
+            rows = await LIST_LOOP_ARTIFACTS.fetch(conn, kind.value, count)
+
+        return [(row['loop_id'], row['content']) for row in rows]
+
+    async def delete_loop_artifact(self, loop_id: str, kind: LoopArtifactKind) -> str | None:
+        async with db_pool.acquire() as conn:
+            return await DELETE_LOOP_ARTIFACT.fetchval(conn, loop_id, kind.value)
+
+    async def append_user_feedback(self, loop_id: str, feedback: str) -> None:
+        try:
+            async with db_pool.acquire() as conn:
+                await INSERT_LOOP_USER_FEEDBACK.execute(conn, loop_id, feedback)
+        except ForeignKeyViolationError:
+            raise LoopNotFoundError(f'Loop not found: {loop_id}')
+
+    async def get_user_feedback(self, loop_id: str) -> list[str]:
+        async with db_pool.acquire() as conn:
+            rows = await GET_LOOP_USER_FEEDBACK.fetch(conn, loop_id)
+
+        return [row['feedback'] for row in rows]
+
     async def store_roadmap(self, project_name: str, roadmap: Roadmap) -> str:
         async with db_pool.acquire() as conn:
-            await conn.execute(
-                """
-                INSERT INTO roadmaps (
-                    project_name, roadmap_title, project_goal, total_duration, team_size, roadmap_budget,
-                    critical_path_analysis, key_risks, mitigation_plans, buffer_time,
-                    development_resources, infrastructure_requirements, external_dependencies,
-                    quality_assurance_plan, technical_milestones, business_milestones,
-                    quality_gates, performance_targets, roadmap_status
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19)
-                ON CONFLICT (project_name) DO UPDATE SET
-                    roadmap_title = $2, project_goal = $3, total_duration = $4, team_size = $5, roadmap_budget = $6,
-                    critical_path_analysis = $7, key_risks = $8, mitigation_plans = $9, buffer_time = $10,
-                    development_resources = $11, infrastructure_requirements = $12, external_dependencies = $13,
-                    quality_assurance_plan = $14, technical_milestones = $15, business_milestones = $16,
-                    quality_gates = $17, performance_targets = $18, roadmap_status = $19,
-                    updated_at = CURRENT_TIMESTAMP
-                """,
+            await UPSERT_ROADMAP.execute(
+                conn,
                 project_name,
                 roadmap.project_name,
                 roadmap.project_goal,
@@ -266,18 +444,19 @@ class PostgresStateManager(StateManager):
                 roadmap.quality_gates,
                 roadmap.performance_targets,
                 roadmap.roadmap_status.value,
+                roadmap.build_metadata_markdown(),
             )
 
         return project_name
 
     async def get_roadmap(self, project_name: str) -> Roadmap:
         async with db_pool.acquire() as conn:
-            row = await conn.fetchrow('SELECT * FROM roadmaps WHERE project_name = $1', project_name)
+            row = await GET_ROADMAP.fetchrow(conn, project_name)
 
             if not row:
                 raise RoadmapNotFoundError(f'Roadmap not found for project: {project_name}')
 
-            return Roadmap(
+            roadmap = Roadmap(
                 project_name=row['roadmap_title'],
                 project_goal=row['project_goal'],
                 total_duration=row['total_duration'],
@@ -297,99 +476,128 @@ class PostgresStateManager(StateManager):
                 performance_targets=row['performance_targets'],
                 roadmap_status=RoadmapStatus(row['roadmap_status']),
             )
+            if row.get('rendered_markdown'):
+                roadmap.seed_rendered_markdown(row['rendered_markdown'])
+            return roadmap
 
-    async def get_roadmap_specs(self, project_name: str) -> list[TechnicalSpec]:
+    async def get_roadmap_specs(
+        self, project_name: str, offset: int = 0, limit: int | None = None, spec_names: list[str] | None = None
+    ) -> list[TechnicalSpec]:
         await self.get_roadmap(project_name)
 
+        normalized_names = [normalize_spec_name(name) for name in spec_names] if spec_names is not None else None
+
         async with db_pool.acquire() as conn:
-            rows = await conn.fetch(
-                'SELECT * FROM technical_specs WHERE project_name = $1 ORDER BY created_at', project_name
+            rows = await GET_ROADMAP_SPECS.fetch(
+                conn,
+                project_name,
+                normalized_names,
+                offset,
+                limit,
             )
-
-        return [self._row_to_spec(row) for row in rows]
+            return await self._rows_to_specs(conn, project_name, rows)
+
+    @staticmethod
+    def _spec_row(project_name: str, normalized_name: str, spec: TechnicalSpec) -> tuple:
+        additional_sections_json = json.dumps(spec.additional_sections) if spec.additional_sections else None
+
+        return (
+            spec.id,
+            project_name,
+            normalized_name,
+            spec.phase_name,
+            spec.objectives,
+            spec.scope,
+            spec.dependencies,
+            spec.deliverables,
+            spec.architecture,
+            spec.technology_stack,
+            spec.functional_requirements,
+            spec.non_functional_requirements,
+            spec.development_plan,
+            spec.testing_strategy,
+            spec.research_requirements,
+            spec.success_criteria,
+            spec.integration_context,
+            additional_sections_json,
+            spec.iteration,
+            spec.version,
+            spec.spec_status.value,
+            spec.build_markdown(),
+        )
 
     async def store_spec(self, project_name: str, spec: TechnicalSpec) -> str:
         normalized_name = normalize_spec_name(spec.phase_name)
 
         async with db_pool.acquire() as conn:
-            existing = await conn.fetchrow(
-                'SELECT iteration, version FROM technical_specs WHERE project_name = $1 AND spec_name = $2',
-                project_name,
-                normalized_name,
-            )
+            stored = await UPSERT_SPEC.fetchrow(conn, *self._spec_row(project_name, normalized_name, spec))
 
-            if existing:
-                spec.iteration = existing['iteration'] + 1
-                spec.version = existing['version'] + 1
-
-            additional_sections_json = json.dumps(spec.additional_sections) if spec.additional_sections else None
-
-            await conn.execute(
-                """
-                INSERT INTO technical_specs (
-                    id, project_name, spec_name, phase_name, objectives, scope, dependencies, deliverables,
-                    architecture, technology_stack, functional_requirements, non_functional_requirements,
-                    development_plan, testing_strategy, research_requirements, success_criteria,
-                    integration_context, additional_sections, iteration, version, spec_status
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20, $21)
-                ON CONFLICT (project_name, spec_name) DO UPDATE SET
-                    id = $1, phase_name = $4, architecture = $9, technology_stack = $10,
-                    functional_requirements = $11, non_functional_requirements = $12,
-                    development_plan = $13, testing_strategy = $14, research_requirements = $15,
-                    success_criteria = $16, integration_context = $17, additional_sections = $18,
-                    iteration = $19, version = $20, spec_status = $21, updated_at = CURRENT_TIMESTAMP
-                """,
-                spec.id,
-                project_name,
-                normalized_name,
-                spec.phase_name,
-                spec.objectives,
-                spec.scope,
-                spec.dependencies,
-                spec.deliverables,
-                spec.architecture,
-                spec.technology_stack,
-                spec.functional_requirements,
-                spec.non_functional_requirements,
-                spec.development_plan,
-                spec.testing_strategy,
-                spec.research_requirements,
-                spec.success_criteria,
-                spec.integration_context,
-                additional_sections_json,
-                spec.iteration,
-                spec.version,
-                spec.spec_status.value,
-            )
+        if stored is not None and (stored['iteration'], stored['version']) != (spec.iteration, spec.version):
+            spec.iteration = stored['iteration']
+            spec.version = stored['version']
 
         return spec.phase_name
 
-    async def update_spec(self, project_name: str, spec_name: str, updated_spec: TechnicalSpec) -> str:
-        existing_spec = await self.get_spec(project_name, spec_name)
-        existing_data = existing_spec.model_dump()
-        new_data = updated_spec.model_dump()
+    async def store_specs_bulk(self, project_name: str, specs: list[TechnicalSpec]) -> list[str]:
+        # The upsert versions conflicting rows itself, so names repeated within the batch
+        # stack up exactly like sequential store_spec calls.
+        upserts = [self._spec_row(project_name, normalize_spec_name(spec.phase_name), spec) for spec in specs]
+
+        async with db_pool.acquire() as conn:
+            async with conn.transaction():
+                stored_rows = await UPSERT_SPEC.fetchmany(conn, upserts)
+
+        for spec, stored in zip(specs, stored_rows):
+            spec.iteration = stored['iteration']
+            spec.version = stored['version']
 
-        frozen_fields = {field: existing_data[field] for field in FROZEN_SPEC_FIELDS}
+        return [spec.phase_name for spec in specs]
 
-        final_spec = TechnicalSpec(
-            **{
-                **new_data,
-                **frozen_fields,
-                'iteration': existing_data['iteration'] + 1,
-                'version': existing_data['version'] + 1,
-            }
+    async def update_spec(
+        self, project_name: str, spec_name: str, updated_spec: TechnicalSpec, expected_version: int | None = None
+    ) -> str:
+        additional_sections_json = (
+            json.dumps(updated_spec.additional_sections) if updated_spec.additional_sections else None
         )
 
-        await self.store_spec(project_name, final_spec)
+        # Frozen fields are simply not in the SET list, so they keep their stored values.
+        async with db_pool.acquire() as conn:
+            stored = await UPDATE_SPEC.fetchrow(
+                conn,
+                project_name,
+                normalize_spec_name(spec_name),
+                updated_spec.id,
+                updated_spec.phase_name,
+                updated_spec.architecture,
+                updated_spec.technology_stack,
+                updated_spec.functional_requirements,
+                updated_spec.non_functional_requirements,
+                updated_spec.development_plan,
+                updated_spec.testing_strategy,
+                updated_spec.research_requirements,
+                updated_spec.success_criteria,
+                updated_spec.integration_context,
+                additional_sections_json,
+                updated_spec.spec_status.value,
+                expected_version,
+            )
+
+        if stored is None:
+            raise SpecNotFoundError(f'Spec not found: {spec_name} in project {project_name}')
+        if stored['iteration'] is None:
+            raise SpecVersionConflictError(
+                f'Spec {spec_name} in project {project_name} is at version {stored["stored_version"]}, '
+                f'expected {expected_version}'
+            )
 
-        return f'Updated spec "{spec_name}" to iteration {final_spec.iteration}, version {final_spec.version}'
+        return f'Updated spec "{spec_name}" to iteration {stored["iteration"]}, version {stored["version"]}'
 
     async def get_spec(self, project_name: str, spec_name: str) -> TechnicalSpec:
         normalized_name = normalize_spec_name(spec_name)
 
         async with db_pool.acquire() as conn:
-            row = await conn.fetchrow(
-                'SELECT * FROM technical_specs WHERE project_name = $1 AND spec_name = $2',
+            row = await GET_SPEC.fetchrow(
+                conn,
                 project_name,
                 normalized_name,
             )
@@ -397,26 +605,29 @@ class PostgresStateManager(StateManager):
             if not row:
                 raise SpecNotFoundError(f'Spec not found: {spec_name} in project {project_name}')
 
-            return self._row_to_spec(row)
+            (spec,) = await self._rows_to_specs(conn, project_name, [row])
+            return spec
 
     async def list_specs(self, project_name: str) -> list[str]:
         async with db_pool.acquire() as conn:
-            rows = await conn.fetch('SELECT spec_name FROM technical_specs WHERE project_name = $1', project_name)
+            rows = await LIST_SPECS.fetch(conn, project_name)
 
         return [row['spec_name'] for row in rows]
 
     async def resolve_spec_name(self, project_name: str, partial_name: str) -> tuple[str | None, list[str]]:
-        all_specs = await self.list_specs(project_name)
-
-        if not all_specs:
-            return (None, [])
-
         normalized_partial = normalize_spec_name(partial_name)
 
-        if normalized_partial in all_specs:
+        async with db_pool.acquire() as conn:
+            rows = await RESOLVE_SPEC_NAME.fetch(
+                conn,
+                project_name,
+                normalized_partial,
+            )
+
+        matches = [row['spec_name'] for row in rows]
+        if normalized_partial in matches:
             return (normalized_partial, [normalized_partial])
 
-        matches = [spec for spec in all_specs if normalized_partial in spec]
         canonical = matches[0] if len(matches) == 1 else None
 
         return (canonical, matches)
@@ -425,9 +636,7 @@ class PostgresStateManager(StateManager):
         normalized_name = normalize_spec_name(spec_name)
 
         async with db_pool.acquire() as conn:
-            result = await conn.execute(
-                'DELETE FROM technical_specs WHERE project_name = $1 AND spec_name = $2', project_name, normalized_name
-            )
+            result = await DELETE_SPEC.execute(conn, project_name, normalized_name)
 
         deleted_count = int(result.split()[-1])
         return deleted_count > 0
@@ -436,13 +645,8 @@ class PostgresStateManager(StateManager):
         normalized_name = normalize_spec_name(spec_name)
 
         async with db_pool.acquire() as conn:
-            await conn.execute(
-                """
-                INSERT INTO loop_to_spec_mappings (loop_id, project_name, spec_name)
-                VALUES ($1, $2, $3)
-                ON CONFLICT (loop_id) DO UPDATE SET
-                    project_name = $2, spec_name = $3, linked_at = CURRENT_TIMESTAMP
-                """,
+            await UPSERT_LOOP_SPEC_MAPPING.execute(
+                conn,
                 loop_id,
                 project_name,
                 normalized_name,
@@ -450,9 +654,7 @@ class PostgresStateManager(StateManager):
 
     async def get_spec_by_loop(self, loop_id: str) -> TechnicalSpec:
         async with db_pool.acquire() as conn:
-            mapping = await conn.fetchrow(
-                'SELECT project_name, spec_name FROM loop_to_spec_mappings WHERE loop_id = $1', loop_id
-            )
+            mapping = await GET_LOOP_SPEC_MAPPING.fetchrow(conn, loop_id)
 
             if not mapping:
                 raise LoopNotFoundError(f'Loop not linked to any spec: {loop_id}')
@@ -461,7 +663,7 @@ class PostgresStateManager(StateManager):
 
     async def update_spec_by_loop(self, loop_id: str, spec: TechnicalSpec) -> None:
         async with db_pool.acquire() as conn:
-            mapping = await conn.fetchrow('SELECT project_name FROM loop_to_spec_mappings WHERE loop_id = $1', loop_id)
+            mapping = await GET_LOOP_SPEC_MAPPING.fetchrow(conn, loop_id)
 
             if not mapping:
                 raise LoopNotFoundError(f'Loop not linked to any spec: {loop_id}')
@@ -470,9 +672,7 @@ class PostgresStateManager(StateManager):
 
     async def unlink_loop(self, loop_id: str) -> tuple[str, str] | None:
         async with db_pool.acquire() as conn:
-            mapping = await conn.fetchrow(
-                'DELETE FROM loop_to_spec_mappings WHERE loop_id = $1 RETURNING project_name, spec_name', loop_id
-            )
+            mapping = await DELETE_LOOP_SPEC_MAPPING.fetchrow(conn, loop_id)
 
             if not mapping:
                 return None
@@ -481,32 +681,8 @@ class PostgresStateManager(StateManager):
 
     async def store_project_plan(self, project_name: str, project_plan: ProjectPlan) -> str:
         async with db_pool.acquire() as conn:
-            await conn.execute(
-                """
-                INSERT INTO project_plans (
-                    project_name, project_vision, project_mission, project_timeline, project_budget,
-                    primary_objectives, success_metrics, key_performance_indicators,
-                    included_features, excluded_features, project_assumptions, project_constraints,
-                    project_sponsor, key_stakeholders, end_users,
-                    work_breakdown, phases_overview, project_dependencies,
-                    team_structure, technology_requirements, infrastructure_needs,
-                    identified_risks, mitigation_strategies, contingency_plans,
-                    quality_standards, testing_strategy, acceptance_criteria,
-                    reporting_structure, meeting_schedule, documentation_standards,
-                    project_status
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20, $21, $22, $23, $24, $25, $26, $27, $28, $29, $30, $31)
-                ON CONFLICT (project_name) DO UPDATE SET
-                    project_vision = $2, project_mission = $3, project_timeline = $4, project_budget = $5,
-                    primary_objectives = $6, success_metrics = $7, key_performance_indicators = $8,
-                    included_features = $9, excluded_features = $10, project_assumptions = $11, project_constraints = $12,
-                    project_sponsor = $13, key_stakeholders = $14, end_users = $15,
-                    work_breakdown = $16, phases_overview = $17, project_dependencies = $18,
-                    team_structure = $19, technology_requirements = $20, infrastructure_needs = $21,
-                    identified_risks = $22, mitigation_strategies = $23, contingency_plans = $24,
-                    quality_standards = $25, testing_strategy = $26, acceptance_criteria = $27,
-                    reporting_structure = $28, meeting_schedule = $29, documentation_standards = $30,
-                    project_status = $31, updated_at = CURRENT_TIMESTAMP
-                """,
+            await UPSERT_PROJECT_PLAN.execute(
+                conn,
                 project_name,
                 project_plan.project_vision,
                 project_plan.project_mission,
@@ -538,18 +714,19 @@ class PostgresStateManager(StateManager):
                 project_plan.meeting_schedule,
                 project_plan.documentation_standards,
                 project_plan.project_status.value,
+                project_plan.build_markdown(),
             )
 
         return project_name
 
     async def get_project_plan(self, project_name: str) -> ProjectPlan:
         async with db_pool.acquire() as conn:
-            row = await conn.fetchrow('SELECT * FROM project_plans WHERE project_name = $1', project_name)
+            row = await GET_PROJECT_PLAN.fetchrow(conn, project_name)
 
             if not row:
                 raise ProjectPlanNotFoundError(f'Project plan not found for project: {project_name}')
 
-            return ProjectPlan(
+            project_plan = ProjectPlan(
                 project_name=row['project_name'],
                 project_vision=row['project_vision'],
                 project_mission=row['project_mission'],
@@ -582,20 +759,95 @@ class PostgresStateManager(StateManager):
                 documentation_standards=row['documentation_standards'],
                 project_status=ProjectStatus(row['project_status']),
             )
+            if row.get('rendered_markdown'):
+                project_plan.seed_rendered_markdown(row['rendered_markdown'])
+            return project_plan
 
     async def list_project_plans(self) -> list[str]:
         async with db_pool.acquire() as conn:
-            rows = await conn.fetch('SELECT project_name FROM project_plans')
+            rows = await LIST_PROJECT_PLANS.fetch(conn)
 
         return [row['project_name'] for row in rows]
 
     async def delete_project_plan(self, project_name: str) -> bool:
         async with db_pool.acquire() as conn:
-            exists = await conn.fetchval('SELECT 1 FROM project_plans WHERE project_name = $1', project_name)
-
-            if not exists:
-                raise ProjectPlanNotFoundError(f'Project plan not found for project: {project_name}')
+            result = await DELETE_PROJECT_PLAN.execute(conn, project_name)
 
-            await conn.execute('DELETE FROM project_plans WHERE project_name = $1', project_name)
+        if int(result.split()[-1]) == 0:
+            raise ProjectPlanNotFoundError(f'Project plan not found for project: {project_name}')
 
         return True
+
+
+class PostgresCacheInvalidationChannel(CacheInvalidationChannel):
+    """Carries CachedStateManager invalidations between processes over LISTEN/NOTIFY.
+
+    Notifications are sent through the pool; listening uses a dedicated connection
+    outside it. If that connection drops, the cache is reset and the channel keeps
+    retrying every reconnect_interval seconds.
+    """
+
+    CHANNEL = 'respec_state_cache'
+
+    def __init__(self, reconnect_interval: float = 5.0) -> None:
+        self._reconnect_interval = reconnect_interval
+        self._conn: Connection | None = None
+        self._on_invalidate: Callable[[CacheKey], None] | None = None
+        self._on_reset: Callable[[], None] | None = None
+        self._reconnect_task: asyncio.Task | None = None
+        self._closed = False
+
+    @property
+    def listening(self) -> bool:
+        return self._conn is not None and not self._conn.is_closed()
+
+    async def publish(self, keys: list[CacheKey]) -> None:
+        async with db_pool.acquire() as conn:
+            await NOTIFY_CACHE_INVALIDATION.execute(conn, self.CHANNEL, [encode_cache_key(key) for key in keys])
+
+    async def subscribe(self, on_invalidate: Callable[[CacheKey], None], on_reset: Callable[[], None]) -> None:
+        self._on_invalidate = on_invalidate
+        self._on_reset = on_reset
+        self._closed = False
+        await self._listen()
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        conn, self._conn = self._conn, None
+        if conn is not None and not conn.is_closed():
+            await conn.close()
+
+    async def _listen(self) -> None:
+        conn = await db_pool.connect()
+        conn.add_termination_listener(self._handle_termination)
+        await conn.add_listener(self.CHANNEL, self._handle_notification)
+        self._conn = conn
+        logger.info('Listening for state cache invalidations on %s', self.CHANNEL)
+
+    def _handle_notification(self, conn: Connection, pid: int, channel: str, payload: str) -> None:
+        if self._on_invalidate is not None:
+            self._on_invalidate(decode_cache_key(payload))
+
+    def _handle_termination(self, conn: Connection) -> None:
+        self._conn = None
+        if self._on_reset is not None:
+            self._on_reset()
+        if not self._closed:
+            logger.warning('State cache invalidation listener disconnected; cache bypassed until it reconnects')
+            self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        while not self._closed:
+            await asyncio.sleep(self._reconnect_interval)
+            try:
+                await self._listen()
+            except (OSError, PostgresError) as e:
+                logger.warning('State cache invalidation listener reconnect failed: %s', e)
+                continue
+            # Writes made while disconnected were never announced to this process
+            if self._on_reset is not None:
+                self._on_reset()
+            return
@@ -0,0 +1,488 @@
+from src.utils.prepared_statements import statement_registry
+
+
+register = statement_registry.register
+
+
+# Loops
+
+INSERT_LOOP = register(
+    'insert_loop',
+    """
+    INSERT INTO loop_states (
+        id, project_name, loop_type, status, current_score,
+        score_history, iteration, created_at, updated_at
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+    ON CONFLICT (id) DO NOTHING
+    RETURNING id
+    """,
+)
+
+INSERT_LOOP_HISTORY = register('insert_loop_history', 'INSERT INTO loop_history (loop_id) VALUES ($1)')
+
+# Per-loop outcome of the loops in a preceding `loops` CTE; $2/$3 pair loop types with their
+# improvement thresholds. Shared by eviction (archiving) and analytics so both agree.
+_LOOP_OUTCOMES = """
+    thresholds AS (
+        SELECT * FROM unnest($2::text[], $3::int[]) AS t(loop_type, improvement_threshold)
+    ),
+    deltas AS (
+        SELECT f.loop_id,
+            f.overall_score - lag(f.overall_score) OVER w AS delta,
+            lag(f.overall_score) OVER w - lag(f.overall_score, 2) OVER w AS previous_delta
+        FROM loop_feedback f
+        JOIN loops l ON l.id = f.loop_id
+        WINDOW w AS (PARTITION BY f.loop_id ORDER BY f.iteration, f.id)
+    ),
+    per_loop AS (
+        SELECT l.id, l.project_name, l.loop_type, l.status, l.current_score,
+            count(d.loop_id) AS assessments,
+            coalesce(
+                bool_or(d.delta < t.improvement_threshold AND d.previous_delta < t.improvement_threshold), false
+            ) AS stagnated
+        FROM loops l
+        LEFT JOIN thresholds t ON t.loop_type = l.loop_type
+        LEFT JOIN deltas d ON d.loop_id = l.id
+        GROUP BY l.id, l.project_name, l.loop_type, l.status, l.current_score
+    )
+"""
+
+# Evicted loops are summarized into loop_summaries in the same statement. Only rows this
+# DELETE actually removed are archived, so concurrent evictions cannot archive a loop twice.
+ENFORCE_LOOP_HISTORY_LIMIT = register(
+    'enforce_loop_history_limit',
+    f"""
+    WITH loops AS (
+        DELETE FROM loop_states
+        WHERE id IN (
+            SELECT loop_id FROM loop_history
+            ORDER BY sequence_number DESC
+            OFFSET $1
+        )
+        RETURNING id, project_name, loop_type, status, current_score
+    ),
+    {_LOOP_OUTCOMES}
+    INSERT INTO loop_summaries (loop_id, project_name, loop_type, status, current_score, assessments, stagnated)
+    SELECT id, project_name, loop_type, status, current_score, assessments, stagnated FROM per_loop
+    """,
+)
+
+INSERT_LOOP_FEEDBACK = register(
+    'insert_loop_feedback',
+    'INSERT INTO loop_feedback (loop_id, iteration, overall_score, feedback) VALUES ($1, $2, $3, $4)',
+)
+
+# Score bookkeeping mirrors LoopState.add_feedback; the feedback row is only written when the loop exists.
+# The feedback aggregates mirror FeedbackStats.add, with $5 the entry's key_issues.
+APPEND_LOOP_FEEDBACK = register(
+    'append_loop_feedback',
+    """
+    WITH updated AS (
+        UPDATE loop_states SET
+            current_score = $3,
+            score_history = array_append(score_history, $3),
+            status = CASE WHEN status = 'initialized' THEN 'in_progress' ELSE status END,
+            feedback_count = feedback_count + 1,
+            first_feedback_score = COALESCE(first_feedback_score, $3),
+            previous_feedback_score = latest_feedback_score,
+            latest_feedback_score = $3,
+            feedback_issues = feedback_issues || COALESCE(
+                (
+                    SELECT jsonb_object_agg(
+                        added.issue,
+                        jsonb_build_object(
+                            'first_seen',
+                            COALESCE(
+                                loop_states.feedback_issues->added.issue->'first_seen',
+                                to_jsonb(ARRAY[loop_states.feedback_count, added.first_position])
+                            ),
+                            'count',
+                            COALESCE((loop_states.feedback_issues->added.issue->>'count')::INTEGER, 0) + added.occurrences
+                        )
+                    )
+                    FROM (
+                        SELECT i.issue, MIN(i.position) - 1 AS first_position, COUNT(*) AS occurrences
+                        FROM unnest($5::text[]) WITH ORDINALITY AS i(issue, position)
+                        GROUP BY i.issue
+                    ) added
+                ),
+                '{}'
+            ),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = $1
+        RETURNING id, status
+    ), appended AS (
+        INSERT INTO loop_feedback (loop_id, iteration, overall_score, feedback)
+        SELECT id, $2, $3, $4 FROM updated
+    )
+    SELECT id, status FROM updated
+    """,
+)
+
+# Recomputes the feedback aggregates of one loop from loop_feedback (loops added with history)
+REFRESH_LOOP_FEEDBACK_AGGREGATES = register(
+    'refresh_loop_feedback_aggregates',
+    """
+    WITH ordered AS (
+        SELECT overall_score, feedback,
+               row_number() OVER (ORDER BY iteration, id) - 1 AS feedback_index,
+               COUNT(*) OVER () AS total
+        FROM loop_feedback WHERE loop_id = $1
+    ), issues AS (
+        SELECT i.issue, MIN(ARRAY[o.feedback_index, i.position - 1]) AS first_seen, COUNT(*) AS occurrences
+        FROM ordered o
+        CROSS JOIN LATERAL jsonb_array_elements_text(o.feedback->'key_issues') WITH ORDINALITY AS i(issue, position)
+        GROUP BY i.issue
+    )
+    UPDATE loop_states SET
+        feedback_count = (SELECT COUNT(*) FROM ordered),
+        first_feedback_score = (SELECT overall_score FROM ordered WHERE feedback_index = 0),
+        previous_feedback_score = (SELECT overall_score FROM ordered WHERE feedback_index = total - 2),
+        latest_feedback_score = (SELECT overall_score FROM ordered WHERE feedback_index = total - 1),
+        feedback_issues = COALESCE(
+            (
+                SELECT jsonb_object_agg(
+                    issue, jsonb_build_object('first_seen', to_jsonb(first_seen), 'count', occurrences)
+                )
+                FROM issues
+            ),
+            '{}'
+        )
+    WHERE id = $1
+    """,
+)
+
+# Feedback comes back oldest first; $2 keeps only the newest N entries (NULL keeps all).
+GET_LOOP = register(
+    'get_loop',
+    """
+    SELECT id, loop_type, status, current_score, score_history, iteration, created_at, updated_at,
+           feedback_count, first_feedback_score, previous_feedback_score, latest_feedback_score, feedback_issues,
+           ARRAY(
+               SELECT feedback FROM (
+                   SELECT feedback, iteration, id FROM loop_feedback
+                   WHERE loop_id = $1
+                   ORDER BY iteration DESC, id DESC
+                   LIMIT $2
+               ) recent
+               ORDER BY iteration, id
+           ) AS feedback_history
+    FROM loop_states WHERE id = $1
+    """,
+)
+
+GET_LOOP_STATUS = register('get_loop_status', 'SELECT id, status FROM loop_states WHERE id = $1')
+
+LOOP_EXISTS = register('loop_exists', 'SELECT EXISTS (SELECT 1 FROM loop_states WHERE id = $1)')
+
+UPDATE_LOOP_SCORE = register(
+    'update_loop_score',
+    'UPDATE loop_states SET current_score = $1, score_history = $2, status = $3 WHERE id = $4',
+)
+
+# Rows are locked until the batched score update commits; latest_score is NULL for loops without feedback.
+GET_LOOPS_FOR_DECISION = register(
+    'get_loops_for_decision',
+    """
+    SELECT l.id, l.loop_type, l.status, l.current_score, l.score_history, l.iteration, l.created_at, l.updated_at,
+           (
+               SELECT f.overall_score FROM loop_feedback f
+               WHERE f.loop_id = l.id
+               ORDER BY f.iteration DESC, f.id DESC
+               LIMIT 1
+           ) AS latest_score
+    FROM loop_states l
+    WHERE l.id = ANY($1::text[])
+    FOR UPDATE OF l
+    """,
+)
+
+UPDATE_LOOP_SCORES = register(
+    'update_loop_scores',
+    """
+    UPDATE loop_states l
+    SET current_score = d.score, score_history = array_append(l.score_history, d.score), status = d.status
+    FROM unnest($1::text[], $2::int[], $3::text[]) AS d(id, score, status)
+    WHERE l.id = d.id
+    """,
+)
+
+LIST_ACTIVE_LOOPS = register(
+    'list_active_loops',
+    """
+    SELECT id, status FROM loop_states
+    WHERE project_name = $1
+      AND ($2::text[] IS NULL OR status = ANY($2::text[]))
+      AND ($3::text[] IS NULL OR loop_type = ANY($3::text[]))
+      AND (
+        $4::text IS NULL
+        OR (created_at, id) > (SELECT created_at, id FROM loop_states WHERE id = $4 AND project_name = $1)
+      )
+    ORDER BY created_at, id
+    LIMIT $5
+    """,
+)
+
+# Outcomes of stored loops and of evicted loops' summaries feed the per-type rollup, so only one
+# row per loop type leaves the server.
+LOOP_ANALYTICS = register(
+    'loop_analytics',
+    f"""
+    WITH loops AS (
+        SELECT id, project_name, loop_type, status, current_score FROM loop_states
+        WHERE $1::text IS NULL OR project_name = $1
+    ),
+    {_LOOP_OUTCOMES},
+    outcomes AS (
+        SELECT loop_type, status, current_score, assessments, stagnated FROM per_loop
+        UNION ALL
+        SELECT loop_type, status, current_score, assessments, stagnated FROM loop_summaries
+        WHERE $1::text IS NULL OR project_name = $1
+    )
+    SELECT loop_type,
+        count(*) AS loop_count,
+        count(*) FILTER (WHERE status = 'completed') AS completed_count,
+        avg(assessments) FILTER (WHERE status = 'completed')::float8 AS mean_iterations_to_completion,
+        percentile_cont(0.5) WITHIN GROUP (ORDER BY assessments)
+            FILTER (WHERE status = 'completed') AS median_iterations_to_completion,
+        avg(stagnated::int)::float8 AS stagnation_rate,
+        min(current_score) FILTER (WHERE assessments > 0) AS score_min,
+        percentile_cont(ARRAY[0.25, 0.5, 0.75]) WITHIN GROUP (ORDER BY current_score)
+            FILTER (WHERE assessments > 0) AS score_quartiles,
+        max(current_score) FILTER (WHERE assessments > 0) AS score_max,
+        avg(current_score) FILTER (WHERE assessments > 0)::float8 AS score_mean
+    FROM outcomes
+    GROUP BY loop_type
+    ORDER BY loop_type
+    """,
+)
+
+# Objective feedback
+
+GET_OBJECTIVE_FEEDBACK = register(
+    'get_objective_feedback', 'SELECT feedback FROM objective_feedback WHERE loop_id = $1'
+)
+
+UPSERT_OBJECTIVE_FEEDBACK = register(
+    'upsert_objective_feedback',
+    """
+    INSERT INTO objective_feedback (loop_id, feedback)
+    VALUES ($1, $2)
+    ON CONFLICT (loop_id) DO UPDATE SET feedback = $2, stored_at = CURRENT_TIMESTAMP
+    """,
+)
+
+# Loop artifacts
+
+# Replacing an artifact keeps created_at, which orders LIST_LOOP_ARTIFACTS
+UPSERT_LOOP_ARTIFACT = register(
+    'upsert_loop_artifact',
+    """
+    INSERT INTO loop_artifacts (loop_id, kind, content)
+    VALUES ($1, $2, $3)
+    ON CONFLICT (loop_id, kind) DO UPDATE SET content = $3, updated_at = CURRENT_TIMESTAMP
+    """,
+)
+
+GET_LOOP_ARTIFACT = register('get_loop_artifact', 'SELECT content FROM loop_artifacts WHERE loop_id = $1 AND kind = $2')
+
+# Newest $2 artifacts of a kind, returned oldest first
+LIST_LOOP_ARTIFACTS = register(
+    'list_loop_artifacts',
+    """
+    SELECT loop_id, content FROM (
+        SELECT loop_id, content, created_at FROM loop_artifacts
+        WHERE kind = $1
+        ORDER BY created_at DESC, loop_id DESC
+        LIMIT $2
+    ) recent
+    ORDER BY created_at, loop_id
+    """,
+)
+
+DELETE_LOOP_ARTIFACT = register(
+    'delete_loop_artifact', 'DELETE FROM loop_artifacts WHERE loop_id = $1 AND kind = $2 RETURNING content'
+)
+
+INSERT_LOOP_USER_FEEDBACK = register(
+    'insert_loop_user_feedback', 'INSERT INTO loop_user_feedback (loop_id, feedback) VALUES ($1, $2)'
+)
+
+GET_LOOP_USER_FEEDBACK = register(
+    'get_loop_user_feedback', 'SELECT feedback FROM loop_user_feedback WHERE loop_id = $1 ORDER BY id'
+)
+
+# Cache invalidation (one NOTIFY per payload, delivered on commit)
+
+NOTIFY_CACHE_INVALIDATION = register(
+    'notify_cache_invalidation', 'SELECT pg_notify($1, payload) FROM unnest($2::text[]) AS payload'
+)
+
+# Roadmaps
+
+UPSERT_ROADMAP = register(
+    'upsert_roadmap',
+    """
+    INSERT INTO roadmaps (
+        project_name, roadmap_title, project_goal, total_duration, team_size, roadmap_budget,
+        critical_path_analysis, key_risks, mitigation_plans, buffer_time,
+        development_resources, infrastructure_requirements, external_dependencies,
+        quality_assurance_plan, technical_milestones, business_milestones,
+        quality_gates, performance_targets, roadmap_status, rendered_markdown
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20)
+    ON CONFLICT (project_name) DO UPDATE SET
+        roadmap_title = $2, project_goal = $3, total_duration = $4, team_size = $5, roadmap_budget = $6,
+        critical_path_analysis = $7, key_risks = $8, mitigation_plans = $9, buffer_time = $10,
+        development_resources = $11, infrastructure_requirements = $12, external_dependencies = $13,
+        quality_assurance_plan = $14, technical_milestones = $15, business_milestones = $16,
+        quality_gates = $17, performance_targets = $18, roadmap_status = $19, rendered_markdown = $20,
+        updated_at = CURRENT_TIMESTAMP
+    """,
+)
+
+GET_ROADMAP = register('get_roadmap', 'SELECT * FROM roadmaps WHERE project_name = $1')
+
+# Technical specs
+
+GET_ROADMAP_SPECS = register(
+    'get_roadmap_specs',
+    """
+    SELECT * FROM technical_specs
+    WHERE project_name = $1 AND ($2::text[] IS NULL OR spec_name = ANY($2::text[]))
+    ORDER BY spec_order, id
+    OFFSET $3 LIMIT $4
+    """,
+)
+
+# Existing specs are versioned in place. rendered_markdown embeds iteration/version and the
+# stored frozen fields, so it is cleared on update and written back by the next read.
+UPSERT_SPEC = register(
+    'upsert_spec',
+    """
+    INSERT INTO technical_specs (
+        id, project_name, spec_name, phase_name, objectives, scope, dependencies, deliverables,
+        architecture, technology_stack, functional_requirements, non_functional_requirements,
+        development_plan, testing_strategy, research_requirements, success_criteria,
+        integration_context, additional_sections, iteration, version, spec_status, rendered_markdown
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20, $21, $22)
+    ON CONFLICT (project_name, spec_name) DO UPDATE SET
+        id = $1, phase_name = $4, architecture = $9, technology_stack = $10,
+        functional_requirements = $11, non_functional_requirements = $12,
+        development_plan = $13, testing_strategy = $14, research_requirements = $15,
+        success_criteria = $16, integration_context = $17, additional_sections = $18,
+        iteration = technical_specs.iteration + 1, version = technical_specs.version + 1,
+        spec_status = $21, rendered_markdown = NULL, updated_at = CURRENT_TIMESTAMP
+    RETURNING iteration, version
+    """,
+)
+
+# $16 is the version the caller read, or NULL to skip the check. The CTE reports the stored
+# version alongside the update so a missing spec (no row) is told apart from a version
+# mismatch (a row without iteration).
+UPDATE_SPEC = register(
+    'update_spec',
+    """
+    WITH stored AS (
+        SELECT version FROM technical_specs WHERE project_name = $1 AND spec_name = $2
+    ), updated AS (
+        UPDATE technical_specs SET
+            id = $3, phase_name = $4, architecture = $5, technology_stack = $6,
+            functional_requirements = $7, non_functional_requirements = $8,
+            development_plan = $9, testing_strategy = $10, research_requirements = $11,
+            success_criteria = $12, integration_context = $13, additional_sections = $14,
+            iteration = iteration + 1, version = version + 1,
+            spec_status = $15, rendered_markdown = NULL, updated_at = CURRENT_TIMESTAMP
+        WHERE project_name = $1 AND spec_name = $2 AND ($16::int IS NULL OR version = $16::int)
+        RETURNING iteration, version
+    )
+    SELECT stored.version AS stored_version, updated.iteration, updated.version
+    FROM stored LEFT JOIN updated ON TRUE
+    """,
+)
+
+# Backfills the render cleared by an update. The version guard drops a render made from a row
+# that another writer has since versioned again.
+STORE_SPEC_RENDER = register(
+    'store_spec_render',
+    """
+    UPDATE technical_specs SET rendered_markdown = $4
+    WHERE project_name = $1 AND spec_name = $2 AND version = $3 AND rendered_markdown IS NULL
+    """,
+)
+
+GET_SPEC = register('get_spec', 'SELECT * FROM technical_specs WHERE project_name = $1 AND spec_name = $2')
+
+LIST_SPECS = register(
+    'list_specs', 'SELECT spec_name FROM technical_specs WHERE project_name = $1 ORDER BY spec_order, id'
+)
+
+# Substring match served by the idx_specs_name_search trigram index, ranked by similarity.
+# Normalized names only contain [a-z0-9-], so the partial needs no LIKE escaping.
+RESOLVE_SPEC_NAME = register(
+    'resolve_spec_name',
+    """
+    SELECT spec_name FROM technical_specs
+    WHERE project_name = $1 AND spec_name LIKE '%' || $2 || '%'
+    ORDER BY strpos(spec_name, $2) = 1 DESC, similarity(spec_name, $2) DESC, spec_name
+    """,
+)
+
+DELETE_SPEC = register('delete_spec', 'DELETE FROM technical_specs WHERE project_name = $1 AND spec_name = $2')
+
+# Loop to spec mappings
+
+UPSERT_LOOP_SPEC_MAPPING = register(
+    'upsert_loop_spec_mapping',
+    """
+    INSERT INTO loop_to_spec_mappings (loop_id, project_name, spec_name)
+    VALUES ($1, $2, $3)
+    ON CONFLICT (loop_id) DO UPDATE SET
+        project_name = $2, spec_name = $3, linked_at = CURRENT_TIMESTAMP
+    """,
+)
+
+GET_LOOP_SPEC_MAPPING = register(
+    'get_loop_spec_mapping', 'SELECT project_name, spec_name FROM loop_to_spec_mappings WHERE loop_id = $1'
+)
+
+DELETE_LOOP_SPEC_MAPPING = register(
+    'delete_loop_spec_mapping',
+    'DELETE FROM loop_to_spec_mappings WHERE loop_id = $1 RETURNING project_name, spec_name',
+)
+
+# Project plans
+
+UPSERT_PROJECT_PLAN = register(
+    'upsert_project_plan',
+    """
+    INSERT INTO project_plans (
+        project_name, project_vision, project_mission, project_timeline, project_budget,
+        primary_objectives, success_metrics, key_performance_indicators,
+        included_features, excluded_features, project_assumptions, project_constraints,
+        project_sponsor, key_stakeholders, end_users,
+        work_breakdown, phases_overview, project_dependencies,
+        team_structure, technology_requirements, infrastructure_needs,
+        identified_risks, mitigation_strategies, contingency_plans,
+        quality_standards, testing_strategy, acceptance_criteria,
+        reporting_structure, meeting_schedule, documentation_standards,
+        project_status, rendered_markdown
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20, $21, $22, $23, $24, $25, $26, $27, $28, $29, $30, $31, $32)
+    ON CONFLICT (project_name) DO UPDATE SET
+        project_vision = $2, project_mission = $3, project_timeline = $4, project_budget = $5,
+        primary_objectives = $6, success_metrics = $7, key_performance_indicators = $8,
+        included_features = $9, excluded_features = $10, project_assumptions = $11, project_constraints = $12,
+        project_sponsor = $13, key_stakeholders = $14, end_users = $15,
+        work_breakdown = $16, phases_overview = $17, project_dependencies = $18,
+        team_structure = $19, technology_requirements = $20, infrastructure_needs = $21,
+        identified_risks = $22, mitigation_strategies = $23, contingency_plans = $24,
+        quality_standards = $25, testing_strategy = $26, acceptance_criteria = $27,
+        reporting_structure = $28, meeting_schedule = $29, documentation_standards = $30,
+        project_status = $31, rendered_markdown = $32, updated_at = CURRENT_TIMESTAMP
+    """,
+)
+
+GET_PROJECT_PLAN = register('get_project_plan', 'SELECT * FROM project_plans WHERE project_name = $1')
+
+LIST_PROJECT_PLANS = register('list_project_plans', 'SELECT project_name FROM project_plans')
+
+DELETE_PROJECT_PLAN = register('delete_project_plan', 'DELETE FROM project_plans WHERE project_name = $1')
@@ -0,0 +1,83 @@
+import functools
+import logging
+from collections.abc import Callable, Coroutine
+from typing import Any, Concatenate, ParamSpec, Protocol, TypeVar
+
+
+P = ParamSpec('P')
+R = TypeVar('R')
+
+
+class SnapshotSampler:
+    """Decides which state manager calls get a full state snapshot logged.
+
+    Snapshots walk every store, so they are off by default. With ``every`` set to N,
+    one in N traced calls logs ENTRY/EXIT snapshots at DEBUG. With ``on_error`` set,
+    any traced call that raises logs a snapshot at ERROR, regardless of sampling.
+    """
+
+    def __init__(self, every: int = 0, on_error: bool = False) -> None:
+        if every < 0:
+            raise ValueError('Snapshot sampling interval cannot be negative')
+        self.every = every
+        self.on_error = on_error
+        self._calls = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.every > 0 or self.on_error
+
+    def should_sample(self, logger: logging.Logger) -> bool:
+        if self.every == 0 or not logger.isEnabledFor(logging.DEBUG):
+            return False
+        self._calls += 1
+        return self._calls % self.every == 0
+
+
+class TracedStateManager(Protocol):
+    _snapshot_sampler: SnapshotSampler
+
+    def _log_state_snapshot(self, method_name: str, stage: str, level: int = logging.DEBUG) -> None: ...
+
+
+SelfT = TypeVar('SelfT', bound=TracedStateManager)
+
+
+def traced(
+    logger: logging.Logger,
+) -> Callable[
+    [Callable[Concatenate[SelfT, P], Coroutine[Any, Any, R]]], Callable[Concatenate[SelfT, P], Coroutine[Any, Any, R]]
+]:
+    """Wrap an async state manager method with sampled ENTRY/EXIT/ERROR state snapshots.
+
+    When sampling is disabled the wrapper costs one attribute check per call; no
+    snapshot data is collected and no log records are created.
+    """
+
+    def decorator(
+        method: Callable[Concatenate[SelfT, P], Coroutine[Any, Any, R]],
+    ) -> Callable[Concatenate[SelfT, P], Coroutine[Any, Any, R]]:
+        method_name = method.__name__
+
+        @functools.wraps(method)
+        async def wrapper(self: SelfT, *args: P.args, **kwargs: P.kwargs) -> R:
+            sampler = self._snapshot_sampler
+            if not sampler.enabled:
+                return await method(self, *args, **kwargs)
+
+            sampled = sampler.should_sample(logger)
+            if sampled:
+                self._log_state_snapshot(method_name, 'ENTRY')
+            try:
+                result = await method(self, *args, **kwargs)
+            except Exception:
+                if sampler.on_error:
+                    self._log_state_snapshot(method_name, 'ERROR', logging.ERROR)
+                raise
+            if sampled:
+                self._log_state_snapshot(method_name, 'EXIT')
+            return result
+
+        return wrapper
+
+    return decorator
@@ -7,6 +7,7 @@ from pytest_mock import MockerFixture
 
 from src.mcp.tools.loop_tools import LoopTools
 from src.mcp.tools.roadmap_tools import RoadmapTools
+from src.models.cache import parse_cache
 from src.utils.setting_configs import LoopConfig
 from src.utils.state_manager import InMemoryStateManager, PostgresStateManager
 
@@ -56,6 +57,13 @@ def mock_shared_state(
     yield isolated_state_manager
 
 
+@pytest.fixture(autouse=True)
+def empty_parse_cache() -> Generator[None, None, None]:
+    parse_cache.clear()
+    yield
+    parse_cache.clear()
+
+
 @pytest.fixture(autouse=True)
 def stable_loop_config(mocker: MockerFixture) -> Generator[LoopConfig, None, None]:
     """Provide consistent loop configuration for all tests.
@@ -139,8 +147,8 @@ async def db_state_manager(check_database_available: bool) -> AsyncGenerator[Pos
         try:
             async with db_pool._pool.acquire() as conn:
                 await conn.execute(
-                    'TRUNCATE loop_states, loop_history, objective_feedback, roadmaps, '
-                    'technical_specs, project_plans, loop_to_spec_mappings CASCADE'
+                    'TRUNCATE loop_states, loop_history, objective_feedback, loop_artifacts, loop_user_feedback, roadmaps, '
+                    'technical_specs, project_plans, loop_to_spec_mappings, loop_summaries CASCADE'
                 )
         except Exception:
             pass
@@ -29,6 +29,8 @@ class TestFastMCPServerIntegration:
         tools = await server.get_tools()
         expected_loop_tools = [
             'decide_loop_next_action',
+            'decide_loops_next_action',
+            'get_loop_analytics',
             'initialize_refinement_loop',
             'get_loop_status',
             'list_active_loops',
@@ -38,8 +40,11 @@ class TestFastMCPServerIntegration:
         expected_unified_tools = [
             'create_roadmap',
             'get_roadmap',
+            'get_roadmap_page',
             'store_spec',
+            'patch_spec',
             'get_spec_markdown',
+            'get_spec_sections',
             'link_loop_to_spec',
             'unlink_loop',
             'list_specs',
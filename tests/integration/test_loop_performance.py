@@ -2,6 +2,7 @@ import time
 
 import pytest
 from src.mcp.tools.loop_tools import loop_tools
+from src.models.base import MarkdownDocument
 from src.models.enums import CriticAgent
 from src.models.feedback import CriticFeedback
 from src.utils.enums import LoopStatus
@@ -30,6 +31,25 @@ async def add_feedback_and_decide(loop_id: str, score: int, iteration: int, agen
     return await loop_tools.decide_loop_next_action(loop_id)
 
 
+@pytest.fixture
+def realistic_feedback_documents() -> list[str]:
+    return [
+        CriticFeedback(
+            loop_id=f'loop-{i}',
+            critic_agent=CriticAgent.SPEC_CRITIC,
+            iteration=i + 1,
+            overall_score=60 + (i % 30),
+            assessment_summary='Specification covers the core flows but leaves integration details open',
+            detailed_feedback='\n\n'.join(
+                f'Section {j} reviews data flow, failure handling and ownership for component {j}.' for j in range(6)
+            ),
+            key_issues=[f'Component {j}: error handling unspecified' for j in range(5)],
+            recommendations=[f'Document retry and timeout behaviour for component {j}' for j in range(5)],
+        ).build_markdown()
+        for i in range(100)
+    ]
+
+
 class TestLoopPerformance:
     @pytest.mark.asyncio
     async def test_decision_engine_performance_with_large_iteration_counts(self, project_name: str) -> None:
@@ -233,3 +253,26 @@ class TestLoopPerformance:
             # Second half should not be more than 2x slower than first half
             degradation_ratio = second_half_avg / first_half_avg if first_half_avg > 0 else 1
             assert degradation_ratio < 2.0, f'Performance degraded by {degradation_ratio:.2f}x'
+
+
+class TestCriticFeedbackParsePerformance:
+    def test_layout_parser_outpaces_tree_walk(self, realistic_feedback_documents: list[str]) -> None:
+        # Bypass the parse cache so every iteration does the full parse
+        start_time = time.perf_counter()
+        fast_results = [CriticFeedback._parse_markdown(markdown) for markdown in realistic_feedback_documents]
+        fast_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        tree_results = [
+            CriticFeedback._from_parts(CriticFeedback._extract_parts_from_tree(MarkdownDocument(markdown).tree))
+            for markdown in realistic_feedback_documents
+        ]
+        tree_time = time.perf_counter() - start_time
+
+        for fast, tree in zip(fast_results, tree_results, strict=True):
+            assert fast.model_dump(exclude={'timestamp'}) == tree.model_dump(exclude={'timestamp'})
+
+        # Performance requirement: the layout parser should be several times faster than the tree walk
+        assert fast_time * 3 < tree_time, (
+            f'Layout parser took {fast_time:.4f}s vs tree walk {tree_time:.4f}s, expected at least 3x faster'
+        )
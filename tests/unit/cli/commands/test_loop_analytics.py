@@ -0,0 +1,49 @@
+from argparse import Namespace
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+from src.cli.commands import loop_analytics
+from src.utils.enums import LoopType
+from src.utils.loop_state import LoopTypeAnalytics
+
+
+class TestLoopAnalyticsCommand:
+    @pytest.fixture
+    def container_status(self, mocker: MockerFixture) -> dict[str, object]:
+        status: dict[str, object] = {'name': 'respec-ai-server', 'running': True}
+        manager = mocker.patch('src.cli.commands.loop_analytics.DockerManager')
+        manager.return_value.get_container_status.return_value = status
+        return status
+
+    @pytest.fixture
+    def server_process(self, mocker: MockerFixture) -> MagicMock:
+        line = LoopTypeAnalytics(loop_type=LoopType.SPEC, loop_count=2, completed_count=1).model_dump_json()
+        process = MagicMock(stdout=[line + '\n'], returncode=0)
+        popen = mocker.patch('src.cli.commands.loop_analytics.subprocess.Popen')
+        popen.return_value.__enter__.return_value = process
+        return popen
+
+    @pytest.mark.usefixtures('container_status')
+    def test_runs_analytics_in_server_container(self, server_process: MagicMock) -> None:
+        result = loop_analytics.run(Namespace(project='test-project', json=False))
+
+        assert result == 0
+        command = server_process.call_args.args[0]
+        assert command[:3] == ['docker', 'exec', 'respec-ai-server']
+        assert command[-3:] == ['respec-loop-analytics', '--project', 'test-project']
+
+    @pytest.mark.usefixtures('container_status', 'server_process')
+    def test_json_output_passes_lines_through(self, capsys: pytest.CaptureFixture[str]) -> None:
+        result = loop_analytics.run(Namespace(project=None, json=True))
+
+        assert result == 0
+        assert LoopTypeAnalytics.model_validate_json(capsys.readouterr().out).loop_count == 2
+
+    def test_container_not_running(self, container_status: dict[str, object], server_process: MagicMock) -> None:
+        container_status['running'] = False
+
+        result = loop_analytics.run(Namespace(project=None, json=False))
+
+        assert result == 1
+        server_process.assert_not_called()
@@ -0,0 +1,83 @@
+import pytest
+from fastmcp.exceptions import ResourceError
+from pytest_mock import MockerFixture
+from src.mcp.tools.feedback_tools_unified import UnifiedFeedbackTools
+from src.models.enums import CriticAgent
+from src.models.feedback import CriticFeedback
+from src.utils.enums import LoopStatus, LoopType
+from src.utils.loop_state import LoopState
+from src.utils.state_manager import InMemoryStateManager
+
+
+def _feedback_markdown(loop_id: str, score: int) -> str:
+    return CriticFeedback(
+        loop_id=loop_id,
+        critic_agent=CriticAgent.SPEC_CRITIC,
+        iteration=1,
+        overall_score=score,
+        assessment_summary='Solid draft',
+        detailed_feedback='Details',
+        key_issues=['Missing error handling'],
+        recommendations=['Add retries'],
+    ).build_markdown()
+
+
+class TestStoreCriticFeedback:
+    @pytest.fixture
+    async def loop_state(self, isolated_state_manager: InMemoryStateManager) -> LoopState:
+        loop_state = LoopState(loop_type=LoopType.SPEC)
+        await isolated_state_manager.add_loop(loop_state, 'feedback-project')
+        return loop_state
+
+    @pytest.mark.asyncio
+    async def test_feedback_is_appended_through_state_manager(
+        self, isolated_state_manager: InMemoryStateManager, loop_state: LoopState, mocker: MockerFixture
+    ) -> None:
+        append_spy = mocker.spy(isolated_state_manager, 'append_feedback')
+        tools = UnifiedFeedbackTools(isolated_state_manager)
+
+        result = await tools.store_critic_feedback(loop_state.id, _feedback_markdown(loop_state.id, 72))
+
+        assert result.status == LoopStatus.IN_PROGRESS
+        assert 'Score: 72' in result.message
+        append_spy.assert_awaited_once()
+        stored = await isolated_state_manager.get_loop(loop_state.id)
+        assert [fb.overall_score for fb in stored.feedback_history] == [72]
+        assert (stored.current_score, stored.score_history) == (72, [72])
+
+    @pytest.mark.asyncio
+    async def test_unknown_loop_raises_resource_error(self, isolated_state_manager: InMemoryStateManager) -> None:
+        tools = UnifiedFeedbackTools(isolated_state_manager)
+
+        with pytest.raises(ResourceError, match='Loop does not exist'):
+            await tools.store_critic_feedback('missing1', _feedback_markdown('missing1', 72))
+
+
+class TestStateManagerBackedStorage:
+    @pytest.fixture
+    async def loop_state(self, isolated_state_manager: InMemoryStateManager) -> LoopState:
+        loop_state = LoopState(loop_type=LoopType.PLAN)
+        await isolated_state_manager.add_loop(loop_state, 'feedback-project')
+        return loop_state
+
+    @pytest.mark.asyncio
+    async def test_user_feedback_visible_to_other_tool_instances(
+        self, isolated_state_manager: InMemoryStateManager, loop_state: LoopState
+    ) -> None:
+        await UnifiedFeedbackTools(isolated_state_manager).store_user_feedback(loop_state.id, 'Focus on auth')
+
+        result = await UnifiedFeedbackTools(isolated_state_manager).get_feedback(loop_state.id)
+
+        assert '# User Feedback' in result.message
+        assert 'Focus on auth' in result.message
+        assert await isolated_state_manager.get_user_feedback(loop_state.id) == ['Focus on auth']
+
+    @pytest.mark.asyncio
+    async def test_analysis_visible_to_other_tool_instances(
+        self, isolated_state_manager: InMemoryStateManager, loop_state: LoopState
+    ) -> None:
+        await UnifiedFeedbackTools(isolated_state_manager).store_current_analysis(loop_state.id, 'Objectives: 3')
+
+        result = await UnifiedFeedbackTools(isolated_state_manager).get_previous_analysis(loop_state.id)
+
+        assert result.message == f'Previous analysis for loop {loop_state.id}:\n\nObjectives: 3'
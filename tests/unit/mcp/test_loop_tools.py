@@ -3,7 +3,7 @@ from src.mcp.tools.loop_tools import LoopTools, loop_tools
 from src.models.enums import CriticAgent
 from src.models.feedback import CriticFeedback
 from src.utils.enums import LoopStatus, LoopType
-from src.utils.errors import LoopStateError
+from src.utils.errors import LoopStateError, LoopValidationError
 from src.utils.loop_state import LoopState, MCPResponse
 from src.utils.state_manager import InMemoryStateManager
 
@@ -128,6 +128,40 @@ class TestLoopToolsMCP:
 
         assert 'No feedback available' in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_decide_loops_next_action_batch(self, project_name: str) -> None:
+        loop_ids = [(await loop_tools.initialize_refinement_loop(project_name, 'build_code')).id for _ in range(2)]
+        for loop_id, score in zip(loop_ids, [96, 80]):
+            loop_state = await loop_tools.state.get_loop(loop_id)
+            loop_state.add_feedback(
+                CriticFeedback(
+                    loop_id=loop_id,
+                    critic_agent=CriticAgent.BUILD_REVIEWER,
+                    iteration=1,
+                    overall_score=score,
+                    assessment_summary='Assessment',
+                    detailed_feedback='Details',
+                    key_issues=[],
+                    recommendations=[],
+                )
+            )
+
+        result = await loop_tools.decide_loops_next_action(loop_ids)
+
+        assert [response.status for response in result] == [LoopStatus.COMPLETED, LoopStatus.REFINE]
+
+    @pytest.mark.asyncio
+    async def test_decide_loops_next_action_rejects_empty_batch(self) -> None:
+        with pytest.raises(LoopValidationError, match='loop_ids'):
+            await loop_tools.decide_loops_next_action([])
+
+    @pytest.mark.asyncio
+    async def test_decide_loops_next_action_invalid_loop_id(self, project_name: str) -> None:
+        loop_id = (await loop_tools.initialize_refinement_loop(project_name, 'plan')).id
+
+        with pytest.raises(LoopStateError, match='nonexistent'):
+            await loop_tools.decide_loops_next_action([loop_id, 'nonexistent'])
+
     @pytest.mark.asyncio
     async def test_decide_loop_next_action_checkpoint_frequency(self, project_name: str) -> None:
         # Initialize a plan loop to test checkpoint frequency
@@ -189,6 +223,20 @@ class TestLoopToolsMCP:
         assert loop1.id in loop_ids
         assert loop2.id in loop_ids
 
+    @pytest.mark.asyncio
+    async def test_list_active_loops_filters_by_type(self) -> None:
+        await loop_tools.initialize_refinement_loop('filtered-project', 'plan')
+        spec_loop = await loop_tools.initialize_refinement_loop('filtered-project', 'spec')
+
+        active_loops = await loop_tools.list_active_loops('filtered-project', loop_types=[LoopType.SPEC], limit=1)
+
+        assert [loop.id for loop in active_loops] == [spec_loop.id]
+
+    @pytest.mark.asyncio
+    async def test_list_active_loops_rejects_non_positive_limit(self, project_name: str) -> None:
+        with pytest.raises(LoopValidationError):
+            await loop_tools.list_active_loops(project_name, limit=0)
+
 
 class TestLoopFeedbackIntegration:
     @pytest.fixture
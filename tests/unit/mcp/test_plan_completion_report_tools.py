@@ -21,8 +21,20 @@ def project_path() -> str:
 
 class TestPlanCompletionReportTools:
     @pytest.fixture
-    def mock_state_manager(self, mocker: MockerFixture) -> AsyncMock:
-        return mocker.AsyncMock()
+    def stored_reports(self) -> dict[str, str]:
+        return {}
+
+    @pytest.fixture
+    def mock_state_manager(self, mocker: MockerFixture, stored_reports: dict[str, str]) -> AsyncMock:
+        # Loop artifacts behave like the in-memory store, keyed by loop_id
+        state = mocker.AsyncMock()
+        state.store_loop_artifact.side_effect = lambda loop_id, kind, content: stored_reports.__setitem__(
+            loop_id, content
+        )
+        state.get_loop_artifact.side_effect = lambda loop_id, kind: stored_reports.get(loop_id)
+        state.list_loop_artifacts.side_effect = lambda kind, count: list(stored_reports.items())[-count:]
+        state.delete_loop_artifact.side_effect = lambda loop_id, kind: stored_reports.pop(loop_id, None)
+        return state
 
     @pytest.fixture
     def completion_report_tools(self, mock_state_manager: AsyncMock) -> PlanCompletionReportTools:
@@ -47,13 +59,14 @@ class TestPlanCompletionReportTools:
     async def test_create_completion_report_success(
         self,
         completion_report_tools: PlanCompletionReportTools,
+        stored_reports: dict[str, str],
         mock_state_manager: MagicMock,
         sample_completion_report: PlanCompletionReport,
         sample_loop_state: LoopState,
         project_path: str,
     ) -> None:
         loop_id = 'test-loop-123'
-        mock_state_manager.get_loop.return_value = sample_loop_state
+        mock_state_manager.get_loop_status.return_value = sample_loop_state.mcp_response
 
         result = await completion_report_tools.create_completion_report(project_path, sample_completion_report, loop_id)
 
@@ -61,8 +74,9 @@ class TestPlanCompletionReportTools:
         assert result.id == loop_id
         assert result.status == sample_loop_state.status
         assert 'Test Completion Report' in result.message
-        mock_state_manager.get_loop.assert_called_once_with(loop_id)
-        assert completion_report_tools._completion_reports[loop_id] == sample_completion_report
+        mock_state_manager.get_loop_status.assert_called_once_with(loop_id)
+        mock_state_manager.get_loop.assert_not_called()
+        assert PlanCompletionReport.model_validate_json(stored_reports[loop_id]) == sample_completion_report
 
     @pytest.mark.asyncio
     async def test_create_completion_report_none_report(
@@ -96,7 +110,7 @@ class TestPlanCompletionReportTools:
         project_path: str,
     ) -> None:
         loop_id = 'test-loop-123'
-        mock_state_manager.get_loop.return_value = sample_loop_state
+        mock_state_manager.get_loop_status.return_value = sample_loop_state.mcp_response
 
         # Create first report
         await completion_report_tools.create_completion_report(project_path, sample_completion_report, loop_id)
@@ -114,7 +128,7 @@ class TestPlanCompletionReportTools:
         project_path: str,
     ) -> None:
         loop_id = 'non-existent-loop'
-        mock_state_manager.get_loop.side_effect = LoopNotFoundError('Loop not found')
+        mock_state_manager.get_loop_status.side_effect = LoopNotFoundError('Loop not found')
 
         with pytest.raises(ResourceError, match='Loop does not exist'):
             await completion_report_tools.create_completion_report(project_path, sample_completion_report, loop_id)
@@ -123,38 +137,40 @@ class TestPlanCompletionReportTools:
     async def test_store_completion_report_success(
         self,
         completion_report_tools: PlanCompletionReportTools,
+        stored_reports: dict[str, str],
         mock_state_manager: MagicMock,
         sample_completion_report: PlanCompletionReport,
         sample_loop_state: LoopState,
         project_path: str,
     ) -> None:
         loop_id = 'test-loop-123'
-        mock_state_manager.get_loop.return_value = sample_loop_state
+        mock_state_manager.get_loop_status.return_value = sample_loop_state.mcp_response
 
         result = await completion_report_tools.store_completion_report(project_path, sample_completion_report, loop_id)
 
         assert isinstance(result, MCPResponse)
         assert result.id == loop_id
         assert 'Test Completion Report' in result.message
-        assert completion_report_tools._completion_reports[loop_id] == sample_completion_report
+        assert PlanCompletionReport.model_validate_json(stored_reports[loop_id]) == sample_completion_report
 
     @pytest.mark.asyncio
     async def test_get_completion_report_data_success(
         self,
         completion_report_tools: PlanCompletionReportTools,
+        stored_reports: dict[str, str],
         mock_state_manager: MagicMock,
         sample_completion_report: PlanCompletionReport,
         sample_loop_state: LoopState,
         project_path: str,
     ) -> None:
         loop_id = 'test-loop-123'
-        mock_state_manager.get_loop.return_value = sample_loop_state
-        completion_report_tools._completion_reports[loop_id] = sample_completion_report
+        mock_state_manager.loop_exists.return_value = True
+        stored_reports[loop_id] = sample_completion_report.model_dump_json()
 
         result = await completion_report_tools.get_completion_report_data(project_path, loop_id)
 
         assert result == sample_completion_report
-        mock_state_manager.get_loop.assert_called_once_with(loop_id)
+        mock_state_manager.loop_exists.assert_called_once_with(loop_id)
 
     @pytest.mark.asyncio
     async def test_get_completion_report_data_not_found(
@@ -165,7 +181,7 @@ class TestPlanCompletionReportTools:
         project_path: str,
     ) -> None:
         loop_id = 'test-loop-123'
-        mock_state_manager.get_loop.return_value = sample_loop_state
+        mock_state_manager.get_loop_status.return_value = sample_loop_state.mcp_response
 
         with pytest.raises(ResourceError, match='No completion report stored for this loop'):
             await completion_report_tools.get_completion_report_data(project_path, loop_id)
@@ -174,14 +190,15 @@ class TestPlanCompletionReportTools:
     async def test_get_completion_report_markdown_success(
         self,
         completion_report_tools: PlanCompletionReportTools,
+        stored_reports: dict[str, str],
         mock_state_manager: MagicMock,
         sample_completion_report: PlanCompletionReport,
         sample_loop_state: LoopState,
         project_path: str,
     ) -> None:
         loop_id = 'test-loop-123'
-        mock_state_manager.get_loop.return_value = sample_loop_state
-        completion_report_tools._completion_reports[loop_id] = sample_completion_report
+        mock_state_manager.get_loop_status.return_value = sample_loop_state.mcp_response
+        stored_reports[loop_id] = sample_completion_report.model_dump_json()
 
         result = await completion_report_tools.get_completion_report_markdown(project_path, loop_id)
 
@@ -194,14 +211,15 @@ class TestPlanCompletionReportTools:
     async def test_update_completion_report_success(
         self,
         completion_report_tools: PlanCompletionReportTools,
+        stored_reports: dict[str, str],
         mock_state_manager: MagicMock,
         sample_completion_report: PlanCompletionReport,
         sample_loop_state: LoopState,
         project_path: str,
     ) -> None:
         loop_id = 'test-loop-123'
-        mock_state_manager.get_loop.return_value = sample_loop_state
-        completion_report_tools._completion_reports[loop_id] = sample_completion_report
+        mock_state_manager.get_loop_status.return_value = sample_loop_state.mcp_response
+        stored_reports[loop_id] = sample_completion_report.model_dump_json()
 
         updated_report = PlanCompletionReport(report_title='Updated Report', final_plan_score='95')
 
@@ -209,7 +227,7 @@ class TestPlanCompletionReportTools:
 
         assert isinstance(result, MCPResponse)
         assert 'Updated Report' in result.message
-        assert completion_report_tools._completion_reports[loop_id] == updated_report
+        assert PlanCompletionReport.model_validate_json(stored_reports[loop_id]) == updated_report
 
     @pytest.mark.asyncio
     async def test_update_completion_report_not_found(
@@ -221,7 +239,7 @@ class TestPlanCompletionReportTools:
         project_path: str,
     ) -> None:
         loop_id = 'test-loop-123'
-        mock_state_manager.get_loop.return_value = sample_loop_state
+        mock_state_manager.get_loop_status.return_value = sample_loop_state.mcp_response
 
         with pytest.raises(ResourceError, match='No completion report stored for this loop'):
             await completion_report_tools.update_completion_report(project_path, sample_completion_report, loop_id)
@@ -241,6 +259,7 @@ class TestPlanCompletionReportTools:
     async def test_list_completion_reports_with_data(
         self,
         completion_report_tools: PlanCompletionReportTools,
+        stored_reports: dict[str, str],
         sample_completion_report: PlanCompletionReport,
         project_path: str,
     ) -> None:
@@ -250,8 +269,8 @@ class TestPlanCompletionReportTools:
         report1 = PlanCompletionReport(report_title='Report 1', final_plan_score='80')
         report2 = PlanCompletionReport(report_title='Report 2', final_plan_score='90')
 
-        completion_report_tools._completion_reports[loop_id1] = report1
-        completion_report_tools._completion_reports[loop_id2] = report2
+        stored_reports[loop_id1] = report1.model_dump_json()
+        stored_reports[loop_id2] = report2.model_dump_json()
 
         result = await completion_report_tools.list_completion_reports(project_path, count=10)
 
@@ -265,13 +284,16 @@ class TestPlanCompletionReportTools:
 
     @pytest.mark.asyncio
     async def test_list_completion_reports_with_count_limit(
-        self, completion_report_tools: PlanCompletionReportTools, project_path: str
+        self,
+        completion_report_tools: PlanCompletionReportTools,
+        stored_reports: dict[str, str],
+        project_path: str,
     ) -> None:
         # Create 5 reports
         for i in range(5):
             loop_id = f'loop-{i}'
             report = PlanCompletionReport(report_title=f'Report {i}', final_plan_score=f'{80 + i}')
-            completion_report_tools._completion_reports[loop_id] = report
+            stored_reports[loop_id] = report.model_dump_json()
 
         result = await completion_report_tools.list_completion_reports(project_path, count=3)
 
@@ -334,14 +356,15 @@ class TestPlanCompletionReportTools:
     async def test_delete_completion_report_success(
         self,
         completion_report_tools: PlanCompletionReportTools,
+        stored_reports: dict[str, str],
         mock_state_manager: MagicMock,
         sample_completion_report: PlanCompletionReport,
         sample_loop_state: LoopState,
         project_path: str,
     ) -> None:
         loop_id = 'test-loop-123'
-        mock_state_manager.get_loop.return_value = sample_loop_state
-        completion_report_tools._completion_reports[loop_id] = sample_completion_report
+        mock_state_manager.loop_exists.return_value = True
+        stored_reports[loop_id] = sample_completion_report.model_dump_json()
 
         result = await completion_report_tools.delete_completion_report(project_path, loop_id)
 
@@ -349,7 +372,7 @@ class TestPlanCompletionReportTools:
         assert result.id == loop_id
         assert result.status == LoopStatus.COMPLETED
         assert 'Test Completion Report' in result.message
-        assert loop_id not in completion_report_tools._completion_reports
+        assert loop_id not in stored_reports
 
     @pytest.mark.asyncio
     async def test_delete_completion_report_not_stored(
@@ -360,7 +383,7 @@ class TestPlanCompletionReportTools:
         project_path: str,
     ) -> None:
         loop_id = 'test-loop-123'
-        mock_state_manager.get_loop.return_value = sample_loop_state
+        mock_state_manager.loop_exists.return_value = True
 
         result = await completion_report_tools.delete_completion_report(project_path, loop_id)
 
@@ -372,7 +395,7 @@ class TestPlanCompletionReportTools:
         self, completion_report_tools: PlanCompletionReportTools, mock_state_manager: MagicMock, project_path: str
     ) -> None:
         loop_id = 'non-existent-loop'
-        mock_state_manager.get_loop.side_effect = LoopNotFoundError('Loop not found')
+        mock_state_manager.loop_exists.return_value = False
 
         with pytest.raises(ResourceError, match='Loop does not exist'):
             await completion_report_tools.delete_completion_report(project_path, loop_id)
@@ -380,7 +403,6 @@ class TestPlanCompletionReportTools:
     @pytest.mark.asyncio
     async def test_exception_handling_in_methods(
         self,
-        mocker: MockerFixture,
         completion_report_tools: PlanCompletionReportTools,
         mock_state_manager: MagicMock,
         project_path: str,
@@ -388,21 +410,20 @@ class TestPlanCompletionReportTools:
         loop_id = 'test-loop'
 
         # Test unexpected exception in create
-        mock_state_manager.get_loop.side_effect = Exception('Unexpected error')
+        mock_state_manager.get_loop_status.side_effect = Exception('Unexpected error')
         sample_report = PlanCompletionReport()
 
         with pytest.raises(ToolError, match='Unexpected error creating completion report'):
             await completion_report_tools.create_completion_report(project_path, sample_report, loop_id)
 
         # Test unexpected exception in get_completion_report_data
-        mock_state_manager.get_loop.side_effect = Exception('Unexpected error')
+        mock_state_manager.loop_exists.side_effect = Exception('Unexpected error')
 
         with pytest.raises(ToolError, match='Unexpected error retrieving completion report'):
             await completion_report_tools.get_completion_report_data(project_path, loop_id)
 
         # Test unexpected exception in list
-        completion_report_tools._completion_reports = mocker.Mock()
-        completion_report_tools._completion_reports.__bool__ = mocker.Mock(side_effect=Exception('Unexpected error'))  # type: ignore[attr-defined]
+        mock_state_manager.list_loop_artifacts.side_effect = Exception('Unexpected error')
 
         with pytest.raises(ToolError, match='Unexpected error listing completion reports'):
             await completion_report_tools.list_completion_reports(project_path)
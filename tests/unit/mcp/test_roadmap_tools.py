@@ -8,7 +8,7 @@ from src.mcp.tools.roadmap_tools import RoadmapTools
 from src.models.enums import RoadmapStatus
 from src.models.roadmap import Roadmap
 from src.models.spec import TechnicalSpec
-from src.utils.state_manager import StateManager
+from src.utils.state_manager import InMemoryStateManager, StateManager
 
 
 @pytest.fixture
@@ -135,6 +135,41 @@ class TestCreateRoadmap(TestRoadmapTools):
         assert isinstance(call_args[0][1], Roadmap)  # roadmap instance
         assert call_args[0][1].project_name == 'My Roadmap'
 
+    @pytest.mark.asyncio
+    async def test_create_roadmap_stores_specs_as_one_batch(
+        self, roadmap_tools: RoadmapTools, mock_state_manager: MagicMock, valid_spec_markdown: str
+    ) -> None:
+        first_spec = valid_spec_markdown.replace('User Authentication', 'user-authentication')
+        second_spec = valid_spec_markdown.replace('User Authentication', 'payment-processing')
+        roadmap_markdown = create_test_roadmap_markdown('My Roadmap') + first_spec + second_spec
+
+        result = await roadmap_tools.create_roadmap('project-123', roadmap_markdown)
+
+        assert 'with 2 specs' in result
+        mock_state_manager.store_spec.assert_not_called()
+        mock_state_manager.store_specs_bulk.assert_awaited_once()
+        project_name, specs = mock_state_manager.store_specs_bulk.call_args.args
+        assert project_name == 'project-123'
+        assert [spec.phase_name for spec in specs] == ['user-authentication', 'payment-processing']
+
+    @pytest.mark.asyncio
+    async def test_created_roadmap_lists_specs_in_document_order(
+        self, isolated_state_manager: InMemoryStateManager, valid_spec_markdown: str
+    ) -> None:
+        phase_names = ['zeta-phase', 'alpha-phase', 'mid-phase']
+        roadmap_markdown = create_test_roadmap_markdown('Ordered Roadmap') + ''.join(
+            valid_spec_markdown.replace('User Authentication', name) for name in phase_names
+        )
+        tools = RoadmapTools(isolated_state_manager)
+
+        await tools.create_roadmap('ordered-project', roadmap_markdown)
+        page = await tools.get_roadmap_page('ordered-project', offset=1, limit=2, include_metadata=False)
+
+        specs = await isolated_state_manager.get_roadmap_specs('ordered-project')
+        assert [spec.phase_name for spec in specs] == phase_names
+        assert page.markdown.index('mid-phase') > page.markdown.index('alpha-phase')
+        assert 'zeta-phase' not in page.markdown
+
     @pytest.mark.asyncio
     async def test_create_roadmap_raises_error_for_empty_project_name(
         self, roadmap_tools: RoadmapTools, mock_state_manager: MagicMock
@@ -224,6 +259,7 @@ class TestGetRoadmap(TestRoadmapTools):
             roadmap_status=RoadmapStatus.DRAFT,
         )
         mock_state_manager.get_roadmap.return_value = mock_roadmap
+        mock_state_manager.list_specs.return_value = ['spec1', 'spec2', 'spec3']
         mock_state_manager.get_roadmap_specs.return_value = mock_specs
 
         result = await roadmap_tools.get_roadmap('test-project')
@@ -269,6 +305,7 @@ class TestGetRoadmap(TestRoadmapTools):
             roadmap_status=RoadmapStatus.DRAFT,
         )
         mock_state_manager.get_roadmap.return_value = mock_roadmap
+        mock_state_manager.list_specs.return_value = []
         mock_state_manager.get_roadmap_specs.return_value = []
 
         result = await roadmap_tools.get_roadmap('empty-project')
@@ -279,3 +316,98 @@ class TestGetRoadmap(TestRoadmapTools):
         # Metadata should still be present
         assert '## Metadata' in result
         assert '### Spec Count\n0' in result
+
+
+class TestRoadmapPagination:
+    @pytest.fixture
+    async def paged_tools(self, isolated_state_manager: InMemoryStateManager) -> RoadmapTools:
+        await isolated_state_manager.store_roadmap('paged-project', Roadmap(project_name='Paged Roadmap'))
+        for i in range(5):
+            await isolated_state_manager.store_spec('paged-project', TechnicalSpec(phase_name=f'phase-{i}'))
+        return RoadmapTools(isolated_state_manager)
+
+    @pytest.mark.asyncio
+    async def test_page_renders_only_requested_window(self, paged_tools: RoadmapTools) -> None:
+        page = await paged_tools.get_roadmap_page('paged-project', offset=1, limit=2)
+
+        assert page.spec_count == 2
+        assert page.total_specs == 5
+        assert page.next_offset == 3
+        assert '# Technical Specification: phase-1' in page.markdown
+        assert '# Technical Specification: phase-2' in page.markdown
+        assert '# Technical Specification: phase-0' not in page.markdown
+        assert '# Technical Specification: phase-3' not in page.markdown
+        assert '### Spec Count\n5' in page.markdown
+
+    @pytest.mark.asyncio
+    async def test_last_page_has_no_next_offset(self, paged_tools: RoadmapTools) -> None:
+        page = await paged_tools.get_roadmap_page('paged-project', offset=3, limit=10, include_metadata=False)
+
+        assert page.spec_count == 2
+        assert page.next_offset is None
+        assert page.markdown.startswith('# Technical Specification: phase-3')
+        assert '# Project Roadmap' not in page.markdown
+
+    @pytest.mark.asyncio
+    async def test_spec_name_filter_applies_before_window(self, paged_tools: RoadmapTools) -> None:
+        page = await paged_tools.get_roadmap_page('paged-project', spec_names=['Phase 4', 'phase-0'], limit=1)
+
+        assert page.total_specs == 2
+        assert page.next_offset == 1
+        assert '# Technical Specification: phase-0' in page.markdown
+        assert '# Technical Specification: phase-4' not in page.markdown
+
+    @pytest.mark.asyncio
+    async def test_full_window_matches_get_roadmap(self, paged_tools: RoadmapTools) -> None:
+        page = await paged_tools.get_roadmap_page('paged-project')
+
+        assert page.markdown == await paged_tools.get_roadmap('paged-project')
+
+    @pytest.mark.asyncio
+    async def test_get_roadmap_renders_across_batches(
+        self, paged_tools: RoadmapTools, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        expected = (await paged_tools.get_roadmap_page('paged-project')).markdown
+        monkeypatch.setattr(paged_tools, 'RENDER_BATCH_SIZE', 2)
+
+        assert await paged_tools.get_roadmap('paged-project') == expected
+
+    @pytest.mark.asyncio
+    async def test_filtered_page_reports_filtered_spec_count(self, paged_tools: RoadmapTools) -> None:
+        page = await paged_tools.get_roadmap_page('paged-project', spec_names=['phase-1', 'phase-3'])
+
+        assert '### Spec Count\n2' in page.markdown
+
+    @pytest.mark.asyncio
+    async def test_section_filter_renders_only_requested_sections(
+        self, isolated_state_manager: InMemoryStateManager
+    ) -> None:
+        await isolated_state_manager.store_roadmap('sections-project', Roadmap(project_name='Sections Roadmap'))
+        await isolated_state_manager.store_spec(
+            'sections-project',
+            TechnicalSpec(phase_name='phase-a', objectives='Ship the API', architecture='Layered services'),
+        )
+        await isolated_state_manager.store_spec(
+            'sections-project', TechnicalSpec(phase_name='phase-b', objectives='Ship the UI')
+        )
+        tools = RoadmapTools(isolated_state_manager)
+
+        page = await tools.get_roadmap_page('sections-project', sections=['architecture'], include_metadata=False)
+
+        assert '# Technical Specification: phase-a' in page.markdown
+        assert '# Technical Specification: phase-b' in page.markdown
+        assert 'Layered services' in page.markdown
+        assert 'Ship the API' not in page.markdown
+        assert 'Ship the UI' not in page.markdown
+
+    @pytest.mark.asyncio
+    async def test_unknown_section_raises_tool_error(self, paged_tools: RoadmapTools) -> None:
+        with pytest.raises(ToolError, match='Unknown spec section'):
+            await paged_tools.get_roadmap_page('paged-project', sections=['Not A Section'])
+
+    @pytest.mark.asyncio
+    async def test_invalid_window_raises_tool_error(self, paged_tools: RoadmapTools) -> None:
+        with pytest.raises(ToolError, match='Offset cannot be negative'):
+            await paged_tools.get_roadmap_page('paged-project', offset=-1)
+        with pytest.raises(ToolError, match='Limit must be at least 1'):
+            await paged_tools.get_roadmap_page('paged-project', limit=0)
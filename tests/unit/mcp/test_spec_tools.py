@@ -0,0 +1,128 @@
+import pytest
+from pytest_mock import MockerFixture
+from fastmcp.exceptions import ResourceError, ToolError
+from src.mcp.tools.spec_tools import SpecTools
+from src.models.roadmap import Roadmap
+from src.models.spec import TechnicalSpec
+from src.utils.enums import LoopStatus, LoopType
+from src.utils.loop_state import LoopState
+from src.utils.state_manager import InMemoryStateManager
+
+
+class TestGetSpecSections:
+    @pytest.fixture
+    async def spec_tools(self, isolated_state_manager: InMemoryStateManager) -> SpecTools:
+        await isolated_state_manager.store_roadmap('section-project', Roadmap(project_name='Section Roadmap'))
+        await isolated_state_manager.store_spec(
+            'section-project',
+            TechnicalSpec(
+                phase_name='phase-1',
+                architecture='Layered services',
+                testing_strategy='Pytest',
+                additional_sections={'API Design': 'REST endpoints'},
+            ),
+        )
+        return SpecTools(isolated_state_manager)
+
+    @pytest.mark.asyncio
+    async def test_returns_only_requested_sections(self, spec_tools: SpecTools) -> None:
+        result = await spec_tools.get_spec_sections('section-project', 'phase-1', None, ['Architecture', 'API Design'])
+
+        assert result.id == 'section-project/phase-1'
+        assert result.status == LoopStatus.COMPLETED
+        assert '### Architecture\nLayered services' in result.message
+        assert '## API Design\nREST endpoints' in result.message
+        assert 'Testing Strategy' not in result.message
+        assert result.char_length == len(result.message)
+
+        full = await spec_tools.get_spec_markdown('section-project', 'phase-1', None)
+        assert full.char_length is not None and result.char_length < full.char_length
+
+    @pytest.mark.asyncio
+    async def test_resolves_spec_through_loop(
+        self, spec_tools: SpecTools, isolated_state_manager: InMemoryStateManager
+    ) -> None:
+        loop_state = LoopState(loop_type=LoopType.SPEC)
+        await isolated_state_manager.add_loop(loop_state, 'section-project')
+        await isolated_state_manager.link_loop_to_spec(loop_state.id, 'section-project', 'phase-1')
+
+        result = await spec_tools.get_spec_sections(None, None, loop_state.id, ['Testing Strategy'])
+
+        assert result.id == loop_state.id
+        assert '### Testing Strategy\nPytest' in result.message
+
+    @pytest.mark.asyncio
+    async def test_unknown_section_raises_tool_error(self, spec_tools: SpecTools) -> None:
+        with pytest.raises(ToolError, match='Unknown spec section'):
+            await spec_tools.get_spec_sections('section-project', 'phase-1', None, ['Nonexistent'])
+
+    @pytest.mark.asyncio
+    async def test_missing_arguments_raise_tool_error(self, spec_tools: SpecTools) -> None:
+        with pytest.raises(ToolError):
+            await spec_tools.get_spec_sections('section-project', 'phase-1', None, [])
+        with pytest.raises(ToolError):
+            await spec_tools.get_spec_sections('section-project', None, None, ['Architecture'])
+
+    @pytest.mark.asyncio
+    async def test_missing_spec_raises_resource_error(self, spec_tools: SpecTools) -> None:
+        with pytest.raises(ResourceError):
+            await spec_tools.get_spec_sections('section-project', 'phase-9', None, ['Architecture'])
+
+
+class TestPatchSpec:
+    @pytest.fixture
+    async def spec_tools(self, isolated_state_manager: InMemoryStateManager) -> SpecTools:
+        await isolated_state_manager.store_roadmap('patch-project', Roadmap(project_name='Patch Roadmap'))
+        await isolated_state_manager.store_spec(
+            'patch-project',
+            TechnicalSpec(phase_name='phase-1', objectives='Ship auth', architecture='Monolith'),
+        )
+        return SpecTools(isolated_state_manager)
+
+    @pytest.mark.asyncio
+    async def test_patch_updates_sections_and_bumps_version(
+        self, spec_tools: SpecTools, isolated_state_manager: InMemoryStateManager
+    ) -> None:
+        result = await spec_tools.patch_spec(
+            'patch-project', 'phase-1', {'Architecture': 'Services', 'Success Criteria': 'p95 < 200ms'}
+        )
+
+        spec = await isolated_state_manager.get_spec('patch-project', 'phase-1')
+        assert result == 'Updated spec "phase-1" to iteration 1, version 2'
+        assert spec.architecture == 'Services'
+        assert spec.success_criteria == 'p95 < 200ms'
+        assert spec.objectives == 'Ship auth'
+
+    @pytest.mark.asyncio
+    async def test_frozen_section_patch_raises_tool_error(self, spec_tools: SpecTools) -> None:
+        with pytest.raises(ToolError, match='frozen'):
+            await spec_tools.patch_spec('patch-project', 'phase-1', {'Objectives': 'Rewritten'})
+
+    @pytest.mark.asyncio
+    async def test_missing_spec_raises_resource_error(self, spec_tools: SpecTools) -> None:
+        with pytest.raises(ResourceError):
+            await spec_tools.patch_spec('patch-project', 'phase-9', {'Architecture': 'Services'})
+
+    @pytest.mark.asyncio
+    async def test_update_landing_after_read_is_not_overwritten(
+        self, spec_tools: SpecTools, isolated_state_manager: InMemoryStateManager, mocker: MockerFixture
+    ) -> None:
+        read_spec = await isolated_state_manager.get_spec('patch-project', 'phase-1')
+        await isolated_state_manager.store_spec(
+            'patch-project', TechnicalSpec(phase_name='phase-1', architecture='Concurrent')
+        )
+        # The tool's read returns the spec as it was before the concurrent store
+        mocker.patch.object(
+            isolated_state_manager,
+            'get_spec',
+            side_effect=[read_spec, await isolated_state_manager.get_spec('patch-project', 'phase-1')],
+        )
+
+        with pytest.raises(ToolError, match='modified concurrently'):
+            await spec_tools.patch_spec('patch-project', 'phase-1', {'Architecture': 'Services'})
+        assert isolated_state_manager._specs['patch-project']['phase-1'].architecture == 'Concurrent'
+
+    @pytest.mark.asyncio
+    async def test_empty_patches_raise_tool_error(self, spec_tools: SpecTools) -> None:
+        with pytest.raises(ToolError):
+            await spec_tools.patch_spec('patch-project', 'phase-1', {})
@@ -1,8 +1,11 @@
 from datetime import datetime
 
 import pytest
+from pytest_mock import MockerFixture
+from src.models import base
+from src.models.base import MarkdownDocument
 from src.models.enums import CriticAgent
-from src.models.feedback import CriticFeedback
+from src.models.feedback import CriticFeedback, _scan_conforming_layout
 
 
 class TestCriticFeedback:
@@ -275,3 +278,64 @@ Test analysis content.
         # Should default to ANALYST_CRITIC for unknown types
         assert feedback.critic_agent == CriticAgent.ANALYST_CRITIC
         assert feedback.loop_id == 'test-loop-123'
+
+
+@pytest.fixture
+def rendered_feedback() -> CriticFeedback:
+    return CriticFeedback(
+        loop_id='loop-42',
+        critic_agent=CriticAgent.BUILD_CRITIC,
+        iteration=2,
+        overall_score=78,
+        assessment_summary='Solid plan: a few gaps remain',
+        detailed_feedback='Coverage is good.\nError paths are thin.\n\n- Retry policy: undefined\n- Timeouts missing',
+        key_issues=['No retry policy', 'Deployment: manual steps'],
+        recommendations=['Add retries with backoff'],
+    )
+
+
+class TestCriticFeedbackFastPath:
+    def test_rendered_layout_skips_markdown_it(self, mocker: MockerFixture, rendered_feedback: CriticFeedback) -> None:
+        parse_spy = mocker.spy(base._MARKDOWN_PARSER, 'parse')
+
+        parsed = CriticFeedback.parse_markdown(rendered_feedback.build_markdown())
+
+        parse_spy.assert_not_called()
+        assert parsed.loop_id == 'loop-42'
+        assert parsed.critic_agent == CriticAgent.BUILD_CRITIC
+        assert parsed.overall_score == 78
+        assert parsed.key_issues == ['No retry policy', 'Deployment: manual steps']
+        assert parsed.recommendations == ['Add retries with backoff']
+
+    def test_fast_path_matches_tree_path(self, rendered_feedback: CriticFeedback) -> None:
+        markdown = rendered_feedback.build_markdown()
+
+        fast_parts = _scan_conforming_layout(markdown)
+        tree_parts = CriticFeedback._extract_parts_from_tree(MarkdownDocument(markdown).tree)
+
+        assert fast_parts == tree_parts
+
+    @pytest.mark.parametrize(
+        'analysis',
+        [
+            '```python\nprint(1)\n```',
+            'Uses *emphasis* here',
+            '    indented code',
+            '1. ordered item',
+            '- item\ncontinued lazily',
+            '- outer\n  - nested',
+            'Setext heading\n---',
+        ],
+    )
+    def test_non_conforming_input_falls_back_to_tree(
+        self, mocker: MockerFixture, rendered_feedback: CriticFeedback, analysis: str
+    ) -> None:
+        markdown = rendered_feedback.model_copy(update={'detailed_feedback': analysis}).build_markdown()
+        parse_spy = mocker.spy(base._MARKDOWN_PARSER, 'parse')
+
+        assert _scan_conforming_layout(markdown) is None
+        parsed = CriticFeedback.parse_markdown(markdown)
+
+        parse_spy.assert_called_once()
+        assert parsed.loop_id == 'loop-42'
+        assert parsed.overall_score == 78
@@ -1,7 +1,9 @@
+from collections import Counter
+
 from src.models.enums import CriticAgent
 from src.models.feedback import CriticFeedback
 from src.utils.enums import LoopType
-from src.utils.loop_state import LoopState
+from src.utils.loop_state import FeedbackStats, LoopState, ScoreDistribution, counted_percentile
 
 
 class TestEnhancedLoopState:
@@ -105,3 +107,101 @@ class TestEnhancedLoopState:
         # Test decision logic still works
         response = loop_state.decide_next_loop_action()
         assert response.id == loop_state.id
+
+
+def _feedback(loop_id: str, score: int, issues: list[str]) -> CriticFeedback:
+    return CriticFeedback(
+        loop_id=loop_id,
+        critic_agent=CriticAgent.SPEC_CRITIC,
+        iteration=1,
+        overall_score=score,
+        assessment_summary='Summary',
+        detailed_feedback='Details',
+        key_issues=issues,
+        recommendations=[],
+    )
+
+
+class TestFeedbackStats:
+    def test_stats_track_improvement_and_recurring_issues(self) -> None:
+        loop_state = LoopState(loop_type=LoopType.SPEC)
+        for score, issues in [(60, ['b', 'a']), (70, ['a']), (65, ['c', 'b']), (85, ['c'])]:
+            loop_state.add_feedback(_feedback(loop_state.id, score, issues))
+
+        stats = loop_state.feedback_stats
+
+        assert stats.count == 4
+        assert stats.mean_improvement == (85 - 60) / 3
+        assert stats.last_improvement == 20
+        # Ordered by first appearance, not by when the issue started recurring
+        assert stats.recurring_issues() == ['b', 'a', 'c']
+        assert stats.recurring_issues(limit=2) == ['b', 'a']
+
+    def test_stats_rebuilt_for_history_set_without_add_feedback(self) -> None:
+        loop_state = LoopState(loop_type=LoopType.SPEC)
+        loop_state.add_feedback(_feedback(loop_state.id, 50, ['a']))
+
+        loop_state.feedback_history = [_feedback(loop_state.id, 70, ['x']), _feedback(loop_state.id, 90, ['x'])]
+
+        stats = loop_state.feedback_stats
+        assert (stats.count, stats.last_improvement) == (2, 20)
+        assert stats.recurring_issues() == ['x']
+
+    def test_stats_do_not_affect_equality(self) -> None:
+        loop_state = LoopState(loop_type=LoopType.SPEC)
+        loop_state.add_feedback(_feedback(loop_state.id, 50, ['a']))
+
+        assert loop_state.model_copy(deep=True) == loop_state
+        assert LoopState.model_validate_json(loop_state.model_dump_json()) == loop_state
+        assert loop_state.model_copy(update={'current_score': 99}) != loop_state
+
+    def test_aggregates_restore_the_same_stats(self) -> None:
+        history = [
+            _feedback('loop1', score, issues) for score, issues in [(60, ['b', 'a']), (70, ['a', 'a']), (65, ['b'])]
+        ]
+        built = FeedbackStats.from_history(history)
+
+        restored = FeedbackStats.from_aggregates(
+            count=3,
+            first_score=60,
+            previous_score=70,
+            latest_score=65,
+            issues={'b': ((0, 0), 2), 'a': ((0, 1), 3)},
+            latest=history[-1],
+        )
+
+        assert (restored.mean_improvement, restored.last_improvement) == (
+            built.mean_improvement,
+            built.last_improvement,
+        )
+        assert restored.recurring_issues() == built.recurring_issues() == ['b', 'a']
+        assert restored.issue_counts == built.issue_counts
+
+    def test_seeded_stats_cover_history_beyond_loaded_window(self) -> None:
+        loop_state = LoopState(loop_type=LoopType.SPEC)
+        for score, issues in [(40, ['a']), (60, ['a']), (80, [])]:
+            loop_state.add_feedback(_feedback(loop_state.id, score, issues))
+        window = LoopState(loop_type=LoopType.SPEC, feedback_history=loop_state.feedback_history[-1:])
+
+        window.seed_feedback_stats(loop_state.feedback_stats)
+
+        assert window.feedback_stats.count == 3
+        assert window.feedback_stats.recurring_issues() == ['a']
+
+
+class TestCountedPercentile:
+    def test_interpolates_across_repeated_values(self) -> None:
+        counts = Counter([63, 70, 70, 92])
+
+        assert [counted_percentile(counts, fraction) for fraction in (0, 0.25, 0.5, 0.75, 1)] == [
+            63,
+            68.25,
+            70,
+            75.5,
+            92,
+        ]
+
+    def test_distribution_from_counts(self) -> None:
+        assert ScoreDistribution.from_counts(Counter({80: 3})) == ScoreDistribution(
+            minimum=80, p25=80, median=80, p75=80, maximum=80, mean=80
+        )
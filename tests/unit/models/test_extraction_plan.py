@@ -0,0 +1,54 @@
+from typing import ClassVar
+
+from src.models.base import ExtractionPlan, MCPModel
+from src.models.feature_requirements import FeatureRequirements
+from src.models.project_plan import ProjectPlan
+from src.models.spec import TechnicalSpec
+
+
+class _Checklist(MCPModel):
+    TITLE_PATTERN: ClassVar[str] = '# Checklist'
+    TITLE_FIELD: ClassVar[str] = 'name'
+    HEADER_FIELD_MAPPING: ClassVar[dict[str, tuple[str, ...]]] = {'items_list': ('Items',)}
+
+    name: str = ''
+    items: list[str] = []
+
+    def _render_markdown(self) -> str:
+        return f'# Checklist: {self.name}'
+
+
+class TestExtractionPlan:
+    def test_plan_compiled_per_subclass(self) -> None:
+        assert isinstance(TechnicalSpec._EXTRACTION_PLAN, ExtractionPlan)
+        assert TechnicalSpec._EXTRACTION_PLAN is not ProjectPlan._EXTRACTION_PLAN
+
+    def test_plan_mirrors_class_configuration(self) -> None:
+        plan = TechnicalSpec._EXTRACTION_PLAN
+
+        assert plan.title_prefix == 'Technical Specification'
+        assert plan.validate_kebab_title is True
+        assert [extraction.header_path for extraction in plan.extractions] == list(
+            TechnicalSpec.HEADER_FIELD_MAPPING.values()
+        )
+        assert 'Metadata' in plan.skipped_h2_headers
+        assert 'Overview' in plan.skipped_h2_headers
+
+    def test_missing_title_message_uses_readable_class_name(self) -> None:
+        assert ProjectPlan._EXTRACTION_PLAN.missing_title_message == 'Invalid project plan format: missing title'
+        assert (
+            FeatureRequirements._EXTRACTION_PLAN.missing_title_message
+            == 'Invalid feature requirements format: missing title'
+        )
+
+    def test_list_fields_store_under_base_name(self) -> None:
+        markdown = '# Checklist: release\n\n## Items\n- first\n- second\n'
+
+        checklist = _Checklist.parse_markdown(markdown)
+
+        assert _Checklist._EXTRACTION_PLAN.extractions[0].field_name == 'items'
+        assert checklist.items == ['first', 'second']
+
+    def test_additional_sections_capture_follows_model_fields(self) -> None:
+        assert TechnicalSpec._EXTRACTION_PLAN.captures_additional_sections is True
+        assert ProjectPlan._EXTRACTION_PLAN.captures_additional_sections is False
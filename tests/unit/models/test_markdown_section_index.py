@@ -0,0 +1,198 @@
+import pytest
+from markdown_it.token import Token
+from markdown_it.tree import SyntaxTreeNode
+from pytest_mock import MockerFixture
+from src.models import base
+from src.models.base import MarkdownDocument, MarkdownSectionIndex, MCPModel
+from src.models.spec import TechnicalSpec
+
+
+@pytest.fixture
+def sectioned_markdown() -> str:
+    return """# Technical Specification: test-spec
+
+## Overview
+
+### Objectives
+Build a web service
+
+### Scope
+API endpoints only
+
+## System Design
+
+### Architecture
+```python
+## not a real header in intent, but treated as one by the raw scanner
+```
+
+## Project Overview
+Overview text that should not be reached
+
+## Data Models
+
+- User
+- Post
+
+#### Deep Header
+Still part of Data Models
+
+## Metadata
+
+### Status
+draft"""
+
+
+class TestMarkdownSectionIndex:
+    def test_h3_content_is_sliced_between_headers(self, sectioned_markdown: str) -> None:
+        index = MarkdownSectionIndex(sectioned_markdown)
+
+        assert index.get_content(('Overview', 'Objectives')) == 'Build a web service'
+        assert index.get_content(('Overview', 'Scope')) == 'API endpoints only'
+
+    def test_h2_content_includes_nested_headers(self, sectioned_markdown: str) -> None:
+        index = MarkdownSectionIndex(sectioned_markdown)
+
+        content = index.get_content(('Data Models',))
+
+        assert content.startswith('- User')
+        assert '#### Deep Header' in content
+        assert content.endswith('Still part of Data Models')
+
+    def test_first_substring_match_wins(self, sectioned_markdown: str) -> None:
+        index = MarkdownSectionIndex(sectioned_markdown)
+
+        # '## Overview' appears before '## Project Overview'
+        assert index.get_content(('Overview',)).startswith('### Objectives')
+
+    def test_h3_lookup_confined_to_first_matching_h2(self, sectioned_markdown: str) -> None:
+        index = MarkdownSectionIndex(sectioned_markdown)
+
+        assert index.get_content(('Overview', 'Architecture')) == ''
+
+    def test_missing_headers_return_empty_string(self, sectioned_markdown: str) -> None:
+        index = MarkdownSectionIndex(sectioned_markdown)
+
+        assert index.get_content(('Nonexistent',)) == ''
+        assert index.get_content(('Metadata', 'Version')) == ''
+
+    def test_last_section_without_trailing_newline(self, sectioned_markdown: str) -> None:
+        index = MarkdownSectionIndex(sectioned_markdown)
+
+        assert index.get_content(('Metadata', 'Status')) == 'draft'
+
+    def test_header_on_last_line_has_empty_content(self) -> None:
+        index = MarkdownSectionIndex('# Title\n\n## Empty')
+
+        assert index.get_content(('Empty',)) == ''
+
+    def test_raw_scanner_headers_inside_fences_split_sections(self, sectioned_markdown: str) -> None:
+        index = MarkdownSectionIndex(sectioned_markdown)
+
+        assert index.get_content(('System Design', 'Architecture')) == '```python'
+
+
+class TestLazyTokenTree:
+    def test_spec_parse_skips_markdown_it(self, mocker: MockerFixture, sectioned_markdown: str) -> None:
+        parse_spy = mocker.spy(base._MARKDOWN_PARSER, 'parse')
+
+        spec = TechnicalSpec.parse_markdown(sectioned_markdown)
+
+        assert spec.phase_name == 'test-spec'
+        assert spec.objectives == 'Build a web service'
+        parse_spy.assert_not_called()
+
+    def test_fenced_h2_not_captured_as_additional_section(self, sectioned_markdown: str) -> None:
+        spec = TechnicalSpec.parse_markdown(sectioned_markdown)
+
+        assert spec.additional_sections is not None
+        assert list(spec.additional_sections) == ['Project Overview', 'Data Models']
+
+    def test_heading_with_markup_characters_falls_back_to_tree(self, mocker: MockerFixture) -> None:
+        parse_spy = mocker.spy(base._MARKDOWN_PARSER, 'parse')
+        markdown = '# Technical Specification: test-spec\n\n## API_Design\nREST endpoints\n'
+
+        spec = TechnicalSpec.parse_markdown(markdown)
+
+        assert spec.additional_sections == {'API_Design': 'REST endpoints'}
+        parse_spy.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ('markdown', 'expected_sections'),
+        [
+            # Setext H2 is invisible to the raw '## ' check
+            ('# Technical Specification: test-spec\n\nNotes\n-----\n\n## Extra\nbody\n', {'Extra': 'body'}),
+            # Indented ATX heading is still an H2 for markdown-it
+            ('# Technical Specification: test-spec\n\n  ## Extra\nbody\n', {}),
+            # Heading inside a blockquote
+            ('# Technical Specification: test-spec\n\n> ## Quoted\n\n## Extra\nbody\n', {'Extra': 'body'}),
+        ],
+    )
+    def test_ambiguous_heading_lines_fall_back_to_tree(
+        self, mocker: MockerFixture, markdown: str, expected_sections: dict[str, str]
+    ) -> None:
+        parse_spy = mocker.spy(base._MARKDOWN_PARSER, 'parse')
+
+        spec = TechnicalSpec.parse_markdown(markdown)
+
+        assert MarkdownSectionIndex(markdown).requires_tree
+        assert (spec.additional_sections or {}) == expected_sections
+        parse_spy.assert_called_once()
+
+    def test_setext_and_indented_titles_found_through_tree(self) -> None:
+        setext = TechnicalSpec.parse_markdown('Technical Specification: setext-spec\n===\n# Technical Specification: x')
+        indented = TechnicalSpec.parse_markdown('   # Technical Specification: indented-spec\n')
+
+        assert setext.phase_name == 'setext-spec'
+        assert indented.phase_name == 'indented-spec'
+
+    def test_document_tokenizes_once(self, mocker: MockerFixture, sectioned_markdown: str) -> None:
+        parse_spy = mocker.spy(base._MARKDOWN_PARSER, 'parse')
+        document = MarkdownDocument(sectioned_markdown)
+
+        assert document.tree is document.tree
+        parse_spy.assert_called_once()
+
+
+class TestTreeWalkers:
+    def test_nodes_returned_in_document_order(self) -> None:
+        tree = MarkdownDocument('# One\n\n- a\n  - b\n- c\n\n## Two\n').tree
+
+        headings = MCPModel._find_nodes_by_type(tree, 'heading')
+        items = MCPModel._find_nodes_by_type(tree, 'list_item')
+
+        assert [MCPModel._extract_text_content(node) for node in headings] == ['One', 'Two']
+        assert [MCPModel._extract_text_content(node) for node in items] == ['a b', 'b', 'c']
+
+    def test_text_content_joins_leaves_like_nested_joins(self) -> None:
+        tree = MarkdownDocument('- **Loop ID**: abc\n- plain\n').tree
+
+        assert MCPModel._extract_text_content(tree) == ' Loop ID : abc plain'
+
+    def test_root_lookups_reuse_type_index(self, mocker: MockerFixture) -> None:
+        tree = MarkdownDocument('# One\n\n- a\n- b\n').tree
+        build_spy = mocker.spy(base, '_build_node_type_index')
+
+        first = MCPModel._find_nodes_by_type(tree, 'list_item')
+        second = MCPModel._find_nodes_by_type(tree, 'heading')
+        first.clear()
+
+        assert len(MCPModel._find_nodes_by_type(tree, 'list_item')) == 2
+        assert len(second) == 1
+        build_spy.assert_called_once()
+
+    def test_deeply_nested_tree_does_not_recurse(self) -> None:
+        root = SyntaxTreeNode()
+        current = root
+        for _ in range(5000):
+            child = SyntaxTreeNode(
+                [Token('blockquote_open', 'blockquote', 1), Token('blockquote_close', 'blockquote', -1)],
+                create_root=False,
+            )
+            current.children = [child]
+            child.parent = current
+            current = child
+        current.children = [SyntaxTreeNode([Token('text', '', 0, content='deep')], create_root=False)]
+
+        assert MCPModel._extract_text_content(root) == 'deep'
+        assert len(MCPModel._find_nodes_by_type(root, 'blockquote')) == 5000
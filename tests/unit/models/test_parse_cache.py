@@ -0,0 +1,105 @@
+from typing import Callable
+
+import pytest
+from pytest_mock import MockerFixture
+from src.models.cache import ParseCache, parse_cache
+from src.models.enums import CriticAgent
+from src.models.feedback import CriticFeedback
+from src.models.project_plan import ProjectPlan
+from src.models.roadmap import Roadmap
+from src.models.spec import TechnicalSpec
+
+
+@pytest.fixture
+def spec_markdown(markdown_builder: Callable) -> str:
+    return markdown_builder(TechnicalSpec, phase_name='cached-spec', objectives='Cache parsed specs')
+
+
+class TestParseMarkdownCache:
+    def test_repeated_parse_hits_cache(self, mocker: MockerFixture, spec_markdown: str) -> None:
+        parse_spy = mocker.spy(TechnicalSpec, '_parse_markdown')
+
+        first = TechnicalSpec.parse_markdown(spec_markdown)
+        second = TechnicalSpec.parse_markdown(spec_markdown)
+
+        assert parse_spy.call_count == 1
+        assert parse_cache.hits == 1
+        assert parse_cache.misses == 1
+        assert second.model_dump(exclude={'id'}) == first.model_dump(exclude={'id'})
+
+    def test_hit_returns_independent_copy_with_fresh_generated_id(self, spec_markdown: str) -> None:
+        first = TechnicalSpec.parse_markdown(spec_markdown)
+        first.iteration = 7
+
+        second = TechnicalSpec.parse_markdown(spec_markdown)
+
+        assert second.iteration == 0
+        assert second.id != first.id
+
+    def test_cache_key_includes_model_class(self, markdown_builder: Callable) -> None:
+        markdown = markdown_builder(ProjectPlan, project_name='Shared Name')
+
+        ProjectPlan.parse_markdown(markdown)
+        with pytest.raises(ValueError):
+            Roadmap.parse_markdown(markdown)
+
+        assert parse_cache.hits == 0
+
+    def test_invalid_markdown_is_not_cached(self) -> None:
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                TechnicalSpec.parse_markdown('# Technical Specification: Not Kebab Case')
+
+        assert len(parse_cache) == 0
+
+    def test_feedback_timestamp_regenerated_on_hit(self) -> None:
+        feedback = CriticFeedback(
+            loop_id='abc12345',
+            critic_agent=CriticAgent.SPEC_CRITIC,
+            iteration=1,
+            overall_score=80,
+            assessment_summary='Solid',
+            detailed_feedback='Details',
+            key_issues=[],
+            recommendations=[],
+        )
+        markdown = feedback.build_markdown()
+
+        first = CriticFeedback.parse_markdown(markdown)
+        second = CriticFeedback.parse_markdown(markdown)
+
+        assert parse_cache.hits == 1
+        assert second.timestamp >= first.timestamp
+
+
+class TestParseCacheBounds:
+    def test_lru_eviction_by_entry_count(self, markdown_builder: Callable) -> None:
+        cache = ParseCache(max_entries=2)
+        markdowns = [markdown_builder(TechnicalSpec, phase_name=f'spec-{i}') for i in range(3)]
+        for markdown in markdowns:
+            cache.put(TechnicalSpec, markdown, TechnicalSpec.parse_markdown(markdown))
+
+        assert len(cache) == 2
+        assert cache.evictions == 1
+        assert cache.get(TechnicalSpec, markdowns[0]) is None
+        assert cache.get(TechnicalSpec, markdowns[2]) is not None
+
+    def test_eviction_by_total_size(self, spec_markdown: str) -> None:
+        cache = ParseCache(max_entries=10, max_bytes=len(spec_markdown) + 10)
+        other_markdown = spec_markdown.replace('cached-spec', 'cached-spec-2')
+
+        cache.put(TechnicalSpec, spec_markdown, TechnicalSpec.parse_markdown(spec_markdown))
+        cache.put(TechnicalSpec, other_markdown, TechnicalSpec.parse_markdown(other_markdown))
+
+        assert len(cache) == 1
+        assert cache.size_bytes == len(other_markdown)
+
+    def test_configure_zero_disables_and_clears(self, spec_markdown: str) -> None:
+        cache = ParseCache()
+        cache.put(TechnicalSpec, spec_markdown, TechnicalSpec.parse_markdown(spec_markdown))
+
+        cache.configure(max_entries=0, max_bytes=1024)
+
+        assert not cache.enabled
+        assert len(cache) == 0
+        assert cache.get(TechnicalSpec, spec_markdown) is None
@@ -6,6 +6,7 @@ parse -> build -> reparse cycles.
 
 import pytest
 from src.models.roadmap import Roadmap
+from src.models.spec import TechnicalSpec
 
 
 @pytest.fixture
@@ -672,3 +673,18 @@ draft
     assert roadmap.mitigation_plans == reparsed.mitigation_plans, (
         'Code blocks in mitigation plans changed during round-trip'
     )
+
+
+def test_memoized_metadata_still_reflects_spec_count() -> None:
+    roadmap = Roadmap(project_name='Memo Roadmap')
+    spec = TechnicalSpec(phase_name='phase-1-memo')
+
+    without_specs = roadmap.build_markdown()
+    with_specs = roadmap.build_markdown([spec])
+
+    assert without_specs.endswith('### Spec Count\n0\n')
+    assert '### Spec Count\n1\n' in with_specs
+    assert with_specs.endswith(spec.build_markdown())
+
+    roadmap.project_goal = 'Updated goal'
+    assert '### Project Goal\nUpdated goal' in roadmap.build_markdown()
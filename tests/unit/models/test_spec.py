@@ -1,4 +1,5 @@
 import pytest
+from pytest_mock import MockerFixture
 from src.models.enums import SpecStatus
 from src.models.spec import TechnicalSpec
 
@@ -233,3 +234,140 @@ class TestTechnicalSpecMarkdownBuilding:
         assert original_spec.success_criteria == reparsed_spec.success_criteria
         assert original_spec.integration_context == reparsed_spec.integration_context
         assert original_spec.spec_status == reparsed_spec.spec_status
+
+
+class TestTechnicalSpecMarkdownMemoization:
+    @pytest.fixture
+    def spec(self) -> TechnicalSpec:
+        return TechnicalSpec(phase_name='memo-spec', architecture='Layered')
+
+    def test_build_markdown_renders_once(self, mocker: MockerFixture, spec: TechnicalSpec) -> None:
+        render_spy = mocker.spy(TechnicalSpec, '_render_markdown')
+
+        first = spec.build_markdown()
+        second = spec.build_markdown()
+
+        assert first is second
+        assert render_spy.call_count == 1
+
+    def test_field_assignment_invalidates_rendered_markdown(self, spec: TechnicalSpec) -> None:
+        spec.build_markdown()
+
+        spec.iteration = 3
+        spec.architecture = 'Hexagonal'
+
+        markdown = spec.build_markdown()
+        assert '### Iteration\n3' in markdown
+        assert '### Architecture\nHexagonal' in markdown
+
+    def test_model_copy_with_update_does_not_reuse_rendered_markdown(self, spec: TechnicalSpec) -> None:
+        spec.build_markdown()
+
+        copied = spec.model_copy(update={'architecture': 'Event-driven'})
+
+        assert '### Architecture\nEvent-driven' in copied.build_markdown()
+        assert '### Architecture\nLayered' in spec.build_markdown()
+
+    def test_seeded_markdown_is_returned_without_rendering(self, mocker: MockerFixture, spec: TechnicalSpec) -> None:
+        render_spy = mocker.spy(TechnicalSpec, '_render_markdown')
+        stored_markdown = TechnicalSpec(phase_name='memo-spec', architecture='Layered').build_markdown()
+        render_spy.reset_mock()
+
+        spec.seed_rendered_markdown(stored_markdown)
+
+        assert spec.build_markdown() == stored_markdown
+        render_spy.assert_not_called()
+
+
+class TestTechnicalSpecSections:
+    @pytest.fixture
+    def spec(self) -> TechnicalSpec:
+        return TechnicalSpec(
+            phase_name='sectioned-spec',
+            architecture='Layered services',
+            technology_stack='Python, PostgreSQL',
+            testing_strategy='Pytest with integration suites',
+            additional_sections={'Data Models': '- User\n- Session'},
+            iteration=2,
+        )
+
+    def test_h3_sections_render_under_their_h2_groups(self, spec: TechnicalSpec) -> None:
+        markdown = spec.build_sections_markdown(['Testing Strategy', 'Architecture'])
+
+        assert markdown == (
+            '# Technical Specification: sectioned-spec\n'
+            '\n## System Design\n'
+            '\n### Architecture\nLayered services\n'
+            '\n## Implementation\n'
+            '\n### Testing Strategy\nPytest with integration suites\n'
+        )
+
+    def test_h2_group_includes_every_populated_section(self, spec: TechnicalSpec) -> None:
+        markdown = spec.build_sections_markdown(['system design'])
+
+        assert '### Architecture\nLayered services' in markdown
+        assert '### Technology Stack\nPython, PostgreSQL' in markdown
+        assert '## Implementation' not in markdown
+
+    def test_sections_match_full_document_content(self, spec: TechnicalSpec) -> None:
+        full = TechnicalSpec.parse_markdown(spec.build_markdown())
+        partial = TechnicalSpec.parse_markdown(spec.build_sections_markdown(['Data Models', 'Metadata']))
+
+        assert partial.additional_sections == full.additional_sections
+        assert partial.iteration == full.iteration == 2
+        assert partial.architecture is None
+
+    def test_empty_sections_are_omitted(self, spec: TechnicalSpec) -> None:
+        markdown = spec.build_sections_markdown(['Success Criteria'])
+
+        assert markdown == '# Technical Specification: sectioned-spec\n'
+
+    def test_unknown_section_raises_value_error(self, spec: TechnicalSpec) -> None:
+        with pytest.raises(ValueError, match='Unknown spec section'):
+            spec.build_sections_markdown(['Architecture', 'Nonexistent'])
+
+
+class TestTechnicalSpecSectionPatches:
+    @pytest.fixture
+    def spec(self) -> TechnicalSpec:
+        return TechnicalSpec(
+            phase_name='patched-spec',
+            objectives='Original objectives',
+            architecture='Layered services',
+            testing_strategy='Unit tests',
+            additional_sections={'Data Models': '- User'},
+            iteration=2,
+            version=2,
+        )
+
+    def test_patches_by_path_and_bare_name(self, spec: TechnicalSpec) -> None:
+        patched = spec.apply_section_patches(
+            {'System Design/Architecture': '  Hexagonal  ', 'Testing Strategy': 'Contract tests'}
+        )
+
+        assert patched.architecture == 'Hexagonal'
+        assert patched.testing_strategy == 'Contract tests'
+        assert patched.id == spec.id
+        assert patched.iteration == 2
+        assert spec.architecture == 'Layered services'
+
+    def test_additional_sections_are_created_replaced_and_cleared(self, spec: TechnicalSpec) -> None:
+        patched = spec.apply_section_patches({'API Design': 'REST', 'Data Models': ''})
+
+        assert patched.additional_sections == {'API Design': 'REST'}
+
+    def test_empty_content_clears_optional_section(self, spec: TechnicalSpec) -> None:
+        assert spec.apply_section_patches({'Architecture': ''}).architecture is None
+
+    @pytest.mark.parametrize(
+        ('key', 'message'),
+        [
+            ('Overview/Objectives', 'frozen'),
+            ('Iteration', 'managed automatically'),
+            ('System Design', 'groups several sections'),
+            ('Implementation/Architecture', 'Unknown spec section'),
+        ],
+    )
+    def test_rejected_patches_raise_value_error(self, spec: TechnicalSpec, key: str, message: str) -> None:
+        with pytest.raises(ValueError, match=message):
+            spec.apply_section_patches({key: 'new content'})
@@ -0,0 +1,271 @@
+from collections.abc import Callable
+
+import pytest
+from pytest_mock import MockerFixture
+from src.models.enums import CriticAgent
+from src.models.feedback import CriticFeedback
+from src.models.roadmap import Roadmap
+from src.models.spec import TechnicalSpec
+from src.utils.enums import LoopType
+from src.utils.errors import LoopNotFoundError
+from src.utils.loop_state import LoopState
+from src.utils.state_manager import CachedStateManager, InMemoryStateManager
+from src.utils.state_manager.cached import CacheInvalidationChannel, CacheKey, ModelCache
+
+
+class FakeChannel(CacheInvalidationChannel):
+    def __init__(self) -> None:
+        self.published: list[CacheKey] = []
+        self.connected = True
+        self.on_invalidate: Callable[[CacheKey], None] | None = None
+        self.on_reset: Callable[[], None] | None = None
+
+    @property
+    def listening(self) -> bool:
+        return self.connected
+
+    async def publish(self, keys: list[CacheKey]) -> None:
+        self.published.extend(keys)
+
+    async def subscribe(self, on_invalidate: Callable[[CacheKey], None], on_reset: Callable[[], None]) -> None:
+        self.on_invalidate = on_invalidate
+        self.on_reset = on_reset
+
+    async def close(self) -> None:
+        self.connected = False
+
+
+class FailingChannel(FakeChannel):
+    async def publish(self, keys: list[CacheKey]) -> None:
+        raise ConnectionError('notify failed')
+
+
+class TestModelCache:
+    def test_least_recently_used_entry_evicted(self) -> None:
+        cache = ModelCache(max_entries=2)
+        for key in [('spec', 'p', 'a'), ('spec', 'p', 'b')]:
+            cache.put(key, key[-1], cache.generation)
+
+        cache.get(('spec', 'p', 'a'))
+        cache.put(('spec', 'p', 'c'), 'c', cache.generation)
+
+        assert cache.get(('spec', 'p', 'b')) is None
+        assert cache.get(('spec', 'p', 'a')) == 'a'
+        assert len(cache) == 2
+
+    def test_prefix_invalidation(self) -> None:
+        cache = ModelCache(max_entries=10)
+        cache.put(('spec', 'p1', 'a'), 'a', cache.generation)
+        cache.put(('spec', 'p2', 'a'), 'a', cache.generation)
+        cache.put(('roadmap', 'p1'), 'r', cache.generation)
+
+        cache.invalidate(('spec', 'p1'))
+
+        assert cache.get(('spec', 'p1', 'a')) is None
+        assert cache.get(('spec', 'p2', 'a')) == 'a'
+        assert cache.get(('roadmap', 'p1')) == 'r'
+
+    def test_read_overlapping_invalidation_is_not_cached(self) -> None:
+        cache = ModelCache(max_entries=10)
+        generation = cache.generation
+
+        cache.invalidate(('spec', 'p', 'a'))
+        cache.put(('spec', 'p', 'a'), 'stale', generation)
+
+        assert cache.get(('spec', 'p', 'a')) is None
+
+    def test_size_must_be_positive(self) -> None:
+        with pytest.raises(ValueError, match='at least 1'):
+            ModelCache(max_entries=0)
+
+    def test_entries_expire_after_ttl(self, mocker: MockerFixture) -> None:
+        clock = mocker.patch('src.utils.state_manager.cached.monotonic', return_value=100.0)
+        cache = ModelCache(max_entries=10, ttl=30)
+        cache.put(('spec', 'p', 'a'), 'a', cache.generation)
+
+        clock.return_value = 129.0
+        assert cache.get(('spec', 'p', 'a')) == 'a'
+        clock.return_value = 130.0
+        assert cache.get(('spec', 'p', 'a')) is None
+        assert (len(cache), cache.stats()['expirations']) == (0, 1)
+
+    def test_ttl_must_be_positive(self) -> None:
+        with pytest.raises(ValueError, match='TTL must be positive'):
+            ModelCache(max_entries=10, ttl=0)
+
+
+class TestCachedStateManager:
+    @pytest.fixture
+    def inner(self) -> InMemoryStateManager:
+        return InMemoryStateManager(max_history_size=3)
+
+    @pytest.fixture
+    def channel(self) -> FakeChannel:
+        return FakeChannel()
+
+    @pytest.fixture
+    async def cached(self, inner: InMemoryStateManager, channel: FakeChannel) -> CachedStateManager:
+        manager = CachedStateManager(inner, max_entries=16, channel=channel)
+        await manager.start()
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_served_from_cache(
+        self, cached: CachedStateManager, inner: InMemoryStateManager, mocker: MockerFixture
+    ) -> None:
+        await cached.store_spec('test-project', TechnicalSpec(phase_name='Cached Spec'))
+        get_spy = mocker.spy(inner, 'get_spec')
+
+        first = await cached.get_spec('test-project', 'cached-spec')
+        second = await cached.get_spec('test-project', 'Cached Spec')
+
+        assert first == second
+        assert get_spy.await_count == 1
+        assert cached.cache_stats()['hits'] == 1
+
+    @pytest.mark.asyncio
+    async def test_callers_get_independent_copies(self, cached: CachedStateManager) -> None:
+        await cached.store_spec('test-project', TechnicalSpec(phase_name='cached-spec', architecture='v1'))
+        first = await cached.get_spec('test-project', 'cached-spec')
+
+        first.architecture = 'mutated'
+        second = await cached.get_spec('test-project', 'cached-spec')
+        second.architecture = 'mutated again'
+
+        assert (await cached.get_spec('test-project', 'cached-spec')).architecture == 'v1'
+        assert cached.cache_stats()['hits'] == 2
+
+    @pytest.mark.asyncio
+    async def test_feedback_limit_slices_cached_history(self, cached: CachedStateManager) -> None:
+        loop = LoopState(loop_type=LoopType.SPEC)
+        await cached.add_loop(loop, 'test-project')
+        for score in (40, 60, 80):
+            await cached.append_feedback(
+                loop.id,
+                CriticFeedback(
+                    loop_id=loop.id,
+                    critic_agent=CriticAgent.SPEC_CRITIC,
+                    iteration=1,
+                    overall_score=score,
+                    assessment_summary='Summary',
+                    detailed_feedback='Details',
+                    key_issues=[],
+                    recommendations=[],
+                ),
+            )
+        await cached.get_loop(loop.id)
+
+        recent = await cached.get_loop(loop.id, feedback_limit=2)
+
+        assert [feedback.overall_score for feedback in recent.feedback_history] == [60, 80]
+        assert len((await cached.get_loop(loop.id)).feedback_history) == 3
+
+    @pytest.mark.asyncio
+    async def test_publish_failure_does_not_mask_write_error(self, inner: InMemoryStateManager) -> None:
+        cached = CachedStateManager(inner, max_entries=16, channel=FailingChannel())
+        await cached.start()
+
+        with pytest.raises(LoopNotFoundError):
+            await cached.decide_loop_next_action('missing')
+        # A successful write still succeeds when the broadcast fails
+        await cached.store_roadmap('test-project', Roadmap(project_name='Stored'))
+
+        assert (await cached.get_roadmap('test-project')).project_name == 'Stored'
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_locally_and_publish(
+        self, cached: CachedStateManager, channel: FakeChannel
+    ) -> None:
+        await cached.store_spec('test-project', TechnicalSpec(phase_name='cached-spec', architecture='v1'))
+        await cached.get_spec('test-project', 'cached-spec')
+
+        await cached.update_spec(
+            'test-project', 'cached-spec', TechnicalSpec(phase_name='cached-spec', architecture='v2')
+        )
+
+        assert (await cached.get_spec('test-project', 'cached-spec')).architecture == 'v2'
+        assert channel.published[-1] == ('spec', 'test-project', 'cached-spec')
+
+    @pytest.mark.asyncio
+    async def test_remote_invalidation_drops_entry(
+        self, cached: CachedStateManager, inner: InMemoryStateManager, channel: FakeChannel
+    ) -> None:
+        await cached.store_roadmap('test-project', Roadmap(project_name='Original'))
+        await cached.get_roadmap('test-project')
+
+        # Another process writes straight to the shared backend and announces it
+        await inner.store_roadmap('test-project', Roadmap(project_name='Replaced'))
+        assert channel.on_invalidate is not None
+        channel.on_invalidate(('roadmap', 'test-project'))
+
+        assert (await cached.get_roadmap('test-project')).project_name == 'Replaced'
+
+    @pytest.mark.asyncio
+    async def test_cache_bypassed_while_channel_disconnected(
+        self, cached: CachedStateManager, inner: InMemoryStateManager, channel: FakeChannel, mocker: MockerFixture
+    ) -> None:
+        await cached.store_spec('test-project', TechnicalSpec(phase_name='cached-spec'))
+        channel.connected = False
+        get_spy = mocker.spy(inner, 'get_spec')
+
+        await cached.get_spec('test-project', 'cached-spec')
+        await cached.get_spec('test-project', 'cached-spec')
+
+        assert get_spy.await_count == 2
+        assert cached.cache_stats()['entries'] == 0
+
+    @pytest.mark.asyncio
+    async def test_channel_reset_flushes_cache(
+        self, cached: CachedStateManager, inner: InMemoryStateManager, channel: FakeChannel, mocker: MockerFixture
+    ) -> None:
+        await cached.store_spec('test-project', TechnicalSpec(phase_name='cached-spec'))
+        await cached.get_spec('test-project', 'cached-spec')
+        get_spy = mocker.spy(inner, 'get_spec')
+
+        assert channel.on_reset is not None
+        channel.on_reset()
+        await cached.get_spec('test-project', 'cached-spec')
+
+        assert get_spy.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_evicted_loops_are_not_served_from_cache(self, cached: CachedStateManager) -> None:
+        loops = [LoopState(loop_type=LoopType.PLAN) for _ in range(4)]
+        await cached.add_loop(loops[0], 'test-project')
+        await cached.get_loop(loops[0].id)
+
+        # The wrapped manager keeps 3 loops, so the fourth evicts the first
+        for loop in loops[1:]:
+            await cached.add_loop(loop, 'test-project')
+
+        with pytest.raises(LoopNotFoundError):
+            await cached.get_loop(loops[0].id)
+
+    @pytest.mark.asyncio
+    async def test_loop_status_uses_cached_loop(
+        self, cached: CachedStateManager, inner: InMemoryStateManager, mocker: MockerFixture
+    ) -> None:
+        loop = LoopState(loop_type=LoopType.SPEC)
+        await cached.add_loop(loop, 'test-project')
+        await cached.get_loop(loop.id)
+        status_spy = mocker.spy(inner, 'get_loop_status')
+
+        status = await cached.get_loop_status(loop.id)
+
+        assert status.id == loop.id
+        status_spy.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_batch_decision_invalidates_each_loop(
+        self, cached: CachedStateManager, inner: InMemoryStateManager, channel: FakeChannel, mocker: MockerFixture
+    ) -> None:
+        loops = [LoopState(loop_type=LoopType.SPEC) for _ in range(2)]
+        for loop in loops:
+            await cached.add_loop(loop, 'test-project')
+            await cached.get_loop(loop.id)
+        mocker.patch.object(inner, 'decide_loops_next_action', return_value=[])
+
+        await cached.decide_loops_next_action([loops[0].id, loops[1].id, loops[0].id])
+
+        assert channel.published[-2:] == [('loop', loops[0].id), ('loop', loops[1].id)]
+        assert cached.cache_stats()['entries'] == 0
@@ -1,19 +1,25 @@
+import asyncio
+from datetime import datetime
+
 import pytest
+from pytest_mock import MockerFixture
 
-from src.models.enums import ProjectStatus, RoadmapStatus, SpecStatus
+from src.models.enums import CriticAgent, ProjectStatus, RoadmapStatus, SpecStatus
+from src.models.feedback import CriticFeedback
 from src.models.project_plan import ProjectPlan
 from src.models.roadmap import Roadmap
 from src.models.spec import TechnicalSpec
-from src.utils.enums import LoopType
+from src.utils.enums import LoopArtifactKind, LoopStatus, LoopType
 from src.utils.errors import (
     LoopAlreadyExistsError,
     LoopNotFoundError,
     ProjectPlanNotFoundError,
     RoadmapNotFoundError,
     SpecNotFoundError,
+    SpecVersionConflictError,
 )
-from src.utils.loop_state import LoopState
-from src.utils.state_manager import PostgresStateManager
+from src.utils.loop_state import LoopState, ScoreDistribution
+from src.utils.state_manager import CachedStateManager, PostgresCacheInvalidationChannel, PostgresStateManager
 
 
 @pytest.fixture
@@ -330,6 +336,130 @@ class TestDatabaseSpecOperations:
         result = await db_state_manager.delete_spec('nonexistent-project', 'nonexistent-spec')
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_concurrent_store_spec_loses_no_versions(
+        self, db_state_manager: PostgresStateManager, sample_spec: TechnicalSpec
+    ) -> None:
+        project_name = 'concurrent-project'
+        await db_state_manager.store_spec(project_name, sample_spec.model_copy())
+
+        await asyncio.gather(*(db_state_manager.store_spec(project_name, sample_spec.model_copy()) for _ in range(5)))
+        stored = await db_state_manager.get_spec(project_name, sample_spec.phase_name)
+
+        assert (stored.iteration, stored.version) == (sample_spec.iteration + 5, sample_spec.version + 5)
+        assert f'### Version\n{stored.version}' in stored.build_markdown()
+
+    @pytest.mark.asyncio
+    async def test_update_spec_raises_when_spec_missing(
+        self, db_state_manager: PostgresStateManager, sample_spec: TechnicalSpec
+    ) -> None:
+        with pytest.raises(SpecNotFoundError):
+            await db_state_manager.update_spec('missing-project', sample_spec.phase_name, sample_spec)
+
+    @pytest.mark.asyncio
+    async def test_update_spec_with_stale_version_is_rejected(
+        self, db_state_manager: PostgresStateManager, sample_spec: TechnicalSpec
+    ) -> None:
+        project_name = 'conflict-project'
+        await db_state_manager.store_spec(project_name, sample_spec.model_copy())
+        read = await db_state_manager.get_spec(project_name, sample_spec.phase_name)
+        await db_state_manager.update_spec(
+            project_name, sample_spec.phase_name, read.model_copy(update={'architecture': 'first'}), read.version
+        )
+
+        with pytest.raises(SpecVersionConflictError):
+            await db_state_manager.update_spec(
+                project_name, sample_spec.phase_name, read.model_copy(update={'architecture': 'second'}), read.version
+            )
+        stored = await db_state_manager.get_spec(project_name, sample_spec.phase_name)
+        assert (stored.architecture, stored.version) == ('first', read.version + 1)
+
+    @pytest.mark.asyncio
+    async def test_spec_read_after_update_is_served_from_stored_render(
+        self, mocker: MockerFixture, db_state_manager: PostgresStateManager, sample_spec: TechnicalSpec
+    ) -> None:
+        project_name = 'render-project'
+        await db_state_manager.store_spec(project_name, sample_spec.model_copy())
+        await db_state_manager.update_spec(
+            project_name, sample_spec.phase_name, sample_spec.model_copy(update={'architecture': 'v2'})
+        )
+        backfilled = await db_state_manager.get_spec(project_name, sample_spec.phase_name)
+
+        render_spy = mocker.spy(TechnicalSpec, '_render_markdown')
+        stored = await db_state_manager.get_spec(project_name, sample_spec.phase_name)
+
+        assert stored.build_markdown() == backfilled.build_markdown()
+        assert 'v2' in stored.build_markdown()
+        render_spy.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_store_specs_bulk_versions_existing_and_repeated_specs(
+        self, db_state_manager: PostgresStateManager, sample_spec: TechnicalSpec
+    ) -> None:
+        project_name = 'bulk-project'
+        await db_state_manager.store_spec(project_name, sample_spec.model_copy())
+
+        names = await db_state_manager.store_specs_bulk(
+            project_name,
+            [
+                sample_spec.model_copy(update={'architecture': 'v2'}),
+                sample_spec.model_copy(update={'phase_name': 'Other Spec'}),
+                sample_spec.model_copy(update={'architecture': 'v3'}),
+            ],
+        )
+        stored = await db_state_manager.get_spec(project_name, sample_spec.phase_name)
+
+        assert names == [sample_spec.phase_name, 'Other Spec', sample_spec.phase_name]
+        assert (stored.version, stored.architecture) == (3, 'v3')
+        assert sorted(await db_state_manager.list_specs(project_name)) == ['other-spec', 'sample-spec']
+
+    @pytest.mark.asyncio
+    async def test_store_specs_bulk_copies_versions_back(
+        self, db_state_manager: PostgresStateManager, sample_spec: TechnicalSpec
+    ) -> None:
+        project_name = 'bulk-versions-project'
+        first = sample_spec.model_copy()
+        second = sample_spec.model_copy(update={'architecture': 'v2'})
+
+        await db_state_manager.store_specs_bulk(project_name, [first, second])
+
+        assert (first.iteration, first.version) == (0, 1)
+        assert (second.iteration, second.version) == (1, 2)
+
+    @pytest.mark.asyncio
+    async def test_store_specs_bulk_keeps_list_order(
+        self, db_state_manager: PostgresStateManager, sample_roadmap: Roadmap, sample_spec: TechnicalSpec
+    ) -> None:
+        project_name = 'bulk-order-project'
+        phase_names = ['Zeta Phase', 'Alpha Phase', 'Mid Phase', 'Beta Phase']
+        await db_state_manager.store_roadmap(project_name, sample_roadmap)
+
+        await db_state_manager.store_specs_bulk(
+            project_name, [sample_spec.model_copy(update={'phase_name': name}) for name in phase_names]
+        )
+        page = await db_state_manager.get_roadmap_specs(project_name, 1, 2)
+
+        assert await db_state_manager.list_specs(project_name) == [
+            'zeta-phase',
+            'alpha-phase',
+            'mid-phase',
+            'beta-phase',
+        ]
+        assert [spec.phase_name for spec in page] == ['Alpha Phase', 'Mid Phase']
+
+    @pytest.mark.asyncio
+    async def test_resolve_spec_name_ranks_prefix_matches_first(
+        self, db_state_manager: PostgresStateManager, sample_spec: TechnicalSpec
+    ) -> None:
+        project_name = 'resolve-project'
+        for phase_name in ('Legacy Auth Migration', 'Auth Service'):
+            await db_state_manager.store_spec(project_name, sample_spec.model_copy(update={'phase_name': phase_name}))
+
+        canonical, matches = await db_state_manager.resolve_spec_name(project_name, 'auth')
+
+        assert canonical is None
+        assert matches == ['auth-service', 'legacy-auth-migration']
+
 
 class TestDatabaseLoopOperations:
     @pytest.mark.asyncio
@@ -379,6 +509,374 @@ class TestDatabaseLoopOperations:
             retrieved = await db_state_manager.get_loop(loop.id)
             assert retrieved == loop
 
+    @pytest.mark.asyncio
+    async def test_get_loop_feedback_limit_loads_newest_entries(
+        self, db_state_manager: PostgresStateManager, project_name: str, sample_loop: LoopState
+    ) -> None:
+        for iteration, score in enumerate([60, 70, 80], start=1):
+            sample_loop.add_feedback(
+                CriticFeedback(
+                    loop_id=sample_loop.id,
+                    critic_agent=CriticAgent.SPEC_CRITIC,
+                    iteration=iteration,
+                    overall_score=score,
+                    assessment_summary=f'Pass {iteration}',
+                    detailed_feedback='Details',
+                    key_issues=[],
+                    recommendations=[],
+                )
+            )
+        await db_state_manager.add_loop(sample_loop, project_name)
+
+        full = await db_state_manager.get_loop(sample_loop.id)
+        recent = await db_state_manager.get_loop(sample_loop.id, feedback_limit=2)
+        status = await db_state_manager.get_loop_status(sample_loop.id)
+
+        assert [fb.overall_score for fb in full.feedback_history] == [60, 70, 80]
+        assert [fb.overall_score for fb in recent.feedback_history] == [70, 80]
+        assert status.status == sample_loop.status
+
+    @pytest.mark.asyncio
+    async def test_feedback_aggregates_persisted_on_loop_row(
+        self, db_state_manager: PostgresStateManager, project_name: str, sample_loop: LoopState
+    ) -> None:
+        await db_state_manager.add_loop(sample_loop, project_name)
+        for iteration, (score, issues) in enumerate([(60, ['b', 'a']), (70, ['a', 'a']), (65, ['c', 'b'])], start=1):
+            feedback = CriticFeedback(
+                loop_id=sample_loop.id,
+                critic_agent=CriticAgent.SPEC_CRITIC,
+                iteration=iteration,
+                overall_score=score,
+                assessment_summary=f'Pass {iteration}',
+                detailed_feedback='Details',
+                key_issues=issues,
+                recommendations=[],
+            )
+            sample_loop.add_feedback(feedback)
+            await db_state_manager.append_feedback(sample_loop.id, feedback)
+
+        recent = await db_state_manager.get_loop(sample_loop.id, feedback_limit=1)
+        expected = sample_loop.feedback_stats
+
+        assert len(recent.feedback_history) == 1
+        assert recent.feedback_stats.count == 3
+        assert recent.feedback_stats.issue_counts == expected.issue_counts
+        assert recent.feedback_stats.recurring_issues() == expected.recurring_issues() == ['b', 'a']
+        assert (recent.feedback_stats.mean_improvement, recent.feedback_stats.last_improvement) == (2.5, -5)
+
+    @pytest.mark.asyncio
+    async def test_loop_added_with_history_gets_feedback_aggregates(
+        self, db_state_manager: PostgresStateManager, project_name: str, sample_loop: LoopState
+    ) -> None:
+        for iteration, score in enumerate([50, 80], start=1):
+            sample_loop.add_feedback(
+                CriticFeedback(
+                    loop_id=sample_loop.id,
+                    critic_agent=CriticAgent.SPEC_CRITIC,
+                    iteration=iteration,
+                    overall_score=score,
+                    assessment_summary=f'Pass {iteration}',
+                    detailed_feedback='Details',
+                    key_issues=['x'],
+                    recommendations=[],
+                )
+            )
+        await db_state_manager.add_loop(sample_loop, project_name)
+
+        stats = (await db_state_manager.get_loop(sample_loop.id, feedback_limit=0)).feedback_stats
+
+        assert (stats.count, stats.last_improvement, stats.recurring_issues()) == (2, 30, ['x'])
+
+    @pytest.mark.asyncio
+    async def test_append_feedback_persists_feedback_and_score(
+        self, db_state_manager: PostgresStateManager, project_name: str, sample_loop: LoopState
+    ) -> None:
+        await db_state_manager.add_loop(sample_loop, project_name)
+        feedback = CriticFeedback(
+            loop_id=sample_loop.id,
+            critic_agent=CriticAgent.SPEC_CRITIC,
+            iteration=1,
+            overall_score=75,
+            assessment_summary='First pass',
+            detailed_feedback='Details',
+            key_issues=[],
+            recommendations=[],
+        )
+
+        response = await db_state_manager.append_feedback(sample_loop.id, feedback)
+        stored = await db_state_manager.get_loop(sample_loop.id)
+
+        assert response.status == LoopStatus.IN_PROGRESS
+        assert (stored.current_score, stored.score_history, stored.status) == (75, [75], LoopStatus.IN_PROGRESS)
+        assert [fb.assessment_summary for fb in stored.feedback_history] == ['First pass']
+
+    @pytest.mark.asyncio
+    async def test_append_feedback_raises_error_for_unknown_loop(self, db_state_manager: PostgresStateManager) -> None:
+        feedback = CriticFeedback(
+            loop_id='missing1',
+            critic_agent=CriticAgent.SPEC_CRITIC,
+            iteration=1,
+            overall_score=75,
+            assessment_summary='First pass',
+            detailed_feedback='Details',
+            key_issues=[],
+            recommendations=[],
+        )
+
+        with pytest.raises(LoopNotFoundError):
+            await db_state_manager.append_feedback('missing1', feedback)
+
+    @pytest.mark.asyncio
+    async def test_get_loop_status_raises_error_when_not_found(self, db_state_manager: PostgresStateManager) -> None:
+        with pytest.raises(LoopNotFoundError):
+            await db_state_manager.get_loop_status('missing1')
+
+    @pytest.mark.asyncio
+    async def test_loop_exists(self, db_state_manager: PostgresStateManager, project_name: str) -> None:
+        loop = LoopState(loop_type=LoopType.PLAN)
+        await db_state_manager.add_loop(loop, project_name)
+
+        assert await db_state_manager.loop_exists(loop.id) is True
+        assert await db_state_manager.loop_exists('missing1') is False
+
+    @pytest.mark.asyncio
+    async def test_list_active_loops_filters_and_paginates(
+        self, db_state_manager: PostgresStateManager, project_name: str
+    ) -> None:
+        plan_loop = LoopState(loop_type=LoopType.PLAN)
+        spec_loop = LoopState(loop_type=LoopType.SPEC)
+        await db_state_manager.add_loop(plan_loop, project_name)
+        await db_state_manager.add_loop(spec_loop, project_name)
+        await db_state_manager.add_loop(LoopState(loop_type=LoopType.PLAN), 'other-project')
+
+        first_page = await db_state_manager.list_active_loops(project_name, limit=1)
+        second_page = await db_state_manager.list_active_loops(project_name, after_loop_id=first_page[-1].id)
+        spec_loops = await db_state_manager.list_active_loops(project_name, loop_types=[LoopType.SPEC])
+
+        assert [loop.id for loop in first_page + second_page] == [plan_loop.id, spec_loop.id]
+        assert [loop.id for loop in spec_loops] == [spec_loop.id]
+
+
+class TestLoopRowConversion:
+    def test_timestamp_columns_convert_to_loop_fields(self) -> None:
+        created_at = datetime(2024, 1, 2, 3, 4, 5)
+        row = {
+            'id': 'loop0001',
+            'loop_type': LoopType.SPEC.value,
+            'status': LoopStatus.REFINE.value,
+            'current_score': 70,
+            'score_history': [60, 70],
+            'iteration': 2,
+            'created_at': created_at,
+            'updated_at': created_at,
+        }
+
+        loop = PostgresStateManager._row_to_loop(row)
+
+        assert loop.created_at == created_at.isoformat()
+        assert (loop.score_history, loop.feedback_history) == ([60, 70], [])
+
+
+class TestCacheInvalidationReconnect:
+    @pytest.mark.asyncio
+    async def test_reconnect_resets_cache(self, mocker: MockerFixture) -> None:
+        channel = PostgresCacheInvalidationChannel(reconnect_interval=0)
+        listen = mocker.patch.object(channel, '_listen', mocker.AsyncMock())
+        on_reset = mocker.Mock()
+        await channel.subscribe(mocker.Mock(), on_reset)
+
+        channel._handle_termination(mocker.Mock())
+        assert channel._reconnect_task is not None
+        await channel._reconnect_task
+
+        assert listen.await_count == 2
+        # Once on disconnect, once more after the listener is back
+        assert on_reset.call_count == 2
+
+
+class TestDatabaseBatchLoopDecisions:
+    @pytest.mark.asyncio
+    async def test_batch_decisions_written_together(
+        self, db_state_manager: PostgresStateManager, project_name: str
+    ) -> None:
+        loops = [LoopState(loop_type=LoopType.SPEC), LoopState(loop_type=LoopType.SPEC)]
+        for loop, score in zip(loops, [95, 70]):
+            await db_state_manager.add_loop(loop, project_name)
+            await db_state_manager.append_feedback(
+                loop.id,
+                CriticFeedback(
+                    loop_id=loop.id,
+                    critic_agent=CriticAgent.SPEC_CRITIC,
+                    iteration=1,
+                    overall_score=score,
+                    assessment_summary='Summary',
+                    detailed_feedback='Details',
+                    key_issues=[],
+                    recommendations=[],
+                ),
+            )
+
+        responses = await db_state_manager.decide_loops_next_action([loops[1].id, loops[0].id])
+
+        assert [response.status for response in responses] == [LoopStatus.REFINE, LoopStatus.COMPLETED]
+        refining = await db_state_manager.get_loop(loops[1].id)
+        assert (refining.status, refining.current_score, refining.score_history) == (
+            LoopStatus.REFINE,
+            70,
+            [70, 70],
+        )
+
+    @pytest.mark.asyncio
+    async def test_unknown_loop_leaves_batch_untouched(
+        self, db_state_manager: PostgresStateManager, project_name: str, sample_loop: LoopState
+    ) -> None:
+        await db_state_manager.add_loop(sample_loop, project_name)
+
+        with pytest.raises(LoopNotFoundError, match='missing1'):
+            await db_state_manager.decide_loops_next_action([sample_loop.id, 'missing1'])
+
+        assert (await db_state_manager.get_loop_status(sample_loop.id)).status == LoopStatus.INITIALIZED
+
+
+class TestDatabaseLoopArtifacts:
+    @pytest.mark.asyncio
+    async def test_artifacts_round_trip_in_first_stored_order(
+        self, db_state_manager: PostgresStateManager, project_name: str
+    ) -> None:
+        loops = [LoopState(loop_type=LoopType.BUILD_PLAN) for _ in range(3)]
+        for loop in loops:
+            await db_state_manager.add_loop(loop, project_name)
+            await db_state_manager.store_loop_artifact(loop.id, LoopArtifactKind.BUILD_PLAN, f'plan {loop.id}')
+
+        await db_state_manager.store_loop_artifact(loops[0].id, LoopArtifactKind.BUILD_PLAN, 'revised')
+        listed = await db_state_manager.list_loop_artifacts(LoopArtifactKind.BUILD_PLAN, count=10)
+
+        assert listed == [
+            (loops[0].id, 'revised'),
+            (loops[1].id, f'plan {loops[1].id}'),
+            (loops[2].id, f'plan {loops[2].id}'),
+        ]
+        assert await db_state_manager.delete_loop_artifact(loops[0].id, LoopArtifactKind.BUILD_PLAN) == 'revised'
+        assert await db_state_manager.get_loop_artifact(loops[0].id, LoopArtifactKind.BUILD_PLAN) is None
+
+    @pytest.mark.asyncio
+    async def test_user_feedback_appends_in_order(
+        self, db_state_manager: PostgresStateManager, project_name: str
+    ) -> None:
+        loop = LoopState(loop_type=LoopType.PLAN)
+        await db_state_manager.add_loop(loop, project_name)
+
+        await db_state_manager.append_user_feedback(loop.id, 'first')
+        await db_state_manager.append_user_feedback(loop.id, 'second')
+
+        assert await db_state_manager.get_user_feedback(loop.id) == ['first', 'second']
+
+    @pytest.mark.asyncio
+    async def test_unknown_loop_is_rejected(self, db_state_manager: PostgresStateManager) -> None:
+        with pytest.raises(LoopNotFoundError):
+            await db_state_manager.store_loop_artifact('missing1', LoopArtifactKind.ANALYSIS, 'analysis')
+        with pytest.raises(LoopNotFoundError):
+            await db_state_manager.append_user_feedback('missing1', 'feedback')
+
+    @pytest.mark.asyncio
+    async def test_evicted_loop_takes_its_artifacts(
+        self, db_state_manager: PostgresStateManager, project_name: str
+    ) -> None:
+        evicted = LoopState(loop_type=LoopType.PLAN)
+        await db_state_manager.add_loop(evicted, project_name)
+        await db_state_manager.store_loop_artifact(evicted.id, LoopArtifactKind.ANALYSIS, 'analysis')
+        await db_state_manager.append_user_feedback(evicted.id, 'feedback')
+
+        # db_state_manager keeps the 3 most recent loops
+        for _ in range(3):
+            await db_state_manager.add_loop(LoopState(loop_type=LoopType.PLAN), project_name)
+
+        assert await db_state_manager.get_loop_artifact(evicted.id, LoopArtifactKind.ANALYSIS) is None
+        assert await db_state_manager.get_user_feedback(evicted.id) == []
+
+
+class TestDatabaseLoopAnalytics:
+    @staticmethod
+    async def _assess(db_state_manager: PostgresStateManager, loop: LoopState, scores: list[int]) -> None:
+        for iteration, score in enumerate(scores, start=1):
+            feedback = CriticFeedback(
+                loop_id=loop.id,
+                critic_agent=CriticAgent.SPEC_CRITIC,
+                iteration=iteration,
+                overall_score=score,
+                assessment_summary='Summary',
+                detailed_feedback='Details',
+                key_issues=[],
+                recommendations=[],
+            )
+            await db_state_manager.append_feedback(loop.id, feedback)
+
+    @pytest.mark.asyncio
+    async def test_aggregates_match_in_memory_semantics(
+        self, db_state_manager: PostgresStateManager, project_name: str
+    ) -> None:
+        completed, stagnated = LoopState(loop_type=LoopType.SPEC), LoopState(loop_type=LoopType.SPEC)
+        other_project = LoopState(loop_type=LoopType.PLAN)
+        await db_state_manager.add_loop(completed, project_name)
+        await db_state_manager.add_loop(stagnated, project_name)
+        await db_state_manager.add_loop(other_project, 'other-project')
+        await self._assess(db_state_manager, completed, [70, 80, 92])
+        await db_state_manager.decide_loop_next_action(completed.id)
+        await self._assess(db_state_manager, stagnated, [60, 62, 63])
+        await self._assess(db_state_manager, other_project, [95])
+
+        [spec] = await db_state_manager.get_loop_analytics(project_name)
+        everything = await db_state_manager.get_loop_analytics()
+
+        assert (spec.loop_count, spec.completed_count) == (2, 1)
+        assert (spec.mean_iterations_to_completion, spec.median_iterations_to_completion) == (3.0, 3.0)
+        assert spec.stagnation_rate == 0.5
+        assert spec.score_distribution == ScoreDistribution(
+            minimum=63, p25=70.25, median=77.5, p75=84.75, maximum=92, mean=77.5
+        )
+        assert [entry.loop_type for entry in everything] == [LoopType.PLAN, LoopType.SPEC]
+        assert everything[0].mean_iterations_to_completion is None
+
+    @pytest.mark.asyncio
+    async def test_evicted_loops_still_counted(self, db_state_manager: PostgresStateManager, project_name: str) -> None:
+        stagnated = LoopState(loop_type=LoopType.SPEC)
+        await db_state_manager.add_loop(stagnated, project_name)
+        await self._assess(db_state_manager, stagnated, [60, 62, 63])
+
+        # The fixture's manager keeps 3 loops, so the fourth evicts the first
+        for _ in range(3):
+            await db_state_manager.add_loop(LoopState(loop_type=LoopType.SPEC), project_name)
+        [spec] = await db_state_manager.get_loop_analytics(project_name)
+
+        assert not await db_state_manager.loop_exists(stagnated.id)
+        assert (spec.loop_count, spec.stagnation_rate) == (4, 0.25)
+        assert spec.score_distribution is not None and spec.score_distribution.minimum == 63
+
+
+class TestDatabaseStateCache:
+    @pytest.mark.asyncio
+    async def test_write_in_one_process_invalidates_another(
+        self, db_state_manager: PostgresStateManager, project_name: str
+    ) -> None:
+        writer = CachedStateManager(db_state_manager, channel=PostgresCacheInvalidationChannel())
+        reader = CachedStateManager(db_state_manager, channel=PostgresCacheInvalidationChannel())
+        await writer.start()
+        await reader.start()
+        try:
+            await writer.store_spec(project_name, TechnicalSpec(phase_name='cached-spec', architecture='v1'))
+            assert (await reader.get_spec(project_name, 'cached-spec')).architecture == 'v1'
+
+            await writer.store_spec(project_name, TechnicalSpec(phase_name='cached-spec', architecture='v2'))
+            for _ in range(50):
+                if reader.cache_stats()['entries'] == 0:
+                    break
+                await asyncio.sleep(0.02)
+
+            assert (await reader.get_spec(project_name, 'cached-spec')).architecture == 'v2'
+        finally:
+            await writer.close()
+            await reader.close()
+
 
 class TestDatabaseProjectPlanOperations:
     @pytest.mark.asyncio
@@ -0,0 +1,174 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from asyncpg import InvalidCachedStatementError
+from src.utils.prepared_statements import StatementRegistry
+from src.utils.state_manager import statements
+
+
+def _connection(pid: int = 101) -> MagicMock:
+    conn = MagicMock()
+    conn.get_server_pid.return_value = pid
+    conn.is_in_transaction.return_value = False
+    conn.fetchrow = AsyncMock(return_value={'id': 'raw'})
+    conn.execute = AsyncMock(return_value='DELETE 1')
+    conn.prepare = AsyncMock(side_effect=lambda query: _prepared_statement(query))
+    return conn
+
+
+def _prepared_statement(query: str) -> MagicMock:
+    prepared = MagicMock()
+    prepared.query = query
+    prepared.fetchrow = AsyncMock(return_value={'id': 'prepared'})
+    prepared.fetch = AsyncMock(return_value=[])
+    prepared.fetchmany = AsyncMock(return_value=[{'version': 1}, {'version': 2}])
+    prepared.get_statusmsg.return_value = 'DELETE 1'
+    return prepared
+
+
+class TestStatementRegistry:
+    @pytest.mark.asyncio
+    async def test_statements_prepared_lazily_once_per_connection(self) -> None:
+        registry = StatementRegistry()
+        get_loop = registry.register('get_loop', 'SELECT 1 WHERE $1')
+        registry.register('delete_loop', 'DELETE WHERE $1')
+        conn = _connection()
+
+        await registry.prepare_connection(conn)
+        conn.prepare.assert_not_awaited()
+        first = await get_loop.fetchrow(conn, 'a')
+        second = await get_loop.fetchrow(conn, 'b')
+
+        assert first == second == {'id': 'prepared'}
+        conn.prepare.assert_awaited_once_with('SELECT 1 WHERE $1')
+        conn.fetchrow.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_invalidated_statement_reprepared_and_retried_once(self) -> None:
+        registry = StatementRegistry()
+        get_loop = registry.register('get_loop', 'SELECT 1 WHERE $1')
+        conn = _connection()
+        await registry.prepare_connection(conn)
+        await get_loop.fetchrow(conn, 'a')
+        stale = registry._prepared[101]['get_loop']
+        stale.fetchrow.side_effect = InvalidCachedStatementError('cached statement plan is invalid')
+
+        assert await get_loop.fetchrow(conn, 'b') == {'id': 'prepared'}
+        assert conn.prepare.await_count == 2
+        assert registry._prepared[101]['get_loop'] is not stale
+        assert registry.stats()['get_loop']['calls'] == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidated_statement_in_transaction_raises_and_reprepares_next_call(self) -> None:
+        registry = StatementRegistry()
+        get_loop = registry.register('get_loop', 'SELECT 1 WHERE $1')
+        conn = _connection()
+        await registry.prepare_connection(conn)
+        await get_loop.fetchrow(conn, 'a')
+        registry._prepared[101]['get_loop'].fetchrow.side_effect = InvalidCachedStatementError('plan is invalid')
+        conn.is_in_transaction.return_value = True
+
+        with pytest.raises(InvalidCachedStatementError):
+            await get_loop.fetchrow(conn, 'b')
+        assert conn.prepare.await_count == 1
+
+        assert await get_loop.fetchrow(conn, 'c') == {'id': 'prepared'}
+        assert conn.prepare.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_returns_prepared_status(self) -> None:
+        registry = StatementRegistry()
+        delete_loop = registry.register('delete_loop', 'DELETE WHERE $1')
+        conn = _connection()
+        await registry.prepare_connection(conn)
+
+        assert await delete_loop.execute(conn, 'a') == 'DELETE 1'
+        conn.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_fetchmany_returns_a_row_per_argument_tuple(self) -> None:
+        registry = StatementRegistry()
+        upsert = registry.register('upsert_spec', 'INSERT $1 RETURNING version')
+        conn = _connection()
+        await registry.prepare_connection(conn)
+
+        rows = await upsert.fetchmany(conn, [('a',), ('b',)])
+
+        assert [row['version'] for row in rows] == [1, 2]
+        assert 'upsert_spec' in registry.stats()
+
+    @pytest.mark.asyncio
+    async def test_pgbouncer_mode_runs_query_text(self) -> None:
+        registry = StatementRegistry(prepare=False)
+        get_loop = registry.register('get_loop', 'SELECT 1 WHERE $1')
+        conn = _connection()
+
+        await registry.prepare_connection(conn)
+        result = await get_loop.fetchrow(conn, 'a')
+
+        assert result == {'id': 'raw'}
+        conn.prepare.assert_not_awaited()
+        conn.fetchrow.assert_awaited_once_with('SELECT 1 WHERE $1', 'a')
+
+    @pytest.mark.asyncio
+    async def test_unprepared_connection_falls_back_to_query_text(self) -> None:
+        registry = StatementRegistry()
+        get_loop = registry.register('get_loop', 'SELECT 1 WHERE $1')
+        await registry.prepare_connection(_connection(pid=1))
+        other = _connection(pid=2)
+
+        assert await get_loop.fetchrow(other, 'a') == {'id': 'raw'}
+
+    @pytest.mark.asyncio
+    async def test_terminated_connection_is_forgotten(self) -> None:
+        registry = StatementRegistry()
+        get_loop = registry.register('get_loop', 'SELECT 1 WHERE $1')
+        conn = _connection()
+        await registry.prepare_connection(conn)
+
+        on_terminate = conn.add_termination_listener.call_args.args[0]
+        on_terminate(conn)
+
+        assert await get_loop.fetchrow(conn, 'a') == {'id': 'raw'}
+
+    @pytest.mark.asyncio
+    async def test_timings_recorded_per_statement(self) -> None:
+        registry = StatementRegistry(prepare=False)
+        get_loop = registry.register('get_loop', 'SELECT 1 WHERE $1')
+        conn = _connection()
+
+        await get_loop.fetchrow(conn, 'a')
+        await get_loop.fetchrow(conn, 'b')
+
+        stats = registry.stats()
+        assert stats['get_loop']['calls'] == 2
+        assert stats['get_loop']['max_ms'] <= stats['get_loop']['total_ms']
+
+        registry.reset_stats()
+        assert registry.stats() == {}
+
+    @pytest.mark.asyncio
+    async def test_timing_recorded_when_statement_fails(self) -> None:
+        registry = StatementRegistry(prepare=False)
+        get_loop = registry.register('get_loop', 'SELECT 1 WHERE $1')
+        conn = _connection()
+        conn.fetchrow.side_effect = RuntimeError('connection lost')
+
+        with pytest.raises(RuntimeError):
+            await get_loop.fetchrow(conn, 'a')
+
+        assert registry.stats()['get_loop']['calls'] == 1
+
+    def test_duplicate_names_rejected(self) -> None:
+        registry = StatementRegistry()
+        registry.register('get_loop', 'SELECT 1')
+
+        with pytest.raises(ValueError, match='already registered'):
+            registry.register('get_loop', 'SELECT 2')
+
+    def test_postgres_catalog_registered(self) -> None:
+        registry = statements.statement_registry
+
+        assert 'upsert_spec' in registry
+        assert 'upsert_project_plan' in registry
+        assert statements.UPSERT_PROJECT_PLAN.query.count('$') >= 32
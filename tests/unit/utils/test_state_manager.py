@@ -1,23 +1,44 @@
+import logging
+
 import pytest
-from src.models.enums import ProjectStatus, RoadmapStatus, SpecStatus
+from src.models.enums import CriticAgent, ProjectStatus, RoadmapStatus, SpecStatus
+from src.models.feedback import CriticFeedback
 from src.models.project_plan import ProjectPlan
 from src.models.roadmap import Roadmap
 from src.models.spec import TechnicalSpec
-from src.utils.enums import LoopType
+from src.utils.enums import LoopArtifactKind, LoopStatus, LoopType
 from src.utils.errors import (
     LoopAlreadyExistsError,
     LoopNotFoundError,
     ProjectPlanNotFoundError,
     RoadmapNotFoundError,
     SpecNotFoundError,
+    SpecVersionConflictError,
 )
-from src.utils.loop_state import LoopState
+from src.utils.loop_state import LoopState, ScoreDistribution
 from src.utils.state_manager import InMemoryStateManager, Queue
+from src.utils.state_manager.in_memory import SpecNameIndex
+from src.utils.state_manager.tracing import SnapshotSampler
 
 
 # Import feedback module to ensure LoopState model is fully rebuilt with forward references
 
 
+async def _assess(state_manager: InMemoryStateManager, loop: LoopState, scores: list[int]) -> None:
+    for iteration, score in enumerate(scores, start=1):
+        feedback = CriticFeedback(
+            loop_id=loop.id,
+            critic_agent=CriticAgent.SPEC_CRITIC,
+            iteration=iteration,
+            overall_score=score,
+            assessment_summary='Summary',
+            detailed_feedback='Details',
+            key_issues=[],
+            recommendations=[],
+        )
+        await state_manager.append_feedback(loop.id, feedback)
+
+
 class TestQueue:
     def test_queue_initialization(self) -> None:
         queue = Queue[str](maxlen=3)
@@ -438,6 +459,208 @@ class TestSpecOperations(TestInMemoryStateManager):
         for name in expected_remaining:
             assert name in remaining_names
 
+    @pytest.mark.asyncio
+    async def test_store_specs_bulk_matches_sequential_store(self, state_manager: InMemoryStateManager) -> None:
+        await state_manager.store_spec('test-project', TechnicalSpec(phase_name='Auth', objectives='Original'))
+
+        names = await state_manager.store_specs_bulk(
+            'test-project',
+            [
+                TechnicalSpec(phase_name='Auth', objectives='Changed'),
+                TechnicalSpec(phase_name='Billing'),
+                TechnicalSpec(phase_name='Auth', architecture='Services'),
+            ],
+        )
+        auth = await state_manager.get_spec('test-project', 'auth')
+
+        assert names == ['Auth', 'Billing', 'Auth']
+        assert (auth.version, auth.objectives, auth.architecture) == (3, 'Original', 'Services')
+        assert sorted(await state_manager.list_specs('test-project')) == ['auth', 'billing']
+
+
+class TestSpecNameIndex:
+    @pytest.fixture
+    def index(self) -> SpecNameIndex:
+        index = SpecNameIndex()
+        for name in ('phase-1-foundation', 'phase-2-api', 'phase-10-api-hardening', 'auth'):
+            index.add(name)
+        return index
+
+    @pytest.mark.parametrize(
+        ('partial', 'expected'),
+        [
+            ('', {'phase-1-foundation', 'phase-2-api', 'phase-10-api-hardening', 'auth'}),
+            ('a', {'phase-1-foundation', 'phase-2-api', 'phase-10-api-hardening', 'auth'}),
+            ('api', {'phase-2-api', 'phase-10-api-hardening'}),
+            ('api-h', {'phase-10-api-hardening'}),
+            ('phase-1', {'phase-1-foundation', 'phase-10-api-hardening'}),
+            ('apiz', set()),
+        ],
+    )
+    def test_containing_matches_substring_semantics(self, index: SpecNameIndex, partial: str, expected: set) -> None:
+        assert index.containing(partial) == expected
+
+    def test_remove_drops_name_from_every_gram(self, index: SpecNameIndex) -> None:
+        index.remove('phase-2-api')
+
+        assert index.containing('api') == {'phase-10-api-hardening'}
+        assert 'phase-2-api' not in index
+        assert len(index) == 3
+
+
+class TestSpecNameResolution(TestInMemoryStateManager):
+    @pytest.fixture
+    async def named_specs(self, state_manager: InMemoryStateManager) -> None:
+        for name in ('phase-10-api-hardening', 'phase-2-api', 'api-gateway'):
+            await state_manager.store_spec('test-project', TechnicalSpec(phase_name=name))
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures('named_specs')
+    async def test_candidates_are_ranked(self, state_manager: InMemoryStateManager) -> None:
+        canonical, matches = await state_manager.resolve_spec_name('test-project', 'API')
+
+        assert canonical is None
+        assert matches == ['api-gateway', 'phase-2-api', 'phase-10-api-hardening']
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures('named_specs')
+    async def test_unique_and_exact_matches_resolve(self, state_manager: InMemoryStateManager) -> None:
+        assert await state_manager.resolve_spec_name('test-project', 'gateway') == ('api-gateway', ['api-gateway'])
+        assert await state_manager.resolve_spec_name('test-project', 'Phase 2 API') == ('phase-2-api', ['phase-2-api'])
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures('named_specs')
+    async def test_deleted_specs_stop_matching(self, state_manager: InMemoryStateManager) -> None:
+        await state_manager.delete_spec('test-project', 'api-gateway')
+
+        assert await state_manager.resolve_spec_name('test-project', 'gateway') == (None, [])
+
+
+class TestActiveLoopListing(TestInMemoryStateManager):
+    @pytest.fixture
+    def state_manager(self) -> InMemoryStateManager:
+        return InMemoryStateManager(max_history_size=10)
+
+    @pytest.fixture
+    async def project_loops(self, state_manager: InMemoryStateManager) -> list[LoopState]:
+        loops = [LoopState(loop_type=loop_type) for loop_type in (LoopType.PLAN, LoopType.SPEC, LoopType.SPEC)]
+        for loop in loops:
+            await state_manager.add_loop(loop, 'test-project')
+        await state_manager.add_loop(LoopState(loop_type=LoopType.SPEC), 'other-project')
+        loops[1].status = LoopStatus.REFINE
+        return loops
+
+    @pytest.mark.asyncio
+    async def test_lists_only_project_loops_in_creation_order(
+        self, state_manager: InMemoryStateManager, project_loops: list[LoopState]
+    ) -> None:
+        result = await state_manager.list_active_loops('test-project')
+
+        assert [loop.id for loop in result] == [loop.id for loop in project_loops]
+        assert await state_manager.list_active_loops('missing-project') == []
+
+    @pytest.mark.asyncio
+    async def test_status_and_type_filters(
+        self, state_manager: InMemoryStateManager, project_loops: list[LoopState]
+    ) -> None:
+        refining = await state_manager.list_active_loops('test-project', statuses=[LoopStatus.REFINE])
+        spec_loops = await state_manager.list_active_loops('test-project', loop_types=[LoopType.SPEC])
+
+        assert [loop.id for loop in refining] == [project_loops[1].id]
+        assert [loop.id for loop in spec_loops] == [project_loops[1].id, project_loops[2].id]
+
+    @pytest.mark.asyncio
+    async def test_cursor_pagination(self, state_manager: InMemoryStateManager, project_loops: list[LoopState]) -> None:
+        first_page = await state_manager.list_active_loops('test-project', limit=2)
+        second_page = await state_manager.list_active_loops('test-project', after_loop_id=first_page[-1].id, limit=2)
+
+        assert [loop.id for loop in first_page + second_page] == [loop.id for loop in project_loops]
+        assert await state_manager.list_active_loops('test-project', after_loop_id='unknown-loop') == []
+
+    @pytest.mark.asyncio
+    async def test_evicted_loops_leave_the_index(self) -> None:
+        state_manager = InMemoryStateManager(max_history_size=2)
+        loops = [LoopState(loop_type=LoopType.PLAN) for _ in range(3)]
+        for loop in loops:
+            await state_manager.add_loop(loop, 'test-project')
+
+        result = await state_manager.list_active_loops('test-project')
+
+        assert [loop.id for loop in result] == [loops[1].id, loops[2].id]
+
+
+class TestSpecVersionHistory(TestInMemoryStateManager):
+    @pytest.mark.asyncio
+    async def test_update_with_stale_version_is_rejected(self, state_manager: InMemoryStateManager) -> None:
+        await state_manager.store_spec('test-project', TechnicalSpec(phase_name='versioned-spec', architecture='v1'))
+        await state_manager.update_spec(
+            'test-project', 'versioned-spec', TechnicalSpec(phase_name='versioned-spec', architecture='v2'), 1
+        )
+
+        with pytest.raises(SpecVersionConflictError, match='at version 2, expected 1'):
+            await state_manager.update_spec(
+                'test-project', 'versioned-spec', TechnicalSpec(phase_name='versioned-spec', architecture='v3'), 1
+            )
+        current = await state_manager.get_spec('test-project', 'versioned-spec')
+        assert (current.architecture, current.version) == ('v2', 2)
+
+    @pytest.mark.asyncio
+    async def test_new_version_shares_unchanged_field_values(self, state_manager: InMemoryStateManager) -> None:
+        original = TechnicalSpec(phase_name='versioned-spec', objectives='Keep me', architecture='Monolith')
+        await state_manager.store_spec('test-project', original)
+
+        incoming = TechnicalSpec(
+            phase_name='versioned-spec',
+            objectives='Attempted change',
+            architecture='Services',
+            additional_sections={'Data Models': 'User'},
+        )
+        await state_manager.store_spec('test-project', incoming)
+        current = await state_manager.get_spec('test-project', 'versioned-spec')
+
+        assert (current.iteration, current.version) == (1, 2)
+        assert current.objectives is original.objectives
+        assert current.architecture is incoming.architecture
+        assert current.additional_sections == {'Data Models': 'User'}
+        assert current.additional_sections is not incoming.additional_sections
+
+    @pytest.mark.asyncio
+    async def test_get_spec_version_returns_prior_versions(self, state_manager: InMemoryStateManager) -> None:
+        await state_manager.store_spec('test-project', TechnicalSpec(phase_name='versioned-spec', architecture='v1'))
+        await state_manager.update_spec(
+            'test-project', 'versioned-spec', TechnicalSpec(phase_name='versioned-spec', architecture='v2')
+        )
+        await state_manager.store_spec('test-project', TechnicalSpec(phase_name='versioned-spec', architecture='v3'))
+
+        for version, architecture in [(1, 'v1'), (2, 'v2'), (3, 'v3')]:
+            spec = await state_manager.get_spec_version('test-project', 'versioned-spec', version)
+            assert spec.architecture == architecture
+
+        with pytest.raises(SpecNotFoundError, match='version 4'):
+            await state_manager.get_spec_version('test-project', 'versioned-spec', 4)
+
+    @pytest.mark.asyncio
+    async def test_history_is_bounded(self) -> None:
+        state_manager = InMemoryStateManager(max_spec_versions=2)
+        for i in range(5):
+            await state_manager.store_spec('test-project', TechnicalSpec(phase_name='versioned-spec', scope=f's{i}'))
+
+        assert len(state_manager._spec_history['test-project']['versioned-spec']) == 2
+        assert (await state_manager.get_spec_version('test-project', 'versioned-spec', 3)).version == 3
+        with pytest.raises(SpecNotFoundError):
+            await state_manager.get_spec_version('test-project', 'versioned-spec', 2)
+
+    @pytest.mark.asyncio
+    async def test_delete_spec_drops_history(self, state_manager: InMemoryStateManager) -> None:
+        for _ in range(2):
+            await state_manager.store_spec('test-project', TechnicalSpec(phase_name='versioned-spec'))
+
+        await state_manager.delete_spec('test-project', 'versioned-spec')
+        await state_manager.store_spec('test-project', TechnicalSpec(phase_name='versioned-spec'))
+
+        with pytest.raises(SpecNotFoundError):
+            await state_manager.get_spec_version('test-project', 'versioned-spec', 2)
+
 
 class TestLoopOperations(TestInMemoryStateManager):
     @pytest.mark.asyncio
@@ -466,6 +689,15 @@ class TestLoopOperations(TestInMemoryStateManager):
         with pytest.raises(LoopNotFoundError):
             await state_manager.get_loop('non-existent-loop-id')
 
+    @pytest.mark.asyncio
+    async def test_loop_exists(
+        self, state_manager: InMemoryStateManager, project_name: str, sample_loop: LoopState
+    ) -> None:
+        await state_manager.add_loop(sample_loop, project_name)
+
+        assert await state_manager.loop_exists(sample_loop.id) is True
+        assert await state_manager.loop_exists('non-existent-loop-id') is False
+
     @pytest.mark.asyncio
     async def test_loop_history_management_respects_max_size(
         self, state_manager: InMemoryStateManager, project_name: str
@@ -491,6 +723,189 @@ class TestLoopOperations(TestInMemoryStateManager):
             assert retrieved == loop
 
 
+class TestBatchLoopDecisions(TestInMemoryStateManager):
+    @pytest.fixture
+    async def assessed_loops(self, state_manager: InMemoryStateManager, project_name: str) -> list[LoopState]:
+        loops = [LoopState(loop_type=LoopType.SPEC), LoopState(loop_type=LoopType.SPEC)]
+        for loop, score in zip(loops, [95, 70]):
+            await state_manager.add_loop(loop, project_name)
+            await _assess(state_manager, loop, [score])
+        return loops
+
+    @pytest.mark.asyncio
+    async def test_decides_each_loop_once_in_given_order(
+        self, state_manager: InMemoryStateManager, assessed_loops: list[LoopState]
+    ) -> None:
+        completed, refining = assessed_loops
+
+        responses = await state_manager.decide_loops_next_action([refining.id, completed.id, refining.id])
+
+        assert [(response.id, response.status) for response in responses] == [
+            (refining.id, LoopStatus.REFINE),
+            (completed.id, LoopStatus.COMPLETED),
+        ]
+        assert refining.score_history == [70, 70]
+
+    @pytest.mark.asyncio
+    async def test_unknown_loop_leaves_batch_untouched(
+        self, state_manager: InMemoryStateManager, assessed_loops: list[LoopState]
+    ) -> None:
+        with pytest.raises(LoopNotFoundError):
+            await state_manager.decide_loops_next_action([assessed_loops[0].id, 'missing1'])
+
+        assert assessed_loops[0].status == LoopStatus.IN_PROGRESS
+
+    @pytest.mark.asyncio
+    async def test_loop_without_feedback_leaves_batch_untouched(
+        self, state_manager: InMemoryStateManager, project_name: str, assessed_loops: list[LoopState]
+    ) -> None:
+        unassessed = LoopState(loop_type=LoopType.SPEC)
+        await state_manager.add_loop(unassessed, project_name)
+
+        with pytest.raises(ValueError, match='No feedback available'):
+            await state_manager.decide_loops_next_action([assessed_loops[0].id, unassessed.id])
+
+        assert assessed_loops[0].status == LoopStatus.IN_PROGRESS
+
+
+class TestLoopArtifacts(TestInMemoryStateManager):
+    @pytest.mark.asyncio
+    async def test_store_replaces_and_keeps_listing_order(
+        self, state_manager: InMemoryStateManager, project_name: str
+    ) -> None:
+        loops = [LoopState(loop_type=LoopType.BUILD_PLAN) for _ in range(3)]
+        for loop in loops:
+            await state_manager.add_loop(loop, project_name)
+            await state_manager.store_loop_artifact(loop.id, LoopArtifactKind.BUILD_PLAN, f'plan {loop.id}')
+
+        await state_manager.store_loop_artifact(loops[0].id, LoopArtifactKind.BUILD_PLAN, 'revised')
+
+        assert await state_manager.get_loop_artifact(loops[0].id, LoopArtifactKind.BUILD_PLAN) == 'revised'
+        assert await state_manager.get_loop_artifact(loops[0].id, LoopArtifactKind.ANALYSIS) is None
+        listed = await state_manager.list_loop_artifacts(LoopArtifactKind.BUILD_PLAN, count=2)
+        assert [loop_id for loop_id, _ in listed] == [loops[1].id, loops[2].id]
+
+    @pytest.mark.asyncio
+    async def test_delete_returns_stored_content(
+        self, state_manager: InMemoryStateManager, project_name: str, sample_loop: LoopState
+    ) -> None:
+        await state_manager.add_loop(sample_loop, project_name)
+        await state_manager.store_loop_artifact(sample_loop.id, LoopArtifactKind.ANALYSIS, 'analysis')
+
+        assert await state_manager.delete_loop_artifact(sample_loop.id, LoopArtifactKind.ANALYSIS) == 'analysis'
+        assert await state_manager.delete_loop_artifact(sample_loop.id, LoopArtifactKind.ANALYSIS) is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_loop_is_rejected(self, state_manager: InMemoryStateManager) -> None:
+        with pytest.raises(LoopNotFoundError):
+            await state_manager.store_loop_artifact('missing1', LoopArtifactKind.ANALYSIS, 'analysis')
+        with pytest.raises(LoopNotFoundError):
+            await state_manager.append_user_feedback('missing1', 'feedback')
+
+    @pytest.mark.asyncio
+    async def test_evicted_loop_takes_its_artifacts(
+        self, state_manager: InMemoryStateManager, project_name: str
+    ) -> None:
+        evicted = LoopState(loop_type=LoopType.PLAN)
+        await state_manager.add_loop(evicted, project_name)
+        await state_manager.store_loop_artifact(evicted.id, LoopArtifactKind.COMPLETION_REPORT, 'report')
+        await state_manager.append_user_feedback(evicted.id, 'feedback')
+        await state_manager.store_objective_feedback(evicted.id, 'objective')
+
+        # State manager initialized with max_history_size=3
+        for _ in range(3):
+            await state_manager.add_loop(LoopState(loop_type=LoopType.PLAN), project_name)
+
+        assert await state_manager.get_loop_artifact(evicted.id, LoopArtifactKind.COMPLETION_REPORT) is None
+        assert await state_manager.list_loop_artifacts(LoopArtifactKind.COMPLETION_REPORT, count=10) == []
+        assert await state_manager.get_user_feedback(evicted.id) == []
+        assert evicted.id not in state_manager._objective_feedback
+
+
+class TestLoopAnalytics(TestInMemoryStateManager):
+    @pytest.fixture
+    def state_manager(self) -> InMemoryStateManager:
+        return InMemoryStateManager(max_history_size=10)
+
+    @pytest.fixture
+    async def assessed_loops(self, state_manager: InMemoryStateManager, project_name: str) -> None:
+        completed, stagnated, unassessed = (LoopState(loop_type=LoopType.SPEC) for _ in range(3))
+        for loop in (completed, stagnated, unassessed):
+            await state_manager.add_loop(loop, project_name)
+        await _assess(state_manager, completed, [70, 80, 92])
+        await state_manager.decide_loop_next_action(completed.id)
+        # Spec improvement threshold is 5
+        await _assess(state_manager, stagnated, [60, 62, 63])
+
+        other_project = LoopState(loop_type=LoopType.PLAN)
+        await state_manager.add_loop(other_project, 'other-project')
+        await _assess(state_manager, other_project, [95])
+        await state_manager.decide_loop_next_action(other_project.id)
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures('assessed_loops')
+    async def test_aggregates_per_loop_type(self, state_manager: InMemoryStateManager, project_name: str) -> None:
+        [spec] = await state_manager.get_loop_analytics(project_name)
+
+        assert spec.loop_type == LoopType.SPEC
+        assert (spec.loop_count, spec.completed_count) == (3, 1)
+        assert (spec.mean_iterations_to_completion, spec.median_iterations_to_completion) == (3.0, 3)
+        assert spec.stagnation_rate == pytest.approx(1 / 3)
+        assert spec.score_distribution == ScoreDistribution(
+            minimum=63, p25=70.25, median=77.5, p75=84.75, maximum=92, mean=77.5
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures('assessed_loops')
+    async def test_spans_all_projects_by_default(self, state_manager: InMemoryStateManager) -> None:
+        analytics = await state_manager.get_loop_analytics()
+
+        assert [entry.loop_type for entry in analytics] == [LoopType.PLAN, LoopType.SPEC]
+        assert analytics[0].score_distribution == ScoreDistribution(
+            minimum=95, p25=95, median=95, p75=95, maximum=95, mean=95
+        )
+
+    @pytest.mark.asyncio
+    async def test_no_loops_yields_no_rows(self, state_manager: InMemoryStateManager) -> None:
+        assert await state_manager.get_loop_analytics('missing-project') == []
+
+    @pytest.mark.asyncio
+    async def test_evicted_loops_still_counted(self, project_name: str) -> None:
+        state_manager = InMemoryStateManager(max_history_size=2)
+        completed = LoopState(loop_type=LoopType.SPEC)
+        await state_manager.add_loop(completed, project_name)
+        await _assess(state_manager, completed, [70, 80, 92])
+        await state_manager.decide_loop_next_action(completed.id)
+
+        for _ in range(2):
+            await state_manager.add_loop(LoopState(loop_type=LoopType.SPEC), project_name)
+        [spec] = await state_manager.get_loop_analytics(project_name)
+
+        assert not await state_manager.loop_exists(completed.id)
+        assert (spec.loop_count, spec.completed_count, spec.mean_iterations_to_completion) == (3, 1, 3.0)
+        assert spec.score_distribution is not None and spec.score_distribution.maximum == 92
+        assert [entry.loop_count for entry in await state_manager.get_loop_analytics()] == [3]
+
+    @pytest.mark.asyncio
+    async def test_evicted_loops_kept_as_bounded_totals(self, project_name: str) -> None:
+        state_manager = InMemoryStateManager(max_history_size=1)
+        for _ in range(50):
+            loop = LoopState(loop_type=LoopType.SPEC)
+            await state_manager.add_loop(loop, project_name)
+            await _assess(state_manager, loop, [92])
+            await state_manager.decide_loop_next_action(loop.id)
+        await state_manager.add_loop(LoopState(loop_type=LoopType.SPEC), project_name)
+        [spec] = await state_manager.get_loop_analytics(project_name)
+
+        totals = state_manager._evicted_loop_totals[project_name][LoopType.SPEC]
+        assert (totals.loop_count, dict(totals.latest_scores), dict(totals.completion_iterations)) == (
+            50,
+            {92: 50},
+            {1: 50},
+        )
+        assert (spec.loop_count, spec.completed_count, spec.median_iterations_to_completion) == (51, 50, 1)
+
+
 class TestProjectPlanOperations(TestInMemoryStateManager):
     @pytest.mark.asyncio
     async def test_store_project_plan_returns_project_name(self, state_manager: InMemoryStateManager) -> None:
@@ -1013,3 +1428,59 @@ class TestCrossOperationIntegration(TestInMemoryStateManager):
         for loop in loops[1:]:
             retrieved = await custom_state_manager.get_loop(loop.id)
             assert retrieved == loop
+
+
+class TestStateSnapshotSampling:
+    @staticmethod
+    def _snapshot_records(caplog: pytest.LogCaptureFixture) -> list[logging.LogRecord]:
+        return [record for record in caplog.records if 'State snapshot' in record.getMessage()]
+
+    @pytest.mark.asyncio
+    async def test_snapshots_disabled_by_default(self, caplog: pytest.LogCaptureFixture) -> None:
+        state_manager = InMemoryStateManager()
+        await state_manager.store_roadmap('test-project', Roadmap(project_name='Snapshot Roadmap'))
+
+        with caplog.at_level(logging.DEBUG, logger='state_manager'):
+            for _ in range(5):
+                await state_manager.get_roadmap('test-project')
+
+        assert self._snapshot_records(caplog) == []
+
+    @pytest.mark.asyncio
+    async def test_every_nth_call_is_snapshotted(self, caplog: pytest.LogCaptureFixture) -> None:
+        state_manager = InMemoryStateManager(snapshot_every=2)
+        await state_manager.store_roadmap('test-project', Roadmap(project_name='Snapshot Roadmap'))
+
+        with caplog.at_level(logging.DEBUG, logger='state_manager'):
+            for _ in range(4):
+                await state_manager.get_roadmap('test-project')
+
+        stages = [record.args[1] for record in self._snapshot_records(caplog) if record.args]
+        assert stages == ['ENTRY', 'EXIT', 'ENTRY', 'EXIT']
+
+    @pytest.mark.asyncio
+    async def test_sampling_skipped_when_debug_disabled(self, caplog: pytest.LogCaptureFixture) -> None:
+        state_manager = InMemoryStateManager(snapshot_every=1)
+
+        with caplog.at_level(logging.INFO, logger='state_manager'):
+            await state_manager.list_specs('test-project')
+
+        assert self._snapshot_records(caplog) == []
+        assert state_manager._snapshot_sampler._calls == 0
+
+    @pytest.mark.asyncio
+    async def test_error_snapshot_logged_at_error_level(self, caplog: pytest.LogCaptureFixture) -> None:
+        state_manager = InMemoryStateManager(snapshot_on_error=True)
+
+        with caplog.at_level(logging.INFO, logger='state_manager'):
+            with pytest.raises(RoadmapNotFoundError):
+                await state_manager.get_roadmap('missing-project')
+
+        records = self._snapshot_records(caplog)
+        assert len(records) == 1
+        assert records[0].levelno == logging.ERROR
+        assert 'get_roadmap [ERROR]' in records[0].getMessage()
+
+    def test_negative_interval_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            SnapshotSampler(every=-1)